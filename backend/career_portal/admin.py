@@ -20,5 +20,5 @@ class JobApplicationAdmin(admin.ModelAdmin):
     list_display = ('id', 'job_posting', 'applicant', 'status', 'skills', 'applied_at', 'updated_at')
     list_filter = ('status', 'applied_at', 'updated_at')
     search_fields = ('job_posting__title', 'applicant__username', 'applicant__email', 'skills')
-    raw_id_fields = ('job_posting', 'applicant')
+    raw_id_fields = ('job_posting', 'applicant', 'parsed_resume')
     date_hierarchy = 'applied_at'
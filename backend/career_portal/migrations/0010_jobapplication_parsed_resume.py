@@ -0,0 +1,18 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resume_parser', '0002_parsedresume'),
+        ('career_portal', '0009_add_employer_user_type'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobapplication',
+            name='parsed_resume',
+            field=models.ForeignKey(blank=True, help_text='Structured data extracted from the resume', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='applications', to='resume_parser.parsedresume'),
+        ),
+    ]
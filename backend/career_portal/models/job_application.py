@@ -17,6 +17,10 @@ class JobApplication(models.Model):
     cover_letter = models.TextField(blank=True)
     resume = models.FileField(upload_to='resumes/', blank=True, null=True)
     skills = models.TextField(blank=True, null=True, help_text='Skills relevant to this position')
+    parsed_resume = models.ForeignKey(
+        'resume_parser.ParsedResume', on_delete=models.SET_NULL, null=True, blank=True,
+        related_name='applications', help_text='Structured data extracted from the resume'
+    )
     applied_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from .models import Company, JobPosting, JobApplication, User, RecruiterCompany
+from resume_parser.serializers import ParsedResumeSerializer
 
 class UserSerializer(serializers.ModelSerializer):
     """
@@ -132,15 +133,16 @@ class JobApplicationSerializer(serializers.ModelSerializer):
     job_type = serializers.CharField(source='job_posting.job_type', read_only=True)
     salary = serializers.CharField(source='job_posting.salary', read_only=True)
     resume_url = serializers.SerializerMethodField()
+    parsed_resume = ParsedResumeSerializer(read_only=True)
     
     class Meta:
         model = JobApplication
         fields = [
             'id', 'job_posting', 'job_title', 'company_name', 'location', 'job_type', 'salary',
             'applicant', 'applicant_details', 'resume', 'resume_url', 'cover_letter', 'skills',
-            'status', 'applied_at', 'updated_at'
+            'parsed_resume', 'status', 'applied_at', 'updated_at'
         ]
-        read_only_fields = ['id', 'applicant', 'applied_at', 'updated_at', 'resume_url']
+        read_only_fields = ['id', 'applicant', 'applied_at', 'updated_at', 'resume_url', 'parsed_resume']
     
     def get_resume_url(self, obj):
         if obj.resume:
@@ -1,3 +1,192 @@
-from django.test import TestCase
+import io
+import shutil
+import tempfile
+from datetime import date, timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from resume_parser.models import ParsedResume, ResumeParseJob
+from resume_parser.resume_parser import parser_output_version
+
+from .models import Company, JobApplication, JobPosting, User
+
+
+class ApplicationTestCase(TestCase):
+    """Creates an employer with one job posting and a candidate, with uploads kept in a temporary MEDIA_ROOT."""
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        media = override_settings(MEDIA_ROOT=media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+
+        self.employer = User.objects.create_user('employer@example.com', 'secret', username='employer',
+                                                 user_type='employer')
+        self.candidate = User.objects.create_user('jane@example.com', 'secret', username='jane')
+        company = Company.objects.create(name='Example Corp', description='Software')
+        company.users.add(self.employer)
+        self.job_posting = JobPosting.objects.create(
+            title='Backend Engineer', description='Build APIs', requirements='Python', location='Remote',
+            job_type='full_time', company=company, posted_by=self.employer,
+            application_deadline=date.today() + timedelta(days=30),
+        )
+        self.client = APIClient()
+
+    def resume(self, name='resume.pdf'):
+        return SimpleUploadedFile(name, b'%PDF-1.4 resume', content_type='application/pdf')
+
+    def application(self, **fields):
+        return JobApplication.objects.create(job_posting=self.job_posting, applicant=self.candidate, **fields)
+
+
+@mock.patch('resume_parser.services.dispatch_parse_document')
+class ParsedResumeActionTests(ApplicationTestCase):
+    def get(self, application):
+        self.client.force_authenticate(self.employer)
+        return self.client.get(reverse('jobapplication-parsed-resume', args=[application.id]))
+
+    def stored_parse(self, parser_version):
+        return ParsedResume.objects.create(user=self.candidate, content_hash='0' * 64, filename='resume.pdf',
+                                           name='Jane Doe', skills={'Languages': ['python']},
+                                           parser_version=parser_version)
+
+    def test_without_a_stored_parse_a_job_is_queued(self, dispatch_parse_document):
+        application = self.application(resume=self.resume())
+
+        response = self.get(application)
+        self.assertEqual(response.status_code, 202)
+        job = ResumeParseJob.objects.get(application=application)
+        self.assertEqual(response.data['job_id'], str(job.id))
+        self.assertEqual(response.data['status'], ResumeParseJob.STATUS_QUEUED)
+
+        # Asking again while the job is pending queues nothing new
+        self.assertEqual(self.get(application).data['job_id'], str(job.id))
+        self.assertEqual(ResumeParseJob.objects.count(), 1)
+        dispatch_parse_document.assert_not_called()
+
+    def test_stored_parse_is_served_from_the_database(self, dispatch_parse_document):
+        parsed = self.stored_parse(parser_output_version())
+        application = self.application(resume=self.resume(), parsed_resume=parsed)
+
+        response = self.get(application)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['name'], 'Jane Doe')
+        self.assertFalse(ResumeParseJob.objects.exists())
+        dispatch_parse_document.assert_not_called()
+
+    def test_outdated_parse_is_served_while_it_is_redone(self, dispatch_parse_document):
+        parsed = self.stored_parse('0.0')
+        application = self.application(resume=self.resume(), parsed_resume=parsed)
+
+        response = self.get(application)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['parser_version'], '0.0')
+        self.assertTrue(ResumeParseJob.objects.filter(application=application).exists())
+        dispatch_parse_document.assert_not_called()
+
+    def test_application_without_resume(self, dispatch_parse_document):
+        response = self.get(self.application())
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(ResumeParseJob.objects.exists())
+
+
+class ApplyEnqueuesParseTests(ApplicationTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(self.candidate)
+
+    def apply(self):
+        url = reverse('jobposting-apply', args=[self.job_posting.id])
+        with mock.patch('builtins.print'):
+            return self.client.post(url, {'resume': self.resume(), 'cover_letter': 'Hello'}, format='multipart')
+
+    def create(self):
+        url = reverse('jobapplication-list')
+        return self.client.post(url, {'job_posting': self.job_posting.id, 'resume': self.resume()}, format='multipart')
+
+    def test_applying_queues_a_parse_of_the_resume(self):
+        for submit in (self.apply, self.create):
+            with self.subTest(submit=submit.__name__):
+                JobApplication.objects.all().delete()
+                response = submit()
+                self.assertEqual(response.status_code, 201)
+                application = JobApplication.objects.get(applicant=self.candidate)
+                job = ResumeParseJob.objects.get(application=application)
+                self.assertEqual(job.status, ResumeParseJob.STATUS_QUEUED)
+                self.assertEqual(job.user, self.candidate)
+
+    @mock.patch('resume_parser.jobs.enqueue_application_parse', side_effect=RuntimeError('queue down'))
+    def test_application_is_saved_when_queueing_fails(self, enqueue_application_parse):
+        for submit in (self.apply, self.create):
+            with self.subTest(submit=submit.__name__):
+                JobApplication.objects.all().delete()
+                with mock.patch('builtins.print'):
+                    response = submit()
+                self.assertEqual(response.status_code, 201)
+                self.assertTrue(JobApplication.objects.filter(applicant=self.candidate).exists())
+        self.assertEqual(enqueue_application_parse.call_count, 2)
+        self.assertFalse(ResumeParseJob.objects.exists())
+
+
+class BackfillParsedResumesTests(ApplicationTestCase):
+    def setUp(self):
+        super().setUp()
+        self.unparsed = self.application(resume=self.resume())
+        self.outdated = self.applicant_application('sam', resume=self.resume('sam.pdf'), parsed_resume=(
+            ParsedResume.objects.create(user=self.candidate, content_hash='1' * 64, parser_version='0.0')))
+        self.current = self.applicant_application('lee', resume=self.resume('lee.pdf'), parsed_resume=(
+            ParsedResume.objects.create(user=self.candidate, content_hash='2' * 64,
+                                        parser_version=parser_output_version())))
+        self.without_resume = self.applicant_application('kim')
+
+    def applicant_application(self, username, **fields):
+        applicant = User.objects.create_user(f'{username}@example.com', 'secret', username=username)
+        return JobApplication.objects.create(job_posting=self.job_posting, applicant=applicant, **fields)
+
+    def backfill(self, *args):
+        out, err = io.StringIO(), io.StringIO()
+        call_command('backfill_parsed_resumes', *args, stdout=out, stderr=err)
+        return out.getvalue(), err.getvalue()
+
+    @mock.patch('resume_parser.services.dispatch_parse_document')
+    def test_parses_only_applications_without_a_current_parse(self, dispatch_parse_document):
+        dispatch_parse_document.return_value = ('Jane Doe', {
+            'name': 'Jane Doe', 'email': 'jane@example.com', 'phone': '',
+            'skills_by_category': {'Languages': ['python']},
+        })
+        out, err = self.backfill('--batch-size', '1')
+
+        self.assertEqual(dispatch_parse_document.call_count, 2)
+        self.assertIn('Parsed 2 application resume(s), 0 failed', out)
+        for application in (self.unparsed, self.outdated):
+            application.refresh_from_db()
+            self.assertEqual(application.parsed_resume.parser_version, parser_output_version())
+        self.unparsed.refresh_from_db()
+        self.assertIn('python', self.unparsed.skills)
+        self.current.refresh_from_db()
+        self.assertEqual(self.current.parsed_resume.content_hash, '2' * 64)
+
+    @mock.patch('resume_parser.services.dispatch_parse_document', side_effect=ValueError('unreadable'))
+    def test_failures_are_reported_and_skipped(self, dispatch_parse_document):
+        out, err = self.backfill('--limit', '1')
+        self.assertEqual(dispatch_parse_document.call_count, 1)
+        self.assertIn(f'Application {self.unparsed.pk}: unreadable', err)
+        self.assertIn('Parsed 0 application resume(s), 1 failed', out)
+
+    @mock.patch('resume_parser.services.dispatch_parse_document')
+    def test_enqueue_queues_jobs_instead_of_parsing(self, dispatch_parse_document):
+        out, err = self.backfill('--enqueue')
+        self.assertIn('Queued 2 application resume(s), 0 failed', out)
+        queued = ResumeParseJob.objects.values_list('application_id', flat=True)
+        self.assertCountEqual(queued, [self.unparsed.pk, self.outdated.pk])
+        dispatch_parse_document.assert_not_called()
+
+        # Running again does not queue the pending parses twice
+        self.backfill('--enqueue')
+        self.assertEqual(ResumeParseJob.objects.count(), 2)
@@ -8,9 +8,6 @@ from .models import Company, JobPosting, JobApplication
 from .serializers import (
     CompanySerializer, JobPostingSerializer, JobApplicationSerializer
 )
-import tempfile
-import os
-from resume_parser.resume_parser import parse_resume_file
 
 # Company Views
 class CompanyViewSet(viewsets.ModelViewSet):
@@ -165,16 +162,12 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        temp_file = None
         try:
-            # Save the uploaded file temporarily
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(resume_file.name)[1])
-            for chunk in resume_file.chunks():
-                temp_file.write(chunk)
-            temp_file.close()
-            
-            # Parse the resume using our AI-powered parser
-            parsed_data = parse_resume_file(temp_file.name)
+            # Imported here so loading the views never pulls in the parser
+            from resume_parser.worker_pool import dispatch_parse
+
+            # Parse the resume straight from memory using our AI-powered parser
+            parsed_data = dispatch_parse(resume_file)
             
             return Response(parsed_data, status=status.HTTP_200_OK)
             
@@ -183,13 +176,6 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
                 {"detail": f"Error parsing resume: {str(e)}"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
-        finally:
-            # Clean up temporary file
-            if temp_file and os.path.exists(temp_file.name):
-                try:
-                    os.unlink(temp_file.name)
-                except Exception as e:
-                    print(f"Warning: Could not delete temporary file {temp_file.name}: {str(e)}")
 
     def job_applicants(self, request, job_id=None):
         """
@@ -1,9 +1,10 @@
-from rest_framework import viewsets, permissions, status
+from rest_framework import viewsets, permissions, serializers, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
 from ..models import JobApplication, JobPosting
 from ..serializers import JobApplicationSerializer
+from resume_parser.serializers import ParsedResumeSerializer
 
 class JobApplicationViewSet(viewsets.ModelViewSet):
     """
@@ -20,7 +21,7 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
         - Regular users see only their own applications
         """
         user = self.request.user
-        queryset = JobApplication.objects.all()
+        queryset = JobApplication.objects.select_related('parsed_resume')
         
         if user.is_staff:
             return queryset
@@ -48,7 +49,10 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
         ).exists():
             raise serializers.ValidationError("You have already applied to this job.")
         
-        serializer.save(applicant=self.request.user, job_posting=job_posting)
+        application = serializer.save(applicant=self.request.user, job_posting=job_posting)
+        # Parse the resume in the background; applying never fails because of it
+        from resume_parser.jobs import try_enqueue_application_parse
+        try_enqueue_application_parse(application)
 
     @action(detail=True, methods=['post'])
     def update_status(self, request, pk=None):
@@ -78,6 +82,39 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
         
         return Response(JobApplicationSerializer(job_application).data)
 
+    @action(detail=True, methods=['get'])
+    def parsed_resume(self, request, pk=None):
+        """
+        Get the structured data extracted from this application's resume.
+
+        The stored parse is served straight from the database. The resume is
+        never parsed inside the request: without a stored parse a background
+        parse job is queued and 202 returned, so the client asks again later.
+        """
+        # Imported here so loading the URLconf does not import the parser stack
+        from resume_parser.jobs import enqueue_application_parse, pending_application_job
+        from resume_parser.services import is_current
+
+        job_application = self.get_object()
+        parsed = job_application.parsed_resume
+        if parsed is not None:
+            if not is_current(parsed):
+                # Serve the stored parse while a newer parser version redoes it
+                enqueue_application_parse(job_application)
+            return Response(ParsedResumeSerializer(parsed).data)
+        if not job_application.resume:
+            return Response(
+                {'detail': 'This application has no resume.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        enqueue_application_parse(job_application)
+        data = {'detail': 'The resume is being parsed. Try again shortly.'}
+        job = pending_application_job(job_application)
+        if job is not None:
+            data.update(job_id=str(job.id), status=job.status)
+        return Response(data, status=status.HTTP_202_ACCEPTED)
+
     def job_applicants(self, request, job_id=None):
         """
         Get all applicants for a specific job posting (employers only)
@@ -117,7 +154,7 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
             # Get all applications for this job with related data
             applications = JobApplication.objects.filter(
                 job_posting=job_posting
-            ).select_related('applicant')
+            ).select_related('applicant', 'parsed_resume')
             
             serializer = self.get_serializer(applications, many=True, context={'request': request})
             
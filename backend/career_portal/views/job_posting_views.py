@@ -268,6 +268,7 @@ class JobPostingViewSet(viewsets.ModelViewSet):
         """
         from ..models import JobApplication
         from ..serializers import JobApplicationSerializer
+        from resume_parser.jobs import try_enqueue_application_parse
         import traceback
         
         try:
@@ -326,7 +327,9 @@ class JobPostingViewSet(viewsets.ModelViewSet):
             # Add context for serializer
             serializer = JobApplicationSerializer(data=application_data, context={'request': request})
             if serializer.is_valid():
-                serializer.save(applicant=request.user)
+                application = serializer.save(applicant=request.user)
+                # Parse the resume in the background; applying never fails because of it
+                try_enqueue_application_parse(application)
                 return Response(serializer.data, status=status.HTTP_201_CREATED)
             else:
                 return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -376,4 +376,96 @@ MEDIA_ROOT = BASE_DIR / 'media'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
-SITE_ID = 1 
\ No newline at end of file
+SITE_ID = 1 
+# Resume parser settings
+# Seconds an NLP model may stay idle before it is unloaded (0 keeps models resident)
+RESUME_PARSER_MODEL_TTL = 1800
+
+# spaCy model tier: 'lg', 'md', 'sm' (name NER only) or 'rules-only' (no model).
+# Compare tiers with `python manage.py evaluate_model_tiers`.
+RESUME_PARSER_MODEL_TIER = os.environ.get('RESUME_PARSER_MODEL_TIER', 'lg')
+
+# Load and freeze the parser models when the WSGI app is loaded. With gunicorn's
+# preload_app (see gunicorn.conf.py) that happens once in the master, and the
+# forked workers share the model memory.
+RESUME_PARSER_PRELOAD = os.environ.get('RESUME_PARSER_PRELOAD', 'False').lower() in ('true', '1', 'yes')
+
+# Skill taxonomy data file. Running workers pick up edits within
+# RESUME_PARSER_TAXONOMY_CHECK_SECONDS without a restart.
+RESUME_PARSER_TAXONOMY_PATH = os.environ.get('RESUME_PARSER_TAXONOMY_PATH') or None
+RESUME_PARSER_TAXONOMY_CHECK_SECONDS = 30
+
+# Parse result cache: per-process LRU plus a disk tier shared by all workers.
+# Set RESUME_PARSER_CACHE_DIR to '' to disable the disk tier.
+RESUME_PARSER_CACHE_ENABLED = True
+RESUME_PARSER_CACHE_MEMORY_ENTRIES = 256
+RESUME_PARSER_CACHE_MEMORY_BYTES = 16 * 1024 * 1024
+RESUME_PARSER_CACHE_DIR = os.path.join(BASE_DIR, 'cache', 'resume_parser')
+RESUME_PARSER_CACHE_DISK_BYTES = 256 * 1024 * 1024
+
+# Batch parsing (/api/resume/parse-batch/)
+RESUME_PARSER_BATCH_SIZE = 16
+RESUME_PARSER_BATCH_MAX_FILES = 500
+RESUME_PARSER_MAX_FILE_BYTES = 5 * 1024 * 1024
+
+# Dedicated parser worker pool, started with `manage.py run_parser_pool`.
+# Leave RESUME_PARSER_POOL_ADDRESS unset to parse inside the request thread.
+RESUME_PARSER_POOL_ADDRESS = os.environ.get('RESUME_PARSER_POOL_ADDRESS')
+# Shared secret of the pool socket, whose messages are unpickled; required to run the pool
+RESUME_PARSER_POOL_AUTHKEY = os.environ.get('RESUME_PARSER_POOL_AUTHKEY')
+RESUME_PARSER_WORKERS = 0  # 0 uses one worker per CPU
+RESUME_PARSER_WORKER_MAX_JOBS = 500
+RESUME_PARSER_WORKER_MAX_RSS_MB = 2048
+RESUME_PARSER_WORKER_TIMEOUT = 60
+
+# Text extraction budgets. PDF and DOCX extraction both stop as soon as a
+# budget is reached (0 disables a budget)
+RESUME_PARSER_PDF_MAX_PAGES = 20
+RESUME_PARSER_MAX_TEXT_CHARS = 100000
+# Threads per PDF. Only used by backends whose extraction releases the GIL;
+# the bundled ones are pure Python or not thread-safe, so keep this at 1.
+RESUME_PARSER_PDF_WORKERS = 1
+
+# PDF text extraction backend ('pypdf2', 'pypdf', 'pdfminer', 'pymupdf',
+# 'pypdfium2'), or 'auto' for the one `manage.py benchmark_pdf_backends`
+# picked as the fastest accurate backend on this machine.
+RESUME_PARSER_PDF_BACKEND = os.environ.get('RESUME_PARSER_PDF_BACKEND', 'auto')
+RESUME_PARSER_PDF_BACKEND_FILE = os.path.join(BASE_DIR, 'cache', 'pdf_backend.json')
+
+# Asynchronous parse jobs (/api/resume/parse/?async=1 and job applications)
+# are processed by `manage.py run_resume_jobs`. The inline worker instead
+# drains the queue on a thread inside the web process, which loads the
+# parser into every web worker; only enable it for local development.
+RESUME_PARSER_JOBS_INLINE_WORKER = os.environ.get('RESUME_PARSER_JOBS_INLINE_WORKER', 'False').lower() in ('true', '1', 'yes')
+RESUME_PARSER_JOB_STALE_SECONDS = 600
+RESUME_PARSER_JOB_MAX_ATTEMPTS = 3
+RESUME_PARSER_MAX_QUEUED_JOBS = 200  # Uploads waiting in the queue; more are answered with 429
+
+# Semantic skill matching against a persisted SKILL_DB embedding matrix.
+# Build the matrix ahead of time with `manage.py build_skill_embeddings`.
+RESUME_PARSER_SEMANTIC_MATCHING = False
+RESUME_PARSER_SEMANTIC_MODEL = 'all-MiniLM-L6-v2'
+RESUME_PARSER_SEMANTIC_THRESHOLD = 0.75
+RESUME_PARSER_SEMANTIC_TOP_K = 2
+RESUME_PARSER_SEMANTIC_MAX_CANDIDATES = 256
+RESUME_PARSER_EMBEDDINGS_DIR = os.path.join(BASE_DIR, 'cache', 'skill_embeddings')
+
+# Per-stage parse instrumentation. Each hook is called with the finished trace
+# of every parse; staff can also request it with /api/resume/parse/?timings=1.
+RESUME_PARSER_METRICS_HOOKS = ['resume_parser.instrumentation.log_slow_parses']
+RESUME_PARSER_SLOW_PARSE_MS = 2000
+
+# Default time budget for /api/resume/parse/ (overridable with ?budget_ms=).
+# Parses that run out of time skip NER and semantic matching and return the
+# rule-based result, listing what was skipped in "degraded". 0 disables it.
+RESUME_PARSER_REQUEST_BUDGET_MS = 5000
+
+# Admission control for /api/resume/parse/, across all web workers on the
+# machine: parses beyond the concurrency limit wait in a short queue; beyond
+# that they get a 429 with Retry-After. 0 allows one parse per parser pool
+# worker (RESUME_PARSER_WORKERS, or one per CPU). Live counts are at
+# /api/resume/metrics/ (staff only).
+RESUME_PARSER_MAX_CONCURRENT_PARSES = 0
+RESUME_PARSER_MAX_QUEUED_PARSES = 8
+RESUME_PARSER_QUEUE_TIMEOUT = 10
+RESUME_PARSER_ADMISSION_DIR = os.path.join(BASE_DIR, 'cache', 'admission')
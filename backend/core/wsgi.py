@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
 
 application = get_wsgi_application()
+
+# Load the resume parser models before workers are forked (RESUME_PARSER_PRELOAD)
+from resume_parser.warmup import preload_if_enabled  # noqa: E402
+
+preload_if_enabled()
@@ -0,0 +1,31 @@
+"""
+Gunicorn configuration for the TalentLink API.
+
+The app is loaded in the master before workers are forked, and with
+RESUME_PARSER_PRELOAD set the resume parser models are loaded and frozen
+there too, so every worker shares one copy of them instead of loading its own.
+
+    RESUME_PARSER_PRELOAD=true gunicorn core.wsgi
+"""
+import multiprocessing
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get('GUNICORN_THREADS', 1))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 120))
+preload_app = True
+
+
+def post_fork(server, worker):
+    # Connections opened while loading the app in the master must not be shared
+    from django.db import connections
+    connections.close_all()
+
+
+def post_worker_init(worker):
+    from resume_parser.warmup import format_memory_report, memory_report
+
+    report = memory_report()
+    if report:
+        worker.log.info('Resume parser worker memory: %s', format_memory_report(report))
@@ -1,3 +1,19 @@
 from django.contrib import admin
+from .models import ParsedResume, ResumeParseJob
 
-# Register your models here.
+@admin.register(ResumeParseJob)
+class ResumeParseJobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'user', 'filename', 'status', 'attempts', 'created_at', 'finished_at')
+    list_filter = ('status', 'created_at')
+    search_fields = ('filename', 'user__username', 'user__email')
+    raw_id_fields = ('user', 'application')
+    exclude = ('upload',)
+    readonly_fields = ('result', 'attempts', 'started_at', 'finished_at')
+
+@admin.register(ParsedResume)
+class ParsedResumeAdmin(admin.ModelAdmin):
+    list_display = ('id', 'user', 'filename', 'name', 'email', 'parser_version', 'updated_at')
+    list_filter = ('parser_version', 'updated_at')
+    search_fields = ('filename', 'name', 'email', 'content_hash', 'user__username', 'user__email')
+    raw_id_fields = ('user',)
+    readonly_fields = ('content_hash', 'parser_version', 'created_at', 'updated_at')
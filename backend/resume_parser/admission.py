@@ -0,0 +1,216 @@
+"""
+Admission control for synchronous resume parsing.
+
+At most RESUME_PARSER_MAX_CONCURRENT_PARSES parses run at once on the
+machine, and at most RESUME_PARSER_MAX_QUEUED_PARSES requests wait for a
+slot, each for up to RESUME_PARSER_QUEUE_TIMEOUT seconds. Anything beyond
+that is turned away straight away with ParserOverloaded, which the view
+answers with 429 and a Retry-After computed from the backlog and the
+recent parse time. A burst of uploads therefore queues briefly or is shed,
+instead of putting every worker into spaCy at once.
+
+The limits hold across web processes: gunicorn's sync workers each serve
+one request at a time, so a per-process count would never see contention.
+Every parse slot and queue place is a lock file in
+RESUME_PARSER_ADMISSION_DIR, taken with flock. The kernel releases the lock
+when its holder exits, so a crashed worker never leaks a slot. A holder
+also writes its pid into the slot file, and counting the held slots (for
+metrics and Retry-After) reads those under one coordination lock instead of
+probing the slot locks, so a count can never make a free slot look taken.
+"""
+import fcntl
+import math
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+from .conf import get_setting
+
+# Weight of the newest parse in the service time average
+_SERVICE_TIME_SMOOTHING = 0.2
+# How often a queued request checks for a free parse slot, in seconds
+_POLL_INTERVAL = 0.05
+
+
+def _is_alive(pid: int) -> bool:
+    """True if a process with this pid exists; a crashed holder leaves its pid behind."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class ParserOverloaded(Exception):
+    """Raised when a parse cannot be admitted; ``retry_after`` is in whole seconds."""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """Machine-wide bounded concurrency with a short, bounded wait queue."""
+
+    def __init__(self, directory: Optional[str] = None, max_concurrent: Optional[int] = None,
+                 max_queued: Optional[int] = None):
+        self._directory = directory
+        self._max_concurrent = max_concurrent
+        self._max_queued = max_queued
+        self._lock = threading.Lock()
+        # Counters for this process; the slot files hold the machine-wide state
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.service_seconds = 1.0  # Moving average of admitted parse durations
+
+    @property
+    def directory(self) -> str:
+        if self._directory is not None:
+            return self._directory
+        return get_setting('RESUME_PARSER_ADMISSION_DIR') or os.path.join(
+            tempfile.gettempdir(), 'talentlink-resume-admission'
+        )
+
+    @property
+    def max_concurrent(self) -> int:
+        if self._max_concurrent is not None:
+            return max(1, self._max_concurrent)
+        # 0 matches the parser pool: one parse per worker, or per CPU
+        configured = get_setting('RESUME_PARSER_MAX_CONCURRENT_PARSES')
+        return max(1, configured or get_setting('RESUME_PARSER_WORKERS') or multiprocessing.cpu_count())
+
+    @property
+    def max_queued(self) -> int:
+        if self._max_queued is not None:
+            return max(0, self._max_queued)
+        return max(0, get_setting('RESUME_PARSER_MAX_QUEUED_PARSES'))
+
+    def _slot_path(self, kind: str, index: int) -> str:
+        return os.path.join(self.directory, f'{kind}-{index}.lock')
+
+    @contextmanager
+    def _coordinated(self):
+        """Hold the machine-wide lock that taking and counting slots happen under."""
+        os.makedirs(self.directory, exist_ok=True)
+        fd = os.open(os.path.join(self.directory, 'admission.lock'), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)
+
+    def _try_take(self, kind: str, count: int) -> Optional[int]:
+        """Lock the first free ``kind`` slot file and return its descriptor, or None if all are held."""
+        for index in range(count):
+            fd = os.open(self._slot_path(kind, index), os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(fd)
+                continue
+            with self._coordinated():
+                os.ftruncate(fd, 0)
+                os.pwrite(fd, str(os.getpid()).encode(), 0)
+            return fd
+        return None
+
+    def _give_back(self, fd: int) -> None:
+        """Clear a held slot's pid and unlock it."""
+        try:
+            with self._coordinated():
+                os.ftruncate(fd, 0)
+        finally:
+            # Closing the descriptor drops the lock
+            os.close(fd)
+
+    def _held(self, kind: str, count: int) -> int:
+        """Count the ``kind`` slots held by a live process, without touching the slot locks."""
+        held = 0
+        with self._coordinated():
+            for index in range(count):
+                try:
+                    with open(self._slot_path(kind, index), 'rb') as slot:
+                        pid = int(slot.read() or 0)
+                except (OSError, ValueError):
+                    continue
+                if pid and _is_alive(pid):
+                    held += 1
+        return held
+
+    def retry_after(self) -> int:
+        """Seconds until the current backlog should have drained."""
+        max_concurrent = self.max_concurrent
+        backlog = self._held('parse', max_concurrent) + self._held('queue', self.max_queued) + 1
+        return max(1, math.ceil(backlog * self.service_seconds / max_concurrent))
+
+    def acquire(self, timeout: Optional[float] = None) -> int:
+        """
+        Take a parse slot, waiting in the queue if there is room; raise ParserOverloaded otherwise.
+
+        Returns the slot to hand back to release().
+        """
+        timeout = get_setting('RESUME_PARSER_QUEUE_TIMEOUT') if timeout is None else timeout
+        max_concurrent = self.max_concurrent
+        slot = self._try_take('parse', max_concurrent)
+        if slot is None:
+            place = self._try_take('queue', self.max_queued)
+            if place is None:
+                with self._lock:
+                    self.rejected += 1
+                raise ParserOverloaded('Resume parser is at capacity', self.retry_after())
+            try:
+                deadline = time.monotonic() + timeout
+                while slot is None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        with self._lock:
+                            self.timed_out += 1
+                        raise ParserOverloaded('Timed out waiting for a resume parser slot', self.retry_after())
+                    time.sleep(min(_POLL_INTERVAL, remaining))
+                    slot = self._try_take('parse', max_concurrent)
+            finally:
+                self._give_back(place)
+        with self._lock:
+            self.admitted += 1
+        return slot
+
+    def release(self, slot: int, elapsed: Optional[float] = None) -> None:
+        self._give_back(slot)
+        if elapsed is not None:
+            with self._lock:
+                self.service_seconds += _SERVICE_TIME_SMOOTHING * (elapsed - self.service_seconds)
+
+    @contextmanager
+    def admit(self, timeout: Optional[float] = None):
+        """Run the enclosed parse in an admitted slot."""
+        slot = self.acquire(timeout)
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.release(slot, time.monotonic() - start)
+
+    def stats(self) -> Dict:
+        max_concurrent, max_queued = self.max_concurrent, self.max_queued
+        with self._lock:
+            return {
+                'in_flight': self._held('parse', max_concurrent),
+                'queued': self._held('queue', max_queued),
+                'max_concurrent': max_concurrent,
+                'max_queued': max_queued,
+                'admitted': self.admitted,
+                'rejected': self.rejected,
+                'timed_out': self.timed_out,
+                'avg_parse_seconds': round(self.service_seconds, 3),
+            }
+
+
+# Process-wide controller shared by the parse views
+admission = AdmissionController()
@@ -0,0 +1,56 @@
+"""
+Microbenchmark for contact extraction.
+
+Runs the single-pass contact scanner over the synthetic corpus many times and
+reports the cost per resume alongside accuracy against the corpus labels.
+Names are resolved from header patterns only, so no spaCy model is loaded.
+
+    python -m resume_parser.benchmarks.contact --corpus-size 200
+"""
+import argparse
+import json
+import time
+from typing import Dict
+
+from ..contact import resolve_name, scan_contact
+from .corpus import generate_corpus
+
+
+def run_contact_benchmark(corpus_size: int = 200, seed: int = 1234, repeat: int = 20) -> Dict:
+    corpus = generate_corpus(corpus_size, seed)
+    texts = [resume.text for resume in corpus]
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            resolve_name(scan_contact(text))
+    elapsed = time.perf_counter() - start
+
+    correct = {'name': 0, 'email': 0, 'phone': 0}
+    for resume, text in zip(corpus, texts):
+        scan = scan_contact(text)
+        correct['name'] += resolve_name(scan) == resume.name
+        correct['email'] += scan.email == resume.email
+        correct['phone'] += (scan.phone or '').replace('-', '') == resume.phone_digits
+
+    return {
+        'corpus_size': corpus_size,
+        'seed': seed,
+        'repeat': repeat,
+        'mean_us_per_resume': round(elapsed / (repeat * len(texts)) * 1e6, 2),
+        'mean_chars': round(sum(len(text) for text in texts) / len(texts)),
+        'accuracy': {field: round(count / len(corpus), 4) for field, count in correct.items()},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--corpus-size', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+    print(json.dumps(run_contact_benchmark(args.corpus_size, args.seed, args.repeat), indent=2))
+
+
+if __name__ == '__main__':
+    main()
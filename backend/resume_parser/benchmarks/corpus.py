@@ -0,0 +1,156 @@
+"""
+Deterministic synthetic resume corpus for benchmarking the parser.
+
+Every resume is generated from a seeded RNG, so the same seed always yields
+byte-identical PDF and DOCX files. Resumes vary in page count, layout and
+skill density, and each one carries its ground truth (name, email, phone and
+skills) so benchmarks can score accuracy as well as speed.
+"""
+import random
+from typing import Dict, Iterable, List, Mapping, Set
+
+from ..samples import docx_paragraph, render_docx_xml, render_pdf
+
+FIRST_NAMES = [
+    'Aarav', 'Priya', 'Daniel', 'Maria', 'Kenji', 'Fatima', 'Lucas', 'Olivia',
+    'Rahul', 'Sofia', 'Ethan', 'Chloe', 'Arjun', 'Hannah', 'Mateo', 'Grace',
+]
+LAST_NAMES = [
+    'Sharma', 'Patel', 'Johnson', 'Garcia', 'Tanaka', 'Khan', 'Silva', 'Brown',
+    'Iyer', 'Rossi', 'Miller', 'Dubois', 'Reddy', 'Schmidt', 'Lopez', 'Walker',
+]
+COMPANIES = ['Northwind Traders', 'Contoso Ltd', 'Globex Corporation', 'Initech', 'Umbrella Labs', 'Stark Industries']
+SCHOOLS = ['State University', 'Institute of Technology', 'City College', 'National University']
+
+# Filler vocabulary deliberately avoids anything that is also a skill name
+FILLER_WORDS = [
+    'delivered', 'projects', 'team', 'customers', 'reporting', 'improved', 'process',
+    'quality', 'delivery', 'stakeholders', 'requirements', 'implemented', 'features',
+    'platform', 'performance', 'across', 'multiple', 'regions', 'worked', 'closely',
+    'with', 'product', 'managers', 'reduced', 'costs', 'increased', 'reliability',
+    'mentored', 'engineers', 'owned', 'roadmap', 'launched', 'services', 'for',
+    'clients', 'partnered', 'operations', 'streamlined', 'workflows', 'the', 'and',
+]
+
+LAYOUTS = ('classic', 'labeled', 'sidebar')
+PAGE_COUNTS = (1, 1, 2, 3, 5, 12)
+SKILL_DENSITIES = {'low': 4, 'medium': 10, 'high': 24}
+
+LINES_PER_PAGE = 46
+
+
+class SyntheticResume:
+    """One generated resume, its rendered files and its ground truth labels."""
+
+    def __init__(self, index: int, name: str, email: str, phone_digits: str, skills: Set[str],
+                 layout: str, pages: int, density: str, header: List[str],
+                 skill_lines: List[str], body: List[str]):
+        self.index = index
+        self.name = name
+        self.email = email
+        self.phone_digits = phone_digits
+        self.skills = skills
+        self.layout = layout
+        self.pages = pages
+        self.density = density
+        self.header = header
+        self.skill_lines = skill_lines
+        self.body = body
+
+    @property
+    def slug(self) -> str:
+        return f'resume-{self.index:03d}-{self.layout}-{self.pages}p-{self.density}'
+
+    @property
+    def lines(self) -> List[str]:
+        return self.header + [''] + self.skill_lines + [''] + self.body
+
+    @property
+    def text(self) -> str:
+        return '\n'.join(self.lines)
+
+    def labels(self) -> Dict:
+        return {
+            'name': self.name,
+            'email': self.email,
+            'phone_digits': self.phone_digits,
+            'skills': sorted(self.skills),
+        }
+
+    def to_pdf(self) -> bytes:
+        lines = self.lines
+        pages = [lines[i:i + LINES_PER_PAGE] for i in range(0, len(lines), LINES_PER_PAGE)]
+        return render_pdf(pages)
+
+    def to_docx(self) -> bytes:
+        return render_docx(self)
+
+
+def _sentence(rng: random.Random) -> str:
+    words = [rng.choice(FILLER_WORDS) for _ in range(rng.randint(8, 16))]
+    return ' '.join(words).capitalize() + '.'
+
+
+def generate_resume(index: int, rng: random.Random, skill_db: Mapping[str, Iterable[str]]) -> SyntheticResume:
+    """Generate one resume with a random layout, length and skill density."""
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    name = f'{first} {last}'
+    email = f'{first.lower()}.{last.lower()}{index}@example.com'
+    phone_digits = ''.join(str(rng.randint(0, 9)) for _ in range(10))
+    phone_digits = str(rng.randint(2, 9)) + phone_digits[1:]
+    phone = f'({phone_digits[:3]}) {phone_digits[3:6]}-{phone_digits[6:]}'
+
+    layout = rng.choice(LAYOUTS)
+    pages = rng.choice(PAGE_COUNTS)
+    density = rng.choice(sorted(SKILL_DENSITIES))
+
+    all_skills = sorted({skill for skills in skill_db.values() for skill in skills})
+    skills = set(rng.sample(all_skills, min(SKILL_DENSITIES[density], len(all_skills))))
+
+    if layout == 'classic':
+        header = [name, f'{email} | {phone}', 'Software Engineer']
+    elif layout == 'labeled':
+        header = ['CURRICULUM VITAE', f'Name: {name}', f'Email: {email}', f'Phone: {phone}']
+    else:
+        header = [f'Phone: {phone}', f'E-mail: {email}', name]
+
+    ordered_skills = sorted(skills)
+    rng.shuffle(ordered_skills)
+    skill_lines = ['SKILLS'] + [
+        ', '.join(ordered_skills[i:i + 6]) for i in range(0, len(ordered_skills), 6)
+    ]
+
+    body = ['EXPERIENCE']
+    target_lines = pages * LINES_PER_PAGE - len(header) - len(skill_lines) - 2
+    while len(body) < target_lines - 2:
+        body.append(f'{rng.choice(COMPANIES)} ({rng.randint(2010, 2024)})')
+        for _ in range(rng.randint(3, 6)):
+            body.append(_sentence(rng))
+    body = body[:max(target_lines - 2, 1)] + ['EDUCATION', f'B.Sc. Computer Science, {rng.choice(SCHOOLS)}']
+
+    return SyntheticResume(index, name, email, phone_digits, skills, layout, pages, density,
+                           header, skill_lines, body)
+
+
+def generate_corpus(size: int = 24, seed: int = 1234, skill_db: Mapping[str, Iterable[str]] = None) -> List[SyntheticResume]:
+    """Generate ``size`` resumes; the same seed always produces the same corpus."""
+    if skill_db is None:
+        from ..resume_parser import SKILL_DB
+        skill_db = SKILL_DB
+    rng = random.Random(seed)
+    return [generate_resume(index, rng, skill_db) for index in range(size)]
+
+
+def render_docx(resume: SyntheticResume) -> bytes:
+    """Render a resume as a minimal DOCX; the sidebar layout keeps its skills in a table."""
+    body = [docx_paragraph(line) for line in resume.header]
+    if resume.layout == 'sidebar':
+        body.append(docx_paragraph(resume.skill_lines[0]))
+        body.append('<w:tbl>')
+        for line in resume.skill_lines[1:]:
+            body.append(f'<w:tr><w:tc>{docx_paragraph(line)}</w:tc></w:tr>')
+        body.append('</w:tbl>')
+    else:
+        body.extend(docx_paragraph(line) for line in resume.skill_lines)
+    body.extend(docx_paragraph(line) for line in resume.body)
+    return render_docx_xml(''.join(body))
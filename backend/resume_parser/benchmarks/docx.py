@@ -0,0 +1,80 @@
+"""
+Benchmark of DOCX text extraction on large documents.
+
+Compares the streaming extractor with the python-docx path it replaced on
+generated documents of increasing size, reporting time and peak Python
+allocation for each.
+
+    python -m resume_parser.benchmarks.docx --paragraphs 1000 10000 50000
+"""
+import argparse
+import io
+import json
+import random
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from ..docx_extractor import iter_docx_lines
+from ..samples import docx_paragraph, render_docx_xml
+from .corpus import FILLER_WORDS
+
+
+def large_docx(paragraphs: int, seed: int = 1234) -> bytes:
+    """A document of ``paragraphs`` paragraphs with a four-column table every hundred."""
+    rng = random.Random(seed)
+    body = []
+    for index in range(paragraphs):
+        body.append(docx_paragraph(' '.join(rng.choice(FILLER_WORDS) for _ in range(12))))
+        if index % 100 == 99:
+            cells = ''.join(f'<w:tc>{docx_paragraph(rng.choice(FILLER_WORDS))}</w:tc>' for _ in range(4))
+            body.append(f'<w:tbl><w:tr>{cells}</w:tr></w:tbl>')
+    return render_docx_xml(''.join(body))
+
+
+def _streaming(data: bytes) -> str:
+    return '\n'.join(iter_docx_lines(io.BytesIO(data)))
+
+
+def _python_docx(data: bytes) -> str:
+    from docx import Document
+    return '\n'.join(paragraph.text for paragraph in Document(io.BytesIO(data)).paragraphs)
+
+
+def _measure(extract: Callable[[bytes], str], data: bytes) -> Dict:
+    start = time.perf_counter()
+    text = extract(data)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    try:
+        extract(data)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'ms': round(elapsed * 1000, 1), 'peak_alloc_bytes': peak, 'chars': len(text)}
+
+
+def run_docx_benchmark(sizes: List[int]) -> List[Dict]:
+    extractors = {'streaming': _streaming, 'python_docx': _python_docx}
+    results = []
+    for paragraphs in sizes:
+        data = large_docx(paragraphs)
+        row = {'paragraphs': paragraphs, 'file_bytes': len(data)}
+        for name, extract in extractors.items():
+            try:
+                row[name] = _measure(extract, data)
+            except ImportError:
+                row[name] = None  # python-docx is not installed
+        results.append(row)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--paragraphs', type=int, nargs='+', default=[1000, 10000, 50000])
+    args = parser.parse_args()
+    print(json.dumps(run_docx_benchmark(args.paragraphs), indent=2))
+
+
+if __name__ == '__main__':
+    main()
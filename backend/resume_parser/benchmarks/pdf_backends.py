@@ -0,0 +1,83 @@
+"""
+Speed and accuracy of the PDF extraction backends.
+
+Extracts every PDF of the synthetic corpus with each installed backend,
+scores the text against the lines the PDF was rendered from, and picks the
+fastest backend whose accuracy meets the bar. Used by
+``manage.py benchmark_pdf_backends``.
+"""
+import io
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+from .. import resume_parser as parser
+from ..pdf_backends import PDF_BACKENDS, normalize_page_text
+from .corpus import SyntheticResume, generate_corpus
+from .runner import percentile
+
+
+def _recall(expected: Counter, found: Counter) -> float:
+    total = sum(expected.values())
+    return round(sum((expected & found).values()) / total, 4) if total else 1.0
+
+
+def score_extraction(text: str, resume: SyntheticResume) -> Dict[str, float]:
+    """Fraction of the rendered lines, and of their words, that came back out of the PDF."""
+    expected_lines = Counter(filter(None, (normalize_page_text(line) for line in resume.lines)))
+    found_lines = Counter(filter(None, text.split('\n')))
+    expected_words = Counter(word for line in expected_lines.elements() for word in line.split())
+    found_words = Counter(text.split())
+    return {
+        'line_recall': _recall(expected_lines, found_lines),
+        'word_recall': _recall(expected_words, found_words),
+    }
+
+
+def benchmark_backend(name: str, resumes: List[SyntheticResume], pdfs: List[bytes], iterations: int = 3) -> Dict:
+    """Time and score one backend over the rendered corpus."""
+    backend = PDF_BACKENDS[name]
+    if not backend.available():
+        return {'available': False}
+
+    scores = []
+    for resume, pdf in zip(resumes, pdfs):
+        scores.append(score_extraction(parser.extract_text_from_pdf(io.BytesIO(pdf), backend=backend), resume))
+
+    timings = []
+    for _ in range(iterations):
+        for pdf in pdfs:
+            start = time.perf_counter()
+            parser.extract_text_from_pdf(io.BytesIO(pdf), backend=backend)
+            timings.append((time.perf_counter() - start) * 1000)
+
+    return {
+        'available': True,
+        'line_recall': round(sum(score['line_recall'] for score in scores) / len(scores), 4) if scores else 0.0,
+        'word_recall': round(sum(score['word_recall'] for score in scores) / len(scores), 4) if scores else 0.0,
+        'min_line_recall': min((score['line_recall'] for score in scores), default=0.0),
+        'p50_ms': round(percentile(timings, 50), 3),
+        'p95_ms': round(percentile(timings, 95), 3),
+        'mean_ms': round(sum(timings) / len(timings), 3) if timings else 0.0,
+    }
+
+
+def run_pdf_backend_benchmark(corpus_size: int = 24, seed: int = 1234, iterations: int = 3,
+                              backends: Optional[Iterable[str]] = None) -> Dict:
+    """Benchmark every (or the given) backend and return the report as a JSON-ready dict."""
+    resumes = generate_corpus(corpus_size, seed)
+    pdfs = [resume.to_pdf() for resume in resumes]
+    results = {name: benchmark_backend(name, resumes, pdfs, iterations) for name in (backends or PDF_BACKENDS)}
+    return {
+        'meta': {'corpus_size': corpus_size, 'seed': seed, 'iterations': iterations},
+        'backends': results,
+    }
+
+
+def choose_backend(report: Dict, min_line_recall: float = 0.98) -> Optional[str]:
+    """The fastest backend (by mean time) whose line recall meets the bar, or None."""
+    qualified = [
+        (result['mean_ms'], name) for name, result in report['backends'].items()
+        if result.get('available') and result['line_recall'] >= min_line_recall
+    ]
+    return min(qualified)[1] if qualified else None
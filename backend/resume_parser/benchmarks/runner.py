@@ -0,0 +1,164 @@
+"""
+Benchmark runner for the resume parser.
+
+Times each extraction stage over a synthetic corpus, reports p50/p95
+latencies and peak allocations as JSON, and compares a run against a
+stored baseline so regressions show up before they ship.
+"""
+import io
+import json
+import math
+import platform
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+from .. import resume_parser as parser
+from ..cache import parse_cache
+from ..contact import extract_contact
+from ..model_registry import peak_rss
+from .corpus import SyntheticResume, generate_corpus
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of ``values``."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+class PreparedResume:
+    """A corpus resume with its files rendered and its text extracted up front."""
+
+    def __init__(self, resume: SyntheticResume):
+        self.resume = resume
+        self.pdf = resume.to_pdf()
+        self.docx = resume.to_docx()
+        self.text = parser.extract_text_from_pdf(io.BytesIO(self.pdf))
+
+
+def default_stages() -> Dict[str, Callable[[PreparedResume], object]]:
+    """Map stage names to callables that run the stage on one prepared resume."""
+    return {
+        'extract_text_from_pdf': lambda item: parser.extract_text_from_pdf(io.BytesIO(item.pdf)),
+        'extract_text_from_docx': lambda item: parser.extract_text_from_docx(io.BytesIO(item.docx)),
+        'extract_text_from_docx_legacy': lambda item: parser.extract_text_from_docx_legacy(io.BytesIO(item.docx)),
+        'extract_name': lambda item: parser.extract_name(item.text),
+        'extract_email': lambda item: parser.extract_email(item.text),
+        'extract_phone': lambda item: parser.extract_phone(item.text),
+        'extract_contact': lambda item: extract_contact(item.text, parser.get_nlp),
+        'extract_skills_rule_based': lambda item: parser.extract_skills_rule_based(item.text),
+        'extract_skills_ner': lambda item: parser.extract_skills_ner(item.text),
+        'parse_resume_file': lambda item: parser.parse_resume_file(item.pdf, 'resume.pdf'),
+    }
+
+
+def _time_stage(stage: Callable, items: List[PreparedResume], iterations: int) -> List[float]:
+    timings = []
+    for _ in range(iterations):
+        for item in items:
+            start = time.perf_counter()
+            stage(item)
+            timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def _peak_alloc(stage: Callable, items: List[PreparedResume]) -> int:
+    """Largest Python heap growth seen while running the stage once per resume."""
+    peak = 0
+    tracemalloc.start()
+    try:
+        for item in items:
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            stage(item)
+            _, stage_peak = tracemalloc.get_traced_memory()
+            peak = max(peak, stage_peak - baseline)
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_benchmarks(corpus_size: int = 24, seed: int = 1234, iterations: int = 3,
+                   stages: Optional[Dict[str, Callable]] = None) -> Dict:
+    """Run every stage over the corpus and return the report as a JSON-ready dict."""
+    stages = stages or default_stages()
+    items = [PreparedResume(resume) for resume in generate_corpus(corpus_size, seed)]
+
+    # Load models before timing so one-off loads do not land in the first sample
+    parser.get_nlp()
+    parser.get_skill_matcher()
+
+    # The cache would turn every repeat into a hit
+    cache_enabled = parse_cache.enabled
+    parse_cache.enabled = False
+    try:
+        results = {}
+        for name, stage in stages.items():
+            timings = _time_stage(stage, items, iterations)
+            results[name] = {
+                'samples': len(timings),
+                'p50_ms': round(percentile(timings, 50), 3),
+                'p95_ms': round(percentile(timings, 95), 3),
+                'mean_ms': round(sum(timings) / len(timings), 3) if timings else 0.0,
+                'peak_alloc_bytes': _peak_alloc(stage, items),
+            }
+    finally:
+        parse_cache.enabled = cache_enabled
+
+    return {
+        'meta': {
+            'parser_version': parser.PARSER_VERSION,
+            'corpus_size': corpus_size,
+            'seed': seed,
+            'iterations': iterations,
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+        },
+        'stages': results,
+        'peak_rss_bytes': peak_rss(),
+    }
+
+
+def compare_to_baseline(report: Dict, baseline: Dict, tolerance: float = 0.25,
+                        min_delta_ms: float = 0.5) -> List[Dict]:
+    """
+    Return the stages whose p50/p95 latency or peak allocation regressed.
+
+    A metric regresses when it exceeds the baseline by more than ``tolerance``
+    (a fraction). Latency changes smaller than ``min_delta_ms`` are ignored,
+    since sub-millisecond stages are dominated by timer noise.
+    """
+    regressions = []
+    for stage, current in report.get('stages', {}).items():
+        previous = baseline.get('stages', {}).get(stage)
+        if not previous:
+            continue
+        for metric in ('p50_ms', 'p95_ms', 'peak_alloc_bytes'):
+            old, new = previous.get(metric), current.get(metric)
+            if not old or new is None:
+                continue
+            if metric.endswith('_ms') and new - old < min_delta_ms:
+                continue
+            if new > old * (1 + tolerance):
+                regressions.append({
+                    'stage': stage,
+                    'metric': metric,
+                    'baseline': old,
+                    'current': new,
+                    'change': round(new / old - 1, 3),
+                })
+    return regressions
+
+
+def load_report(path: str) -> Dict:
+    with open(path) as report_file:
+        return json.load(report_file)
+
+
+def save_report(report: Dict, path: str) -> None:
+    with open(path, 'w') as report_file:
+        json.dump(report, report_file, indent=2, sort_keys=True)
+        report_file.write('\n')
@@ -0,0 +1,97 @@
+"""
+Startup budget check.
+
+Measures ``django.setup()`` plus loading the URLconf (which imports every
+view) in a fresh interpreter, and fails when it takes longer than the time
+budget, imports more modules than the module budget, or loads any of the
+heavy NLP/PDF libraries that must stay deferred until a resume is parsed.
+Management commands like ``migrate`` and every web worker boot pay this cost.
+
+    python -m resume_parser.benchmarks.startup --max-seconds 3 --max-modules 2000
+
+Run it from the directory containing manage.py. Exits with status 1 when a
+budget is exceeded.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+# Libraries that cost seconds or hundreds of MB to import, or that reach the network
+HEAVY_MODULES = ('torch', 'transformers', 'sentence_transformers', 'sklearn', 'spacy', 'thinc', 'nltk',
+                 'numpy', 'docx', 'lxml', 'PyPDF2', 'pypdf', 'pdfminer', 'fitz', 'pypdfium2')
+
+
+def measure_startup(settings_module: str = 'core.settings') -> Dict:
+    """Set up Django and load the URLconf in this process; call in a fresh interpreter."""
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
+    modules_before = len(sys.modules)
+    start = time.perf_counter()
+
+    import django
+    django.setup()
+    setup_seconds = time.perf_counter() - start
+
+    from django.urls import get_resolver
+    get_resolver().url_patterns
+    total_seconds = time.perf_counter() - start
+
+    return {
+        'setup_seconds': round(setup_seconds, 3),
+        'total_seconds': round(total_seconds, 3),
+        'modules': len(sys.modules),
+        'modules_imported': len(sys.modules) - modules_before,
+        'heavy_modules': sorted(name for name in HEAVY_MODULES if name in sys.modules),
+    }
+
+
+def run_in_subprocess(settings_module: str = 'core.settings') -> Dict:
+    """Measure startup in a child interpreter so nothing already imported here skews it."""
+    output = subprocess.run(
+        [sys.executable, '-m', __spec__.name, '--child', '--settings', settings_module],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    # Settings and apps may print while loading; the report is the last line
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def budget_failures(report: Dict, max_seconds: float, max_modules: int) -> List[str]:
+    failures = []
+    if report['total_seconds'] > max_seconds:
+        failures.append(f"startup took {report['total_seconds']}s (budget {max_seconds}s)")
+    if report['modules'] > max_modules:
+        failures.append(f"{report['modules']} modules loaded (budget {max_modules})")
+    if report['heavy_modules']:
+        failures.append(f"heavy modules imported at startup: {', '.join(report['heavy_modules'])}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--max-seconds', type=float, default=3.0)
+    parser.add_argument('--max-modules', type=int, default=2000)
+    parser.add_argument('--settings', default='core.settings')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure_startup(args.settings)))
+        return
+
+    try:
+        report = run_in_subprocess(args.settings)
+    except subprocess.CalledProcessError as e:
+        sys.stderr.write(e.stderr)
+        sys.exit(f'Django failed to start (exit status {e.returncode})')
+    failures = budget_failures(report, args.max_seconds, args.max_modules)
+    report['failures'] = failures
+    print(json.dumps(report, indent=2))
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+Load-time benchmark for large skill taxonomies.
+
+Writes a synthetic taxonomy of the requested size, then times loading and
+compiling it and matching a long resume against it.
+
+    python -m resume_parser.benchmarks.taxonomy --skills 50000
+"""
+import argparse
+import json
+import os
+import random
+import string
+import tempfile
+import time
+from typing import Dict
+
+from ..taxonomy import Taxonomy
+
+CATEGORIES = ['Programming Languages', 'Web Technologies', 'Databases', 'Cloud & DevOps',
+              'AI & Data Science', 'Tools & Methodologies', 'Business', 'Design']
+
+
+def _word(rng: random.Random) -> str:
+    return ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 10)))
+
+
+def synthetic_taxonomy(size: int, seed: int = 1234) -> Dict:
+    """Return taxonomy data with ``size`` skills of one to three words each."""
+    rng = random.Random(seed)
+    names = set()
+    while len(names) < size:
+        names.add(' '.join(_word(rng) for _ in range(rng.randint(1, 3))))
+    skills = []
+    for name in sorted(names):
+        entry = {'name': name, 'category': rng.choice(CATEGORIES)}
+        if rng.random() < 0.2:
+            entry['synonyms'] = [_word(rng)]
+        if rng.random() < 0.05:
+            entry['abbreviations'] = [''.join(word[0] for word in name.split()).upper() + str(rng.randint(0, 9))]
+        skills.append(entry)
+    return {'version': f'synthetic-{size}', 'skills': skills}
+
+
+def run_taxonomy_benchmark(size: int = 50000, seed: int = 1234, text_chars: int = 100000) -> Dict:
+    data = synthetic_taxonomy(size, seed)
+    fd, path = tempfile.mkstemp(suffix='.json')
+    try:
+        with os.fdopen(fd, 'w') as taxonomy_file:
+            json.dump(data, taxonomy_file)
+        start = time.perf_counter()
+        taxonomy = Taxonomy.from_file(path)
+        load_seconds = time.perf_counter() - start
+        file_bytes = os.path.getsize(path)
+    finally:
+        os.unlink(path)
+
+    rng = random.Random(seed)
+    names = [entry['name'] for entry in data['skills']]
+    words = []
+    while sum(len(word) + 1 for word in words) < text_chars:
+        words.append(rng.choice(names) if rng.random() < 0.1 else _word(rng))
+    text = ' '.join(words)
+    start = time.perf_counter()
+    matched = taxonomy.matcher.match(text)
+    match_seconds = time.perf_counter() - start
+
+    return {
+        'skills': len(taxonomy),
+        'patterns': taxonomy.matcher.pattern_count,
+        'file_bytes': file_bytes,
+        'load_ms': round(load_seconds * 1000, 1),
+        'match_ms': round(match_seconds * 1000, 1),
+        'text_chars': len(text),
+        'skills_matched': sum(len(skills) for skills in matched.values()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--skills', type=int, default=50000)
+    parser.add_argument('--seed', type=int, default=1234)
+    args = parser.parse_args()
+    print(json.dumps(run_taxonomy_benchmark(args.skills, args.seed), indent=2))
+
+
+if __name__ == '__main__':
+    main()
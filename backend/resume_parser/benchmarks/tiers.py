@@ -0,0 +1,141 @@
+"""
+Accuracy and cost of the spaCy model tiers.
+
+Parses the labeled synthetic corpus once per RESUME_PARSER_MODEL_TIER and
+reports name and skill precision/recall next to parse latency and the
+memory the tier's model costs, so a tier can be picked per deployment.
+Used by ``manage.py evaluate_model_tiers``.
+
+Skills NER only adds skills from entities labelled SKILL, which the stock
+en_core_web models do not predict. With those models every tier's skill
+scores come from the rule-based and semantic matchers alone, and only the
+name scores compare the models; ``skill_label`` in each tier's report says
+whether its pipeline can contribute skills at all.
+"""
+import re
+import time
+from typing import Dict, Iterable, List, Optional
+
+from .. import resume_parser as parser
+from ..cache import parse_cache
+from ..model_registry import current_rss, registry as model_registry
+from .corpus import generate_corpus
+from .runner import PreparedResume, percentile
+
+_SPACES = re.compile(r'\s+')
+
+
+def _normalize(value: Optional[str]) -> str:
+    return _SPACES.sub(' ', value or '').strip().casefold()
+
+
+def _ratio(numerator: int, denominator: int) -> float:
+    return round(numerator / denominator, 4) if denominator else 0.0
+
+
+def score_results(results: List[Dict], items: List[PreparedResume]) -> Dict[str, Dict[str, float]]:
+    """Precision and recall of extracted names and skills against the corpus labels."""
+    names_found = names_correct = 0
+    skills_found = skills_correct = skills_expected = 0
+    for result, item in zip(results, items):
+        labels = item.resume.labels()
+        name = _normalize(result.get('name'))
+        if name:
+            names_found += 1
+            names_correct += name == _normalize(labels['name'])
+
+        predicted = {_normalize(skill) for skills in result.get('skills_by_category', {}).values()
+                     for skill in skills}
+        expected = {_normalize(skill) for skill in labels['skills']}
+        skills_found += len(predicted)
+        skills_correct += len(predicted & expected)
+        skills_expected += len(expected)
+
+    return {
+        'name': {'precision': _ratio(names_correct, names_found), 'recall': _ratio(names_correct, len(items))},
+        'skills': {'precision': _ratio(skills_correct, skills_found),
+                   'recall': _ratio(skills_correct, skills_expected)},
+    }
+
+
+def has_skill_label(nlp) -> bool:
+    """Whether a pipeline's entity recognizer predicts the SKILL label extract_skills_ner reads."""
+    return bool(nlp) and 'ner' in nlp.pipe_names and 'SKILL' in nlp.get_pipe('ner').labels
+
+
+def _unload_spacy_models() -> None:
+    for tier_name in parser.MODEL_TIERS:
+        model_registry.evict(f'spacy.{tier_name}')
+
+
+def evaluate_active_tier(items: List[PreparedResume], iterations: int = 3) -> Dict:
+    """Score and time the tier selected by the current settings over prepared resumes."""
+    tier_name = parser.get_model_tier_name()
+    tier = parser.MODEL_TIERS[tier_name]
+
+    rss_before = current_rss()
+    nlp = parser.get_nlp()
+    model_stats = model_registry.stats().get(f'spacy.{tier_name}', {})
+
+    results = [parser.parse_resume_file(item.pdf, 'resume.pdf') for item in items]
+    timings = []
+    for _ in range(iterations):
+        for item in items:
+            start = time.perf_counter()
+            parser.parse_resume_file(item.pdf, 'resume.pdf')
+            timings.append((time.perf_counter() - start) * 1000)
+
+    return {
+        'model': tier.model,
+        # A tier whose model is not installed silently runs on a blank pipeline
+        'pipeline': list(nlp.pipe_names) if nlp else [],
+        'name_ner': tier.name_ner,
+        'skills_ner': tier.skills_ner,
+        'skill_label': has_skill_label(nlp),
+        'accuracy': score_results(results, items),
+        'p50_ms': round(percentile(timings, 50), 3),
+        'p95_ms': round(percentile(timings, 95), 3),
+        'mean_ms': round(sum(timings) / len(timings), 3) if timings else 0.0,
+        'model_load_seconds': model_stats.get('load_seconds', 0.0),
+        'model_memory_bytes': model_stats.get('memory_bytes', 0),
+        'rss_growth_bytes': max(current_rss() - rss_before, 0),
+    }
+
+
+def evaluate_tiers(tiers: Iterable[str], corpus_size: int = 24, seed: int = 1234,
+                   iterations: int = 3) -> Dict:
+    """
+    Evaluate each tier in turn and return the report as a JSON-ready dict.
+
+    Tiers are switched with Django's override_settings, and every spaCy model
+    is unloaded between tiers so each one's memory is measured from the same
+    starting point.
+    """
+    from django.test.utils import override_settings
+
+    items = [PreparedResume(resume) for resume in generate_corpus(corpus_size, seed)]
+    parser.get_skill_matcher()
+
+    cache_enabled = parse_cache.enabled
+    parse_cache.enabled = False
+    try:
+        report = {}
+        for tier_name in tiers:
+            if tier_name not in parser.MODEL_TIERS:
+                raise ValueError(f"Unknown model tier {tier_name!r}")
+            _unload_spacy_models()
+            with override_settings(RESUME_PARSER_MODEL_TIER=tier_name):
+                report[tier_name] = evaluate_active_tier(items, iterations)
+        _unload_spacy_models()
+    finally:
+        parse_cache.enabled = cache_enabled
+
+    return {
+        'meta': {
+            'parser_version': parser.PARSER_VERSION,
+            'corpus_size': corpus_size,
+            'seed': seed,
+            'iterations': iterations,
+        },
+        'tiers': report,
+    }
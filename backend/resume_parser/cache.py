@@ -0,0 +1,247 @@
+"""
+Content-addressed cache for resume parse results.
+
+Results are keyed by a SHA-256 of the uploaded file bytes, the file type and
+the parser version, so a re-uploaded resume is answered without running text
+extraction or any NLP model, and a parser upgrade never serves stale output.
+
+There are two tiers: a per-process LRU held in memory and an on-disk tier
+shared by every worker on the machine. Both are bounded by size.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from .conf import get_setting
+
+
+class ParseCache:
+    """Two-tier (memory LRU + shared disk) cache of parse results."""
+
+    def __init__(self, memory_max_entries: Optional[int] = None, memory_max_bytes: Optional[int] = None,
+                 disk_dir: Optional[str] = None, disk_max_bytes: Optional[int] = None,
+                 enabled: Optional[bool] = None):
+        self._enabled = enabled
+        self._memory_max_entries = memory_max_entries
+        self._memory_max_bytes = memory_max_bytes
+        self._disk_dir = disk_dir
+        self._disk_max_bytes = disk_max_bytes
+        self._memory: 'OrderedDict[str, str]' = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_bytes = None  # Computed lazily from the directory contents
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        if self._enabled is not None:
+            return self._enabled
+        return bool(get_setting('RESUME_PARSER_CACHE_ENABLED'))
+
+    @enabled.setter
+    def enabled(self, value: Optional[bool]) -> None:
+        """Force the cache on or off; None defers to RESUME_PARSER_CACHE_ENABLED."""
+        self._enabled = value
+
+    @property
+    def memory_max_entries(self) -> int:
+        if self._memory_max_entries is not None:
+            return self._memory_max_entries
+        return int(get_setting('RESUME_PARSER_CACHE_MEMORY_ENTRIES'))
+
+    @property
+    def memory_max_bytes(self) -> int:
+        if self._memory_max_bytes is not None:
+            return self._memory_max_bytes
+        return int(get_setting('RESUME_PARSER_CACHE_MEMORY_BYTES'))
+
+    @property
+    def disk_dir(self) -> Optional[str]:
+        if self._disk_dir is not None:
+            return self._disk_dir
+        configured = get_setting('RESUME_PARSER_CACHE_DIR')
+        if configured is None:
+            return os.path.join(tempfile.gettempdir(), 'talentlink-resume-cache')
+        return configured or None  # An empty string disables the disk tier
+
+    @property
+    def disk_max_bytes(self) -> int:
+        if self._disk_max_bytes is not None:
+            return self._disk_max_bytes
+        return int(get_setting('RESUME_PARSER_CACHE_DISK_BYTES'))
+
+    @staticmethod
+    def make_key(data, file_type: str, parser_version: str) -> str:
+        """Return the cache key for the given file contents."""
+        digest = hashlib.sha256()
+        digest.update(f'{parser_version}\0{file_type.lower()}\0'.encode())
+        digest.update(data)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Return a fresh copy of the cached result, or None on a miss."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            payload = self._memory.get(key)
+            if payload is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+        if payload is None:
+            payload = self._read_disk(key)
+            with self._lock:
+                if payload is None:
+                    self.misses += 1
+                    return None
+                self.disk_hits += 1
+                self._remember(key, payload)
+        return json.loads(payload)
+
+    def set(self, key: str, result: Dict) -> None:
+        """Store a result in both tiers."""
+        if not self.enabled:
+            return
+        payload = json.dumps(result, separators=(',', ':'))
+        with self._lock:
+            self._remember(key, payload)
+        self._write_disk(key, payload)
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+        directory = self.disk_dir
+        if directory and os.path.isdir(directory):
+            for path, _, _ in self._iter_disk_entries(directory):
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+        self._disk_bytes = 0
+
+    def stats(self) -> Dict:
+        """Return hit/miss counters and current tier sizes."""
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                'memory_hits': self.memory_hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': round((self.memory_hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'memory_entries': len(self._memory),
+                'memory_bytes': self._memory_bytes,
+                'disk_bytes': self._disk_bytes,
+            }
+
+    # Memory tier (callers hold self._lock)
+
+    def _remember(self, key: str, payload: str) -> None:
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+        self._memory[key] = payload
+        self._memory_bytes += len(payload)
+        while self._memory and (len(self._memory) > self.memory_max_entries
+                                or self._memory_bytes > self.memory_max_bytes):
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self.evictions += 1
+
+    # Disk tier
+
+    def _disk_path(self, key: str) -> Optional[str]:
+        directory = self.disk_dir
+        if not directory:
+            return None
+        return os.path.join(directory, key[:2], f'{key}.json')
+
+    def _read_disk(self, key: str) -> Optional[str]:
+        path = self._disk_path(key)
+        if path is None:
+            return None
+        try:
+            with open(path, encoding='utf-8') as cached:
+                payload = cached.read()
+            # Touch the entry so disk eviction removes the least recently used first
+            os.utime(path)
+            return payload
+        except OSError:
+            return None
+
+    def _write_disk(self, key: str, payload: str) -> None:
+        path = self._disk_path(key)
+        if path is None:
+            return
+        tmp_path = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temp file and rename so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as tmp:
+                tmp.write(payload)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Warning: Could not write resume cache entry: {str(e)}")
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+            return
+
+        if self._disk_bytes is None:
+            self._disk_bytes = sum(size for _, size, _ in self._iter_disk_entries(self.disk_dir))
+        else:
+            self._disk_bytes += len(payload)
+        if self._disk_bytes > self.disk_max_bytes:
+            self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        """Remove least recently used disk entries until under 90% of the budget."""
+        directory = self.disk_dir
+        entries = sorted(self._iter_disk_entries(directory), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        target = self.disk_max_bytes * 0.9
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            try:
+                os.unlink(path)
+                total -= size
+                self.evictions += 1
+            except OSError:
+                pass
+        self._disk_bytes = total
+
+    @staticmethod
+    def _iter_disk_entries(directory: str):
+        """Yield (path, size, mtime) for every cache file under directory."""
+        try:
+            shards = os.scandir(directory)
+        except OSError:
+            return
+        with shards:
+            for shard in shards:
+                if not shard.is_dir():
+                    continue
+                with os.scandir(shard.path) as files:
+                    for entry in files:
+                        if entry.name.endswith('.json'):
+                            try:
+                                stat = entry.stat()
+                            except OSError:
+                                continue
+                            yield entry.path, stat.st_size, stat.st_mtime
+
+
+# Process-wide cache used by parse_resume_file
+parse_cache = ParseCache()
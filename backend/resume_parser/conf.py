@@ -0,0 +1,79 @@
+"""
+Settings access for the resume parser.
+
+The parser also runs outside a configured Django project (worker processes,
+benchmarks), so every setting it reads has a default defined here.
+"""
+import os
+
+DEFAULTS = {
+    # Seconds a model may sit unused before the registry unloads it (0 disables eviction)
+    'RESUME_PARSER_MODEL_TTL': 1800,
+    'RESUME_PARSER_MODEL_TIER': 'lg',  # lg, md, sm or rules-only
+    'RESUME_PARSER_PRELOAD': False,  # Warm the models up when the WSGI app is loaded
+    # Skill taxonomy data file; None uses data/skills_taxonomy.json
+    'RESUME_PARSER_TAXONOMY_PATH': None,
+    'RESUME_PARSER_TAXONOMY_CHECK_SECONDS': 30,  # How often to look for changes (0 disables reloads)
+    # Parse result cache
+    'RESUME_PARSER_CACHE_ENABLED': True,
+    'RESUME_PARSER_CACHE_MEMORY_ENTRIES': 256,
+    'RESUME_PARSER_CACHE_MEMORY_BYTES': 16 * 1024 * 1024,
+    'RESUME_PARSER_CACHE_DIR': None,  # None uses a directory under the system temp dir
+    'RESUME_PARSER_CACHE_DISK_BYTES': 256 * 1024 * 1024,
+    # Batch parsing
+    'RESUME_PARSER_BATCH_SIZE': 16,
+    'RESUME_PARSER_BATCH_MAX_FILES': 500,
+    'RESUME_PARSER_MAX_FILE_BYTES': 5 * 1024 * 1024,
+    # Text extraction budget
+    'RESUME_PARSER_PDF_MAX_PAGES': 20,
+    'RESUME_PARSER_MAX_TEXT_CHARS': 100000,
+    'RESUME_PARSER_PDF_WORKERS': 1,  # Threads per PDF, for backends that release the GIL
+    # PDF backend: a name from pdf_backends.PDF_BACKENDS, or 'auto' for the benchmarked choice
+    'RESUME_PARSER_PDF_BACKEND': 'auto',
+    'RESUME_PARSER_PDF_BACKEND_FILE': None,  # None uses a file under the system temp dir
+    # Semantic skill matching
+    'RESUME_PARSER_SEMANTIC_MATCHING': False,
+    'RESUME_PARSER_SEMANTIC_MODEL': 'all-MiniLM-L6-v2',
+    'RESUME_PARSER_SEMANTIC_THRESHOLD': 0.75,
+    'RESUME_PARSER_SEMANTIC_TOP_K': 2,
+    'RESUME_PARSER_SEMANTIC_MAX_CANDIDATES': 256,
+    'RESUME_PARSER_EMBEDDINGS_DIR': None,  # None uses a directory under the system temp dir
+    # Per-stage instrumentation
+    'RESUME_PARSER_METRICS_HOOKS': [],  # Dotted paths of callables that receive each parse trace
+    'RESUME_PARSER_SLOW_PARSE_MS': 2000,
+    # Time budget for /api/resume/parse/ requests in milliseconds (0 disables)
+    'RESUME_PARSER_REQUEST_BUDGET_MS': 0,
+    # Admission control for /api/resume/parse/, shared by every process on the machine
+    'RESUME_PARSER_MAX_CONCURRENT_PARSES': 0,  # 0 uses RESUME_PARSER_WORKERS, or one per CPU
+    'RESUME_PARSER_MAX_QUEUED_PARSES': 8,
+    'RESUME_PARSER_QUEUE_TIMEOUT': 10,  # Seconds a request may wait for a parse slot
+    'RESUME_PARSER_ADMISSION_DIR': None,  # Slot lock files; None uses a directory under the system temp dir
+    # Asynchronous parse jobs
+    'RESUME_PARSER_JOBS_INLINE_WORKER': False,  # Drain the queue on a thread in the web process (development only)
+    'RESUME_PARSER_JOB_STALE_SECONDS': 600,
+    'RESUME_PARSER_JOB_MAX_ATTEMPTS': 3,
+    'RESUME_PARSER_MAX_QUEUED_JOBS': 200,  # Queued uploads, whose bytes sit in the database (0 disables)
+    # Dedicated parser worker pool (manage.py run_parser_pool)
+    'RESUME_PARSER_POOL_ADDRESS': None,  # Unix socket path; None parses in the request thread
+    'RESUME_PARSER_POOL_AUTHKEY': None,  # Shared secret for the pool socket; the pool will not start without it
+    'RESUME_PARSER_WORKERS': 0,  # 0 uses one worker per CPU
+    'RESUME_PARSER_WORKER_MAX_JOBS': 500,
+    'RESUME_PARSER_WORKER_MAX_RSS_MB': 2048,
+    'RESUME_PARSER_WORKER_TIMEOUT': 60,
+    'RESUME_PARSER_WORKER_START_METHOD': 'spawn',
+}
+
+
+def get_setting(name):
+    """Return a resume parser setting from Django settings, falling back to the default."""
+    default = DEFAULTS[name]
+    try:
+        from django.conf import settings
+    except ImportError:
+        return default
+    try:
+        if settings.configured or os.environ.get('DJANGO_SETTINGS_MODULE'):
+            return getattr(settings, name, default)
+    except Exception:
+        pass
+    return default
@@ -0,0 +1,135 @@
+"""
+Single-pass contact extraction.
+
+Email, phone and name candidates are collected in one scan over the header
+lines of a resume with precompiled patterns. The rest of the text is only
+searched for an email or phone the header did not contain, and spaCy is only
+consulted for the name when no header pattern produced one.
+"""
+import re
+from typing import Callable, Dict, Optional
+
+from .deadline import optional_stage
+
+HEADER_LINES = 10
+
+EMAIL_PATTERN = re.compile(r'[a-z0-9._%+-]+@[a-z0-9.-]+\.[a-z]{2,}', re.IGNORECASE)
+# Separators are spaces or dashes only, so a number never spans two lines
+PHONE_PATTERN = re.compile(r'\+?\d{1,3}[-\t ]?\(?\d{2,4}\)?[-\t ]?\d{3,4}[-\t ]?\d{3,4}')
+_NON_PHONE_CHARS = re.compile(r'[^0-9+]')
+
+_NAME_WORDS = r'([A-Z][a-z]+(?:[ \t]+[A-Z][a-z]+){1,3})'
+LABELED_NAME_PATTERN = re.compile(r'name[ \t]*[:-]?[ \t]*' + _NAME_WORDS, re.IGNORECASE)
+NAME_LINE_PATTERN = re.compile(r'[ \t]*' + _NAME_WORDS + r'[ \t]*(?:,|$)', re.IGNORECASE)
+
+# Header lines containing these are never a bare name
+NAME_SKIP_WORDS = ('resume', 'cv', 'curriculum', 'vitae', '@', 'email', 'phone', 'address', 'http', 'www')
+
+
+def normalize_phone(match: str) -> Optional[str]:
+    """Normalize a phone pattern match, or return None if it is not a usable number."""
+    phone = _NON_PHONE_CHARS.sub('', match)
+    if phone.startswith('+'):
+        return phone
+    if len(phone) == 10:
+        return f"{phone[:3]}-{phone[3:6]}-{phone[6:]}"
+    if len(phone) > 10:
+        return phone
+    return None
+
+
+def _first_phone(text: str) -> Optional[str]:
+    for match in PHONE_PATTERN.finditer(text):
+        phone = normalize_phone(match.group())
+        if phone:
+            return phone
+    return None
+
+
+class ContactScan:
+    """Contact details and name candidates found in one pass over a resume."""
+
+    def __init__(self, header: str):
+        self.header = header
+        self.email: Optional[str] = None
+        self.phone: Optional[str] = None
+        self.labeled_name: Optional[str] = None  # "Name: Jane Doe"
+        self.first_line_name: Optional[str] = None  # A name alone on the first line
+        self.fallback_name: Optional[str] = None  # First name-like header line
+
+    def pattern_name(self) -> Optional[str]:
+        return self.labeled_name or self.first_line_name
+
+
+def scan_contact(text: str) -> ContactScan:
+    """Scan the header lines once, then the body only for what is still missing."""
+    lines = text.split('\n', HEADER_LINES)
+    body = lines.pop() if len(lines) > HEADER_LINES else ''
+    scan = ContactScan('\n'.join(lines))
+
+    for index, line in enumerate(lines):
+        lowered = line.lower()
+        if scan.email is None and '@' in line:
+            match = EMAIL_PATTERN.search(line)
+            if match:
+                scan.email = match.group().lower()
+        if scan.phone is None:
+            scan.phone = _first_phone(line)
+        if scan.labeled_name is None and 'name' in lowered:
+            match = LABELED_NAME_PATTERN.search(line)
+            if match:
+                scan.labeled_name = match.group(1).strip()
+        if any(skip in lowered for skip in NAME_SKIP_WORDS):
+            continue
+        if index == 0:
+            match = NAME_LINE_PATTERN.match(line)
+            if match:
+                scan.first_line_name = match.group(1).strip()
+        if scan.fallback_name is None:
+            words = [word for word in line.split() if word.isalpha()]
+            if 2 <= len(words) <= 4 and all(word[0].isupper() for word in words):
+                scan.fallback_name = ' '.join(words)
+
+    if scan.email is None and '@' in body:
+        match = EMAIL_PATTERN.search(body)
+        if match:
+            scan.email = match.group().lower()
+    if scan.phone is None and body:
+        scan.phone = _first_phone(body)
+    return scan
+
+
+def resolve_name(scan: ContactScan, load_nlp: Optional[Callable] = None, doc=None) -> Optional[str]:
+    """
+    Pick the name from a scan: header patterns first, then spaCy PERSON
+    entities within the header, then the first name-like header line.
+
+    ``doc`` is a spaCy Doc of the resume text. Without one, the pipeline
+    returned by ``load_nlp`` is run over the header only, and only when the
+    header patterns found nothing, so the model is never loaded needlessly.
+    """
+    name = scan.pattern_name()
+    if name:
+        return name
+
+    if doc is None and load_nlp is not None:
+        nlp = load_nlp()
+        if nlp:
+            with optional_stage('name_ner'):
+                doc = nlp(scan.header)
+    if doc is not None:
+        for ent in doc.ents:
+            if ent.start_char >= len(scan.header):
+                break
+            if ent.label_ == 'PERSON':
+                name = ent.text.strip()
+                if len(name.split()) >= 2:
+                    return name
+
+    return scan.fallback_name
+
+
+def extract_contact(text: str, load_nlp: Optional[Callable] = None, doc=None) -> Dict[str, Optional[str]]:
+    """Return the name, email and phone of a resume."""
+    scan = scan_contact(text)
+    return {'name': resolve_name(scan, load_nlp, doc), 'email': scan.email, 'phone': scan.phone}
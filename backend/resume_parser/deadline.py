@@ -0,0 +1,114 @@
+"""
+Time budgets for resume parsing.
+
+``parse_resume_file(..., budget_ms=...)`` opens a deadline for the parse.
+Optional stages (spaCy NER, name NER, semantic matching) ask ``allows()``
+before they start and are skipped when the time left is less than the stage
+usually takes. A cold spaCy model load is a stage of its own ('model_load'),
+checked after the stage that needs the model. PDF extraction stops reading
+further pages once the deadline has passed. Skipped stages are listed in
+the result's ``degraded`` field, so a slow document costs at most the budget
+plus one stage, and still returns the rule-based output.
+
+Expected stage costs are a moving average of recent runs in this process.
+Outside an open deadline every check passes and costs only a context
+variable lookup.
+"""
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+_current_deadline: 'contextvars.ContextVar[Optional[Deadline]]' = contextvars.ContextVar(
+    'resume_parser_deadline', default=None
+)
+
+# Weight of the newest run in the per-stage cost average
+_COST_SMOOTHING = 0.2
+_stage_costs: Dict[str, float] = {}
+_costs_lock = threading.Lock()
+
+
+def expected_cost_ms(stage: str) -> float:
+    """Recent average duration of a stage in this process (0 until it has run)."""
+    return _stage_costs.get(stage, 0.0)
+
+
+def record_cost(stage: str, elapsed_ms: float) -> None:
+    with _costs_lock:
+        previous = _stage_costs.get(stage)
+        _stage_costs[stage] = elapsed_ms if previous is None else (
+            previous + _COST_SMOOTHING * (elapsed_ms - previous)
+        )
+
+
+class Deadline:
+    """A point in time a parse should finish by, and the stages skipped to meet it."""
+
+    def __init__(self, budget_ms: float):
+        self.budget_ms = budget_ms
+        self.expires_at = time.monotonic() + budget_ms / 1000
+        self.skipped: List[str] = []
+
+    def remaining_ms(self) -> float:
+        return (self.expires_at - time.monotonic()) * 1000
+
+    def expired(self) -> bool:
+        return self.remaining_ms() <= 0
+
+    def skip(self, stage: str) -> None:
+        if stage not in self.skipped:
+            self.skipped.append(stage)
+
+    def allows(self, stage: str) -> bool:
+        """True if there is time left for ``stage``; otherwise records it as skipped."""
+        if self.remaining_ms() > expected_cost_ms(stage):
+            return True
+        self.skip(stage)
+        return False
+
+
+@contextmanager
+def deadline(budget_ms: Optional[float]):
+    """Open a deadline for the enclosed parse; yields None when no budget is given."""
+    if not budget_ms or budget_ms <= 0:
+        yield None
+        return
+    current = Deadline(budget_ms)
+    token = _current_deadline.set(current)
+    try:
+        yield current
+    finally:
+        _current_deadline.reset(token)
+
+
+def allows(stage: str) -> bool:
+    """True if the active deadline leaves time for ``stage`` (always True without one)."""
+    current = _current_deadline.get()
+    return current is None or current.allows(stage)
+
+
+def expired(stage: str) -> bool:
+    """True once the active deadline has passed, recording ``stage`` as cut short."""
+    current = _current_deadline.get()
+    if current is None or not current.expired():
+        return False
+    current.skip(stage)
+    return True
+
+
+@contextmanager
+def optional_stage(stage: str):
+    """Time the enclosed optional stage so later deadlines know what it costs."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_cost(stage, (time.perf_counter() - start) * 1000)
+
+
+def skipped_stages() -> List[str]:
+    """Stages the active deadline has skipped so far (empty without one)."""
+    current = _current_deadline.get()
+    return list(current.skipped) if current is not None else []
@@ -0,0 +1,123 @@
+"""
+Streaming text extraction for DOCX files.
+
+python-docx builds the whole object model of a document only to read
+``paragraph.text``, and never looks at tables, headers, footers or text
+boxes, which is where templated CVs often keep contact details and skills.
+This extractor iterparses the WordprocessingML parts straight out of the zip
+and yields one line per paragraph in document order. Each table row is
+yielded as one line with its cells separated by tabs.
+Parsed elements are discarded as soon as they are emitted, so memory stays
+flat however long the document is.
+"""
+import re
+import zipfile
+from typing import Iterator, List
+from xml.etree.ElementTree import iterparse
+
+W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+MC_FALLBACK = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+
+_PARAGRAPH = W + 'p'
+_TEXT = W + 't'
+_TAB = W + 'tab'
+_BREAKS = (W + 'br', W + 'cr')
+_HYPHEN = W + 'noBreakHyphen'
+_ROW = W + 'tr'
+_CELL = W + 'tc'
+_BODY = W + 'body'
+
+_HEADER_PART = re.compile(r'word/header(\d*)\.xml$')
+_FOOTER_PART = re.compile(r'word/footer(\d*)\.xml$')
+
+
+def _numbered_parts(names: List[str], pattern) -> List[str]:
+    parts = [(int(match.group(1) or 0), name) for name in names for match in [pattern.match(name)] if match]
+    return [name for _, name in sorted(parts)]
+
+
+def docx_text_parts(archive: zipfile.ZipFile) -> List[str]:
+    """Return the parts holding document text: headers, then the body, then footers."""
+    names = archive.namelist()
+    return (_numbered_parts(names, _HEADER_PART)
+            + [name for name in ('word/document.xml',) if name in names]
+            + _numbered_parts(names, _FOOTER_PART))
+
+
+def iter_part_lines(stream) -> Iterator[str]:
+    """Yield the paragraphs and table rows of one WordprocessingML part in document order."""
+    paragraphs: List[List[str]] = []  # Open paragraphs; text boxes nest them
+    cells: List[List[str]] = []  # Lines of the open table cells
+    rows: List[List[str]] = []  # Cell texts of the open table rows
+    fallback_depth = 0  # Inside mc:Fallback, which repeats the mc:Choice content
+    container = None  # The element finished paragraphs and tables pile up in
+
+    for event, elem in iterparse(stream, events=('start', 'end')):
+        tag = elem.tag
+        if event == 'start':
+            if container is None or tag == _BODY:
+                container = elem
+            if tag == MC_FALLBACK:
+                fallback_depth += 1
+            elif fallback_depth:
+                continue
+            elif tag == _PARAGRAPH:
+                paragraphs.append([])
+            elif tag == _ROW:
+                rows.append([])
+            elif tag == _CELL:
+                cells.append([])
+            continue
+
+        if tag == MC_FALLBACK:
+            fallback_depth -= 1
+            elem.clear()
+            continue
+        if fallback_depth:
+            continue
+
+        line = None
+        if tag == _TEXT:
+            if paragraphs and elem.text:
+                paragraphs[-1].append(elem.text)
+        elif tag == _TAB:
+            if paragraphs:
+                paragraphs[-1].append('\t')
+        elif tag in _BREAKS:
+            if paragraphs:
+                paragraphs[-1].append('\n')
+        elif tag == _HYPHEN:
+            if paragraphs:
+                paragraphs[-1].append('-')
+        elif tag == _PARAGRAPH:
+            line = ''.join(paragraphs.pop())
+            elem.clear()
+        elif tag == _CELL:
+            cell = cells.pop()
+            if rows:
+                rows[-1].append('\n'.join(cell))
+            elem.clear()
+        elif tag == _ROW:
+            line = '\t'.join(rows.pop())
+            elem.clear()
+        else:
+            continue
+
+        if line is None:
+            continue
+        if cells:
+            # Lines inside a table cell belong to the cell, not the output
+            cells[-1].append(line)
+            continue
+        yield line
+        # Everything parsed so far has been emitted, so the tree can be dropped
+        if container is not None:
+            container.clear()
+
+
+def iter_docx_lines(docx_file) -> Iterator[str]:
+    """Yield the text lines of a DOCX file (path or seekable file object)."""
+    with zipfile.ZipFile(docx_file) as archive:
+        for part in docx_text_parts(archive):
+            with archive.open(part) as stream:
+                yield from iter_part_lines(stream)
@@ -0,0 +1,174 @@
+"""
+Per-stage spans for resume parsing.
+
+``parse_resume_file`` opens a trace and wraps each stage (text extraction,
+spaCy, contact extraction, each skill matcher) in ``stage()``. Every span
+records wall time, CPU time, input size and allocated memory. Finished traces
+are handed to metrics hooks, registered with ``register_metrics_hook`` or
+listed as dotted paths in RESUME_PARSER_METRICS_HOOKS, and can be returned
+to the caller as a ``timings`` block.
+
+Memory is measured with tracemalloc when it is already tracing, and as the
+change in resident set size otherwise. Stages outside an open trace cost
+nothing beyond a context variable lookup.
+"""
+import contextvars
+import importlib
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+from .conf import get_setting
+from .model_registry import current_rss
+
+_current_trace: 'contextvars.ContextVar[Optional[Trace]]' = contextvars.ContextVar(
+    'resume_parser_trace', default=None
+)
+
+_hooks: List[Callable] = []
+_settings_hooks: Optional[List[Callable]] = None
+_hooks_lock = threading.Lock()
+
+
+class Span:
+    """Resource usage of one parse stage."""
+
+    __slots__ = ('name', 'duration_ms', 'cpu_ms', 'input_size', 'memory_bytes')
+
+    def __init__(self, name: str, duration_ms: float, cpu_ms: float,
+                 input_size: Optional[int], memory_bytes: int):
+        self.name = name
+        self.duration_ms = duration_ms
+        self.cpu_ms = cpu_ms
+        self.input_size = input_size
+        self.memory_bytes = memory_bytes
+
+    def to_dict(self) -> Dict:
+        return {
+            'stage': self.name,
+            'duration_ms': round(self.duration_ms, 3),
+            'cpu_ms': round(self.cpu_ms, 3),
+            'input_size': self.input_size,
+            'memory_bytes': self.memory_bytes,
+        }
+
+
+class Trace:
+    """Spans collected during one parse, plus context passed on to hooks."""
+
+    def __init__(self, **context):
+        self.spans: List[Span] = []
+        self.context = context
+        self.started = time.perf_counter()
+        self.duration_ms = 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            'total_ms': round(self.duration_ms, 3),
+            'memory_source': 'tracemalloc' if tracemalloc.is_tracing() else 'rss',
+            'stages': [span.to_dict() for span in self.spans],
+        }
+
+
+def _memory_now() -> int:
+    if tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()[0]
+    return current_rss()
+
+
+@contextmanager
+def stage(name: str, input_size: Optional[int] = None):
+    """Record a span for the enclosed block in the active trace, if there is one."""
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+    memory_before = _memory_now()
+    cpu_before = time.process_time()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        # process_time covers every thread, so it overstates CPU for spans that
+        # overlap other work, but is exact for the usual one-parse-per-worker case
+        trace.spans.append(Span(
+            name,
+            (time.perf_counter() - started) * 1000,
+            (time.process_time() - cpu_before) * 1000,
+            input_size,
+            max(_memory_now() - memory_before, 0),
+        ))
+
+
+def tracing_active() -> bool:
+    return bool(_hooks) or bool(_load_settings_hooks())
+
+
+@contextmanager
+def trace(enabled: bool = True, **context):
+    """
+    Collect spans for the enclosed parse and report them to the metrics hooks.
+
+    Yields the Trace, or None when neither ``enabled`` nor any hook asks for
+    spans, in which case ``stage()`` stays a no-op.
+    """
+    if not (enabled or tracing_active()) or _current_trace.get() is not None:
+        yield None
+        return
+    current = Trace(**context)
+    token = _current_trace.set(current)
+    try:
+        yield current
+    finally:
+        _current_trace.reset(token)
+        current.duration_ms = (time.perf_counter() - current.started) * 1000
+        _emit(current)
+
+
+def register_metrics_hook(hook: Callable[[Trace], None]) -> None:
+    """Call ``hook(trace)`` after every traced parse in this process."""
+    with _hooks_lock:
+        if hook not in _hooks:
+            _hooks.append(hook)
+
+
+def unregister_metrics_hook(hook: Callable[[Trace], None]) -> None:
+    with _hooks_lock:
+        if hook in _hooks:
+            _hooks.remove(hook)
+
+
+def _load_settings_hooks() -> List[Callable]:
+    """Import the hooks named in RESUME_PARSER_METRICS_HOOKS once per process."""
+    global _settings_hooks
+    if _settings_hooks is None:
+        hooks = []
+        for path in get_setting('RESUME_PARSER_METRICS_HOOKS') or ():
+            module_name, _, attr = path.rpartition('.')
+            try:
+                hooks.append(getattr(importlib.import_module(module_name), attr))
+            except (ImportError, AttributeError, ValueError) as e:
+                print(f"Warning: Could not load resume parser metrics hook {path}: {str(e)}")
+        _settings_hooks = hooks
+    return _settings_hooks
+
+
+def _emit(current: Trace) -> None:
+    with _hooks_lock:
+        hooks = list(_hooks)
+    for hook in hooks + _load_settings_hooks():
+        try:
+            hook(current)
+        except Exception as e:
+            # A broken metrics sink must never fail the parse itself
+            print(f"Warning: Resume parser metrics hook failed: {str(e)}")
+
+
+def log_slow_parses(current: Trace) -> None:
+    """Metrics hook that prints a stage breakdown for parses slower than RESUME_PARSER_SLOW_PARSE_MS."""
+    if current.duration_ms < get_setting('RESUME_PARSER_SLOW_PARSE_MS'):
+        return
+    breakdown = ', '.join(f'{span.name}={span.duration_ms:.0f}ms' for span in current.spans)
+    print(f"Slow resume parse ({current.duration_ms:.0f}ms) {current.context.get('filename', '')}: {breakdown}")
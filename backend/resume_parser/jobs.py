@@ -0,0 +1,220 @@
+"""
+Durable resume parse job queue backed by the project database.
+
+``POST /api/resume/parse/?async=1`` stores the upload as a ResumeParseJob
+and returns immediately, and every job application queues a parse of its
+stored resume the same way. Jobs are claimed with a conditional UPDATE, so any
+number of ``manage.py run_resume_jobs`` consumers can drain the queue without
+a separate broker. Every parse goes through the dedicated worker pool when
+one is configured.
+
+With RESUME_PARSER_JOBS_INLINE_WORKER (development only) the web process
+also drains the queue on a daemon thread. That thread dies with a recycled
+web worker, and its job is picked up again once it goes stale.
+"""
+import math
+import threading
+import time
+from datetime import timedelta
+from typing import Optional
+
+from django.db import close_old_connections, connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .admission import ParserOverloaded, admission
+from .conf import get_setting
+from .models import ResumeParseJob
+from .resume_parser import _error_result
+from .services import fill_application_from_resume
+from .worker_pool import dispatch_parse
+
+_background_worker = None
+_background_wakeup = False
+_background_lock = threading.Lock()
+
+
+def enqueue_parse(user, upload) -> ResumeParseJob:
+    """
+    Queue an uploaded resume for parsing and return the job.
+
+    Queued uploads keep their bytes in the database, so at most
+    RESUME_PARSER_MAX_QUEUED_JOBS of them wait at once; beyond that
+    ParserOverloaded is raised, like a synchronous parse that cannot be admitted.
+    """
+    max_queued = get_setting('RESUME_PARSER_MAX_QUEUED_JOBS')
+    if max_queued:
+        queued = ResumeParseJob.objects.filter(status=ResumeParseJob.STATUS_QUEUED, application__isnull=True).count()
+        if queued >= max_queued:
+            retry_after = max(1, math.ceil(queued * admission.service_seconds / admission.max_concurrent))
+            raise ParserOverloaded('Resume parse queue is full', retry_after)
+    upload.seek(0)
+    job = ResumeParseJob.objects.create(
+        user=user,
+        filename=upload.name,
+        upload=upload.read(),
+    )
+    _wake_worker()
+    return job
+
+
+def pending_application_job(application) -> Optional[ResumeParseJob]:
+    """Return the queued or running parse job of an application's resume, if there is one."""
+    return (ResumeParseJob.objects
+            .defer('upload')
+            .filter(application=application,
+                    status__in=(ResumeParseJob.STATUS_QUEUED, ResumeParseJob.STATUS_RUNNING))
+            .first())
+
+
+def enqueue_application_parse(application) -> Optional[ResumeParseJob]:
+    """
+    Queue a parse of an application's stored resume.
+
+    Returns None when the application has no resume or a parse of it is
+    already queued. The file is read by the worker, not here, so applying
+    does not wait on it.
+    """
+    if not application.resume or pending_application_job(application) is not None:
+        return None
+    job = ResumeParseJob.objects.create(
+        user=application.applicant,
+        application=application,
+        filename=application.resume.name[:255],
+    )
+    _wake_worker()
+    return job
+
+
+def try_enqueue_application_parse(application) -> Optional[ResumeParseJob]:
+    """enqueue_application_parse() for the apply views: a failure is logged, never raised."""
+    try:
+        return enqueue_application_parse(application)
+    except Exception as e:
+        print(f"Error queueing resume parse for application {application.id}: {str(e)}")
+        return None
+
+
+def _wake_worker() -> None:
+    if get_setting('RESUME_PARSER_JOBS_INLINE_WORKER'):
+        # Start draining only once the job row is visible to other connections
+        transaction.on_commit(start_background_worker)
+
+
+def requeue_stale_jobs() -> int:
+    """Return jobs whose worker died mid-parse to the queue, or fail them after too many attempts."""
+    cutoff = timezone.now() - timedelta(seconds=get_setting('RESUME_PARSER_JOB_STALE_SECONDS'))
+    stale = ResumeParseJob.objects.filter(status=ResumeParseJob.STATUS_RUNNING, started_at__lt=cutoff)
+    max_attempts = get_setting('RESUME_PARSER_JOB_MAX_ATTEMPTS')
+    stale.filter(attempts__gte=max_attempts).update(
+        status=ResumeParseJob.STATUS_FAILED,
+        result=_error_result(RuntimeError('Parse job did not finish')),
+        upload=b'',
+        finished_at=timezone.now(),
+    )
+    return stale.filter(attempts__lt=max_attempts).update(status=ResumeParseJob.STATUS_QUEUED)
+
+
+def claim_next_job() -> Optional[ResumeParseJob]:
+    """Atomically move the oldest queued job to running and return it."""
+    while True:
+        job_id = (ResumeParseJob.objects
+                  .filter(status=ResumeParseJob.STATUS_QUEUED)
+                  .order_by('created_at')
+                  .values_list('id', flat=True)
+                  .first())
+        if job_id is None:
+            return None
+        # Only one consumer can win the status transition for a given job
+        claimed = ResumeParseJob.objects.filter(id=job_id, status=ResumeParseJob.STATUS_QUEUED).update(
+            status=ResumeParseJob.STATUS_RUNNING,
+            started_at=timezone.now(),
+            attempts=F('attempts') + 1,
+        )
+        if claimed:
+            return ResumeParseJob.objects.get(id=job_id)
+
+
+def run_job(job: ResumeParseJob) -> ResumeParseJob:
+    """Parse a claimed job and store its result."""
+    try:
+        if job.application_id is not None:
+            result = _run_application_job(job)
+        else:
+            result = dispatch_parse(bytes(job.upload), job.filename)
+    except Exception as e:
+        print(f"Error running resume parse job {job.id}: {str(e)}")
+        result = _error_result(e)
+    result['filename'] = job.filename
+
+    job.result = result
+    job.status = ResumeParseJob.STATUS_DONE if result.get('success') else ResumeParseJob.STATUS_FAILED
+    job.upload = b''
+    job.finished_at = timezone.now()
+    job.save(update_fields=['result', 'status', 'upload', 'finished_at'])
+    return job
+
+
+def _run_application_job(job: ResumeParseJob) -> dict:
+    parsed = fill_application_from_resume(job.application)
+    if parsed is None:
+        raise ValueError("The application has no resume attached")
+    return {
+        'success': True,
+        'parsed_resume': parsed.id,
+        'message': 'Resume parsed and linked to the application.',
+    }
+
+
+def process_jobs(max_jobs: Optional[int] = None) -> int:
+    """Run queued jobs until the queue is empty or ``max_jobs`` have run."""
+    processed = 0
+    requeue_stale_jobs()
+    while max_jobs is None or processed < max_jobs:
+        job = claim_next_job()
+        if job is None:
+            break
+        run_job(job)
+        processed += 1
+    return processed
+
+
+def run_worker(poll_interval: float = 1.0) -> None:
+    """Process jobs forever, polling the queue when it is empty."""
+    while True:
+        close_old_connections()
+        if not process_jobs():
+            time.sleep(poll_interval)
+
+
+def start_background_worker() -> None:
+    """Drain the queue on a daemon thread in this process, if one is not already running."""
+    global _background_worker, _background_wakeup
+    with _background_lock:
+        _background_wakeup = True
+        if _background_worker is not None:
+            return
+        _background_worker = threading.Thread(
+            target=_drain_queue, name='resume-parse-jobs', daemon=True
+        )
+        _background_worker.start()
+
+
+def _drain_queue() -> None:
+    global _background_worker, _background_wakeup
+    try:
+        while True:
+            with _background_lock:
+                _background_wakeup = False
+            process_jobs()
+            with _background_lock:
+                # A job queued while we were finishing is picked up by another pass
+                if not _background_wakeup:
+                    _background_worker = None
+                    return
+    except Exception as e:
+        print(f"Resume parse job worker stopped: {str(e)}")
+        with _background_lock:
+            _background_worker = None
+    finally:
+        connections.close_all()
@@ -0,0 +1,53 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from career_portal.models import JobApplication
+from resume_parser.jobs import enqueue_application_parse
+from resume_parser.services import applications_needing_parse, fill_application_from_resume
+
+
+class Command(BaseCommand):
+    help = 'Parse the resumes of existing job applications that have no current stored parse'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=100, help='Applications loaded per batch')
+        parser.add_argument('--limit', type=int, help='Stop after this many applications')
+        parser.add_argument('--pause', type=float, default=0.0, help='Seconds to sleep between batches')
+        parser.add_argument('--enqueue', action='store_true',
+                            help='Queue parse jobs for the job workers instead of parsing here')
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options['batch_size'])
+        limit = options['limit']
+        pending = applications_needing_parse(JobApplication.objects.all())
+        processed = failed = 0
+        last_id = 0
+
+        while limit is None or processed < limit:
+            # Keyset pagination keeps each batch query cheap however far the backfill has got
+            size = batch_size if limit is None else min(batch_size, limit - processed)
+            batch = list(pending.filter(pk__gt=last_id)
+                         .select_related('applicant', 'parsed_resume')
+                         .order_by('pk')[:size])
+            if not batch:
+                break
+
+            for application in batch:
+                last_id = application.pk
+                processed += 1
+                try:
+                    if options['enqueue']:
+                        enqueue_application_parse(application)
+                    else:
+                        fill_application_from_resume(application)
+                except Exception as e:
+                    failed += 1
+                    self.stderr.write(f'Application {application.pk}: {str(e)}')
+
+            self.stdout.write(f'Processed {processed} application(s), {failed} failed')
+            if options['pause']:
+                time.sleep(options['pause'])
+
+        verb = 'Queued' if options['enqueue'] else 'Parsed'
+        self.stdout.write(self.style.SUCCESS(f'{verb} {processed - failed} application resume(s), {failed} failed'))
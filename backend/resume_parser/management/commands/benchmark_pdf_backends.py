@@ -0,0 +1,46 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from resume_parser.benchmarks.pdf_backends import choose_backend, run_pdf_backend_benchmark
+from resume_parser.pdf_backends import PDF_BACKENDS, save_backend_choice
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the PDF extraction backends and store the fastest accurate one for RESUME_PARSER_PDF_BACKEND=auto'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--backends', nargs='+', choices=list(PDF_BACKENDS),
+                            help='Backends to compare (default: all installed)')
+        parser.add_argument('--corpus-size', type=int, default=24, help='Number of synthetic resumes')
+        parser.add_argument('--seed', type=int, default=1234, help='Seed for the corpus generator')
+        parser.add_argument('--iterations', type=int, default=3, help='Timed passes over the corpus per backend')
+        parser.add_argument('--min-accuracy', type=float, default=0.98,
+                            help='Smallest mean line recall a backend needs to be chosen')
+        parser.add_argument('--dry-run', action='store_true', help='Report the choice without storing it')
+        parser.add_argument('--json', action='store_true', help='Print the JSON report instead of a table')
+
+    def handle(self, *args, **options):
+        report = run_pdf_backend_benchmark(options['corpus_size'], options['seed'], options['iterations'],
+                                           options['backends'])
+        chosen = choose_backend(report, options['min_accuracy'])
+        report['chosen'] = chosen
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2, sort_keys=True))
+        else:
+            self.stdout.write(f"{'backend':<11}{'line recall':>13}{'word recall':>13}{'p50 ms':>10}{'p95 ms':>10}")
+            for name, result in report['backends'].items():
+                if not result['available']:
+                    self.stdout.write(f"{name:<11}{'not installed':>13}")
+                    continue
+                self.stdout.write(f"{name:<11}{result['line_recall']:>13.4f}{result['word_recall']:>13.4f}"
+                                  f"{result['p50_ms']:>10.1f}{result['p95_ms']:>10.1f}")
+
+        if chosen is None:
+            raise CommandError(f"No installed backend reached a line recall of {options['min_accuracy']}")
+        if options['dry_run']:
+            self.stdout.write(f'Fastest accurate backend: {chosen} (not stored)')
+            return
+        path = save_backend_choice(chosen, report)
+        self.stdout.write(self.style.SUCCESS(f'Chose {chosen}; stored in {path}'))
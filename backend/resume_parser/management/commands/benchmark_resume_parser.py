@@ -0,0 +1,43 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from resume_parser.benchmarks.runner import compare_to_baseline, load_report, run_benchmarks, save_report
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the resume parser stages on a synthetic PDF/DOCX corpus'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--corpus-size', type=int, default=24, help='Number of synthetic resumes')
+        parser.add_argument('--seed', type=int, default=1234, help='Seed for the corpus generator')
+        parser.add_argument('--iterations', type=int, default=3, help='Timed passes over the corpus per stage')
+        parser.add_argument('--output', help='Write the JSON report to this file instead of stdout')
+        parser.add_argument('--baseline', help='Compare the run against this stored report')
+        parser.add_argument('--save-baseline', help='Store the report as a new baseline at this path')
+        parser.add_argument('--tolerance', type=float, default=0.25,
+                            help='Allowed fractional slowdown before a stage counts as regressed')
+
+    def handle(self, *args, **options):
+        report = run_benchmarks(options['corpus_size'], options['seed'], options['iterations'])
+
+        if options['output']:
+            save_report(report, options['output'])
+            self.stdout.write(f"Wrote benchmark report to {options['output']}")
+        else:
+            self.stdout.write(json.dumps(report, indent=2, sort_keys=True))
+
+        if options['save_baseline']:
+            save_report(report, options['save_baseline'])
+            self.stdout.write(f"Saved baseline to {options['save_baseline']}")
+
+        if options['baseline']:
+            regressions = compare_to_baseline(report, load_report(options['baseline']), options['tolerance'])
+            for regression in regressions:
+                self.stderr.write(
+                    f"{regression['stage']} {regression['metric']}: "
+                    f"{regression['baseline']} -> {regression['current']} (+{regression['change']:.0%})"
+                )
+            if regressions:
+                raise CommandError(f'{len(regressions)} benchmark metric(s) regressed against the baseline')
+            self.stdout.write(self.style.SUCCESS('No regressions against the baseline'))
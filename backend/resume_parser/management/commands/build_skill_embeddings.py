@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from resume_parser.resume_parser import SKILL_DB
+from resume_parser.semantic import load_skill_embeddings
+
+
+class Command(BaseCommand):
+    help = 'Embed the skill taxonomy once and persist the matrix used by semantic skill matching'
+
+    def handle(self, *args, **options):
+        embeddings = load_skill_embeddings(SKILL_DB)
+        rows, dims = embeddings.matrix.shape
+        self.stdout.write(f'Skill embedding matrix ready: {rows} skills x {dims} dimensions')
@@ -0,0 +1,52 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from resume_parser.benchmarks.runner import save_report
+from resume_parser.benchmarks.tiers import evaluate_tiers
+from resume_parser.resume_parser import MODEL_TIERS
+
+
+class Command(BaseCommand):
+    help = 'Compare name/skill accuracy, latency and memory of the spaCy model tiers on the labeled corpus'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tiers', nargs='+', default=list(MODEL_TIERS), choices=list(MODEL_TIERS),
+                            help='Tiers to evaluate (default: all)')
+        parser.add_argument('--corpus-size', type=int, default=24, help='Number of synthetic resumes')
+        parser.add_argument('--seed', type=int, default=1234, help='Seed for the corpus generator')
+        parser.add_argument('--iterations', type=int, default=3, help='Timed passes over the corpus per tier')
+        parser.add_argument('--output', help='Also write the JSON report to this file')
+        parser.add_argument('--json', action='store_true', help='Print the JSON report instead of a table')
+
+    def handle(self, *args, **options):
+        try:
+            report = evaluate_tiers(options['tiers'], options['corpus_size'], options['seed'],
+                                    options['iterations'])
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        if options['output']:
+            save_report(report, options['output'])
+            self.stdout.write(f"Wrote tier report to {options['output']}")
+
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2, sort_keys=True))
+            return
+
+        self.stdout.write(f"{'tier':<11}{'name P/R':>14}{'skills P/R':>14}{'p50 ms':>10}"
+                          f"{'p95 ms':>10}{'model MB':>10}")
+        for tier_name, row in report['tiers'].items():
+            name, skills = row['accuracy']['name'], row['accuracy']['skills']
+            self.stdout.write(
+                f"{tier_name:<11}"
+                f"{name['precision']:>7.2f}/{name['recall']:<6.2f}"
+                f"{skills['precision']:>7.2f}/{skills['recall']:<6.2f}"
+                f"{row['p50_ms']:>10.1f}{row['p95_ms']:>10.1f}"
+                f"{row['model_memory_bytes'] / (1024 * 1024):>10.1f}"
+            )
+            if row['model'] and not row['pipeline']:
+                self.stderr.write(f"  {row['model']} is not installed; {tier_name} ran on a blank pipeline")
+            elif row['skills_ner'] and not row['skill_label']:
+                self.stderr.write(f"  {row['model']} has no SKILL entities; {tier_name} skill scores "
+                                  f"come from the matchers only")
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from resume_parser.conf import get_setting
+from resume_parser.resume_parser import MODEL_TIERS, SKILL_DB, get_model_tier_name
+
+
+class Command(BaseCommand):
+    help = ('Download the NLP models the resume parser needs ahead of time (e.g. at image build), '
+            'so workers never fetch anything over the network')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tiers', nargs='+', choices=list(MODEL_TIERS),
+                            help='spaCy model tiers to install (default: RESUME_PARSER_MODEL_TIER)')
+        parser.add_argument('--semantic', action='store_true',
+                            help='Also fetch the semantic matching model and build the skill embeddings '
+                                 '(implied by RESUME_PARSER_SEMANTIC_MATCHING)')
+
+    def handle(self, *args, **options):
+        for tier_name in options['tiers'] or [get_model_tier_name()]:
+            model = MODEL_TIERS[tier_name].model
+            if model:
+                self._install_spacy_model(model)
+
+        if options['semantic'] or get_setting('RESUME_PARSER_SEMANTIC_MATCHING'):
+            from resume_parser.semantic import load_skill_embeddings
+
+            # Downloads the sentence-transformers model on first use, then persists the matrix
+            embeddings = load_skill_embeddings(SKILL_DB)
+            self.stdout.write(f'Skill embeddings ready: {embeddings.matrix.shape[0]} skills')
+
+        self.stdout.write(self.style.SUCCESS('Resume parser models provisioned'))
+
+    def _install_spacy_model(self, model: str) -> None:
+        import spacy
+        from spacy.cli import download
+
+        if spacy.util.is_package(model):
+            self.stdout.write(f'{model} is already installed')
+            return
+        self.stdout.write(f'Downloading {model}...')
+        try:
+            download(model)
+        except SystemExit as e:
+            raise CommandError(f'Could not download {model} (exit status {e.code})')
@@ -0,0 +1,39 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from resume_parser.conf import get_setting
+from resume_parser.worker_pool import ParserPool, PoolNotConfigured, serve_pool
+
+
+class Command(BaseCommand):
+    help = 'Run the dedicated resume parser worker pool on a local socket'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--address', help='Unix socket path (defaults to RESUME_PARSER_POOL_ADDRESS)')
+        parser.add_argument('--workers', type=int, help='Number of worker processes (defaults to RESUME_PARSER_WORKERS)')
+
+    def handle(self, *args, **options):
+        address = options['address'] or get_setting('RESUME_PARSER_POOL_ADDRESS')
+        if not address:
+            raise CommandError('Set RESUME_PARSER_POOL_ADDRESS or pass --address')
+
+        # Remove a socket left behind by a previous run
+        if os.path.exists(address):
+            os.unlink(address)
+        os.makedirs(os.path.dirname(os.path.abspath(address)), exist_ok=True)
+
+        pool = ParserPool(size=options['workers'])
+        try:
+            pool.start()
+        except PoolNotConfigured as e:
+            raise CommandError(f'{str(e)}: the pool socket unpickles what it receives, so it needs a secret key')
+        self.stdout.write(f'Resume parser pool with {pool.size} workers listening on {address}')
+        try:
+            serve_pool(pool, address)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            pool.shutdown()
+            if os.path.exists(address):
+                os.unlink(address)
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from resume_parser.jobs import process_jobs, run_worker
+
+
+class Command(BaseCommand):
+    help = 'Process queued asynchronous resume parse jobs'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Exit once the queue is empty')
+        parser.add_argument('--poll-interval', type=float, default=1.0,
+                            help='Seconds to wait between polls of an empty queue')
+
+    def handle(self, *args, **options):
+        if options['once']:
+            processed = process_jobs()
+            self.stdout.write(f'Processed {processed} resume parse job(s)')
+            return
+        self.stdout.write('Waiting for resume parse jobs...')
+        try:
+            run_worker(options['poll_interval'])
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,42 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from resume_parser.warmup import format_memory_report, memory_report, memory_reports, warm_up
+
+
+class Command(BaseCommand):
+    help = 'Load and exercise the resume parser models, or report unique vs shared memory of worker processes'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--no-sample', action='store_true', help='Load the models without a sample parse')
+        parser.add_argument('--pids', type=int, nargs='+',
+                            help='Only report the memory of these processes (e.g. gunicorn workers)')
+        parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+
+    def handle(self, *args, **options):
+        if options['pids']:
+            reports = memory_reports(options['pids'])
+            if options['json']:
+                self.stdout.write(json.dumps(reports, indent=2))
+                return
+            for report in reports:
+                self.stdout.write(format_memory_report(report))
+            if reports:
+                mb = 1024 * 1024
+                unique = sum(report['unique'] for report in reports)
+                self.stdout.write(f"{len(reports)} process(es): {unique / mb:.1f} MB unique in total, "
+                                  f"{max(report['shared'] for report in reports) / mb:.1f} MB shared")
+            return
+
+        report = warm_up(sample_parse=not options['no_sample'])
+        report['memory'] = memory_report()
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2, sort_keys=True))
+            return
+        for name, stats in report['models'].items():
+            self.stdout.write(f"{name}: loaded in {stats['load_seconds']:.2f}s, "
+                              f"~{stats['memory_bytes'] / (1024 * 1024):.1f} MB")
+        if report['memory']:
+            self.stdout.write(format_memory_report(report['memory']))
+        self.stdout.write(self.style.SUCCESS(f"Warmed up in {report['seconds']:.2f}s"))
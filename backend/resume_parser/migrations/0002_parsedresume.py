@@ -0,0 +1,35 @@
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('resume_parser', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ParsedResume',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_hash', models.CharField(db_index=True, help_text='SHA-256 of the file contents', max_length=64)),
+                ('filename', models.CharField(blank=True, max_length=255)),
+                ('text', models.TextField(blank=True)),
+                ('name', models.CharField(blank=True, max_length=255)),
+                ('email', models.CharField(blank=True, max_length=254)),
+                ('phone', models.CharField(blank=True, max_length=50)),
+                ('skills', models.JSONField(blank=True, default=dict, help_text='Skills grouped by category')),
+                ('parser_version', models.CharField(help_text='Parser output version the fields were extracted with', max_length=64)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='parsed_resumes', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-updated_at'],
+                'constraints': [models.UniqueConstraint(fields=('user', 'content_hash'), name='unique_parsed_resume_per_user')],
+            },
+        ),
+    ]
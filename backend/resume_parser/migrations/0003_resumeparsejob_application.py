@@ -0,0 +1,23 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('career_portal', '0010_jobapplication_parsed_resume'),
+        ('resume_parser', '0002_parsedresume'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resumeparsejob',
+            name='application',
+            field=models.ForeignKey(blank=True, help_text='Application whose stored resume is parsed', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='resume_parse_jobs', to='career_portal.jobapplication'),
+        ),
+        migrations.AlterField(
+            model_name='resumeparsejob',
+            name='upload',
+            field=models.BinaryField(blank=True, default=b'', help_text='Uploaded file contents, cleared once the job finishes'),
+        ),
+    ]
@@ -0,0 +1,177 @@
+"""
+Lazy, shared registry for the NLP models used by the resume parser.
+
+Models are registered with a loader callable and only loaded the first time
+something asks for them, so processes that never parse a resume never pay
+for spaCy or transformer weights. Models left idle longer than
+RESUME_PARSER_MODEL_TTL seconds are unloaded again.
+"""
+import gc
+import os
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from .conf import get_setting
+
+
+def current_rss() -> int:
+    """Return the resident set size of the current process in bytes."""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        pass
+    # ru_maxrss is a peak value, but it is the best estimate without /proc
+    return peak_rss()
+
+
+def peak_rss() -> int:
+    """Return the highest resident set size the current process has reached, in bytes."""
+    try:
+        import resource
+    except ImportError:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class _ModelEntry:
+    """Bookkeeping for a single registered model."""
+
+    def __init__(self, loader: Callable[[], Any]):
+        self.loader = loader
+        self.model = None
+        self.lock = threading.Lock()
+        self.last_used = 0.0
+        self.load_seconds = 0.0
+        self.memory_bytes = 0
+        self.load_count = 0
+
+
+class ModelRegistry:
+    """Loads models on first use, tracks their memory and evicts idle ones."""
+
+    def __init__(self, ttl: Optional[float] = None):
+        self._entries: Dict[str, _ModelEntry] = {}
+        self._lock = threading.Lock()
+        self._ttl = ttl
+        self._janitor = None
+
+    @property
+    def ttl(self) -> float:
+        """Idle time in seconds after which a model is evicted (0 disables eviction)."""
+        if self._ttl is not None:
+            return self._ttl
+        return float(get_setting('RESUME_PARSER_MODEL_TTL') or 0)
+
+    @ttl.setter
+    def ttl(self, value: Optional[float]) -> None:
+        self._ttl = value
+
+    def register(self, name: str, loader: Callable[[], Any]) -> None:
+        """Register a loader for a model; nothing is loaded until get() is called."""
+        with self._lock:
+            existing = self._entries.get(name)
+            if existing is not None and existing.loader is loader:
+                return
+            self._entries[name] = _ModelEntry(loader)
+
+    def get(self, name: str) -> Any:
+        """Return the named model, loading it if it is not resident."""
+        try:
+            entry = self._entries[name]
+        except KeyError:
+            raise KeyError(f"No model registered under '{name}'")
+
+        with entry.lock:
+            if entry.model is None:
+                rss_before = current_rss()
+                start = time.perf_counter()
+                entry.model = entry.loader()
+                entry.load_seconds = time.perf_counter() - start
+                entry.memory_bytes = max(current_rss() - rss_before, 0)
+                entry.load_count += 1
+                print(f"Loaded model '{name}' in {entry.load_seconds:.2f}s "
+                      f"(~{entry.memory_bytes / (1024 * 1024):.1f} MB resident)")
+                self._ensure_janitor()
+            entry.last_used = time.monotonic()
+            return entry.model
+
+    def is_loaded(self, name: str) -> bool:
+        entry = self._entries.get(name)
+        return entry is not None and entry.model is not None
+
+    def evict(self, name: str) -> bool:
+        """Unload a model. Returns True if it was resident."""
+        entry = self._entries.get(name)
+        if entry is None:
+            return False
+        with entry.lock:
+            if entry.model is None:
+                return False
+            entry.model = None
+        gc.collect()
+        print(f"Evicted model '{name}'")
+        return True
+
+    def evict_idle(self) -> List[str]:
+        """Unload every model that has been idle longer than the TTL."""
+        ttl = self.ttl
+        if ttl <= 0:
+            return []
+        cutoff = time.monotonic() - ttl
+        evicted = []
+        for name, entry in list(self._entries.items()):
+            if entry.model is not None and entry.last_used < cutoff:
+                if self.evict(name):
+                    evicted.append(name)
+        return evicted
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return load state, load time and resident memory estimate per model."""
+        now = time.monotonic()
+        return {
+            name: {
+                'loaded': entry.model is not None,
+                'memory_bytes': entry.memory_bytes if entry.model is not None else 0,
+                'load_seconds': round(entry.load_seconds, 3),
+                'load_count': entry.load_count,
+                'idle_seconds': round(now - entry.last_used, 1) if entry.model is not None else None,
+            }
+            for name, entry in self._entries.items()
+        }
+
+    def _ensure_janitor(self) -> None:
+        """Start the background thread that evicts idle models."""
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            if self._janitor is not None:
+                return
+            self._janitor = threading.Thread(
+                target=self._janitor_loop, name='resume-parser-model-janitor', daemon=True
+            )
+            self._janitor.start()
+
+    def _janitor_loop(self) -> None:
+        while True:
+            ttl = self.ttl
+            if ttl > 0:
+                time.sleep(min(max(ttl / 4, 1), 60))
+                self.evict_idle()
+            with self._lock:
+                if ttl <= 0 or not any(entry.model is not None for entry in self._entries.values()):
+                    self._janitor = None
+                    return
+
+
+# Process-wide registry shared by every parser entry point
+registry = ModelRegistry()
+
+
+def get_model(name: str) -> Any:
+    """Fetch a model from the shared registry."""
+    return registry.get(name)
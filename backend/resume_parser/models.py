@@ -1,3 +1,73 @@
+import uuid
+
+from django.conf import settings
 from django.db import models
 
-# Create your models here.
+
+class ResumeParseJob(models.Model):
+    """
+    A queued resume parse: an upload to ``/api/resume/parse/?async=1``, or the
+    stored resume of a job application, which is read from the application.
+    """
+
+    STATUS_QUEUED = 'queued'
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, 'Queued'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_DONE, 'Done'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='resume_parse_jobs')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_QUEUED)
+    filename = models.CharField(max_length=255)
+    application = models.ForeignKey(
+        'career_portal.JobApplication', on_delete=models.CASCADE, null=True, blank=True,
+        related_name='resume_parse_jobs', help_text='Application whose stored resume is parsed'
+    )
+    upload = models.BinaryField(blank=True, default=b'', help_text='Uploaded file contents, cleared once the job finishes')
+    result = models.JSONField(null=True, blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['created_at']
+        indexes = [models.Index(fields=['status', 'created_at'])]
+
+    def __str__(self):
+        return f"{self.filename} ({self.status})"
+
+
+class ParsedResume(models.Model):
+    """Structured data extracted from one resume file, stored so the file is parsed only once."""
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='parsed_resumes')
+    content_hash = models.CharField(max_length=64, db_index=True, help_text='SHA-256 of the file contents')
+    filename = models.CharField(max_length=255, blank=True)
+    text = models.TextField(blank=True)
+    name = models.CharField(max_length=255, blank=True)
+    email = models.CharField(max_length=254, blank=True)
+    phone = models.CharField(max_length=50, blank=True)
+    skills = models.JSONField(default=dict, blank=True, help_text='Skills grouped by category')
+    parser_version = models.CharField(max_length=64, help_text='Parser output version the fields were extracted with')
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-updated_at']
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'content_hash'], name='unique_parsed_resume_per_user'),
+        ]
+
+    def __str__(self):
+        return f"{self.filename or self.content_hash[:12]} ({self.user})"
+
+    def skill_set(self):
+        """Return every extracted skill, lower-cased, for matching against job requirements."""
+        return {skill.lower() for skills in self.skills.values() for skill in skills}
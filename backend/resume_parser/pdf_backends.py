@@ -0,0 +1,307 @@
+"""
+Pluggable PDF text extraction backends.
+
+Every backend wraps one PDF library behind the same small interface (open a
+document from bytes, count its pages, extract one page's text), so the rest
+of the parser does not care which library is installed. All libraries are
+optional imports; a backend whose library is missing reports itself
+unavailable.
+
+RESUME_PARSER_PDF_BACKEND names the backend to use. The default, 'auto',
+uses the backend ``manage.py benchmark_pdf_backends`` chose on our corpus
+and stored in RESUME_PARSER_PDF_BACKEND_FILE, or PyPDF2 when nothing has
+been chosen yet. The choice is read once per process.
+
+Page text from every backend goes through ``normalize_page_text``, which
+cleans up extraction artefacts but keeps the line structure contact and
+section detection depend on.
+
+Backends read the PDF through a BufferReader over the caller's buffer, so a
+memory-mapped upload is parsed in place instead of being copied to the heap.
+"""
+import importlib
+import io
+import json
+import os
+import re
+import tempfile
+import threading
+from typing import Dict, List, Optional
+
+from .conf import get_setting
+
+DEFAULT_BACKEND = 'pypdf2'
+
+_LIGATURES = str.maketrans({'ﬀ': 'ff', 'ﬁ': 'fi', 'ﬂ': 'fl', 'ﬃ': 'ffi', 'ﬄ': 'ffl'})
+# Soft hyphens, zero-width characters and byte order marks
+_INVISIBLE = re.compile('[\u00ad\u200b-\u200d\u2060\ufeff]')
+_LINE_BREAKS = re.compile('\r\n?|[\f\v\u2028\u2029]')
+_HORIZONTAL_SPACE = re.compile(r'[^\S\n]+')
+_BLANK_LINES = re.compile(r'\n{3,}')
+
+
+class BufferReader(io.RawIOBase):
+    """
+    Read-only, seekable stream over a buffer (bytes, mmap, memoryview).
+
+    Reads copy only the bytes asked for, never the whole buffer. Close the
+    reader before closing an mmap it reads from.
+    """
+
+    def __init__(self, buffer):
+        super().__init__()
+        self._view = memoryview(buffer).cast('B')
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        if offset < 0:
+            raise ValueError('negative seek position')
+        self._position = offset
+        return offset
+
+    def read(self, size: int = -1) -> bytes:
+        end = len(self._view) if size is None or size < 0 else min(self._position + size, len(self._view))
+        chunk = self._view[self._position:end].tobytes() if end > self._position else b''
+        self._position = max(self._position, end)
+        return chunk
+
+    def readinto(self, target) -> int:
+        chunk = self.read(len(target))
+        target[:len(chunk)] = chunk
+        return len(chunk)
+
+    def readall(self) -> bytes:
+        return self.read()
+
+    def close(self) -> None:
+        if not self.closed:
+            self._view.release()
+        super().close()
+
+
+def normalize_page_text(text: str) -> str:
+    """
+    Clean up the text of one PDF page without losing its lines.
+
+    Ligatures are expanded, invisible characters dropped, every kind of line
+    break becomes a newline, runs of spaces and tabs within a line become
+    one space, and more than one blank line in a row becomes a single one.
+    """
+    text = _INVISIBLE.sub('', text.translate(_LIGATURES))
+    text = _LINE_BREAKS.sub('\n', text)
+    text = '\n'.join(line.strip() for line in _HORIZONTAL_SPACE.sub(' ', text).split('\n'))
+    return _BLANK_LINES.sub('\n\n', text).strip()
+
+
+class PdfBackend:
+    """Base class for a PDF library adapter."""
+
+    name = ''
+    module = ''  # Importable module that provides the library
+    # Whether page extraction releases the GIL and is safe on several threads,
+    # each with its own document. Pure-Python libraries hold the GIL, so
+    # threads only add contention; none of the backends below qualify.
+    parallel = False
+
+    def available(self) -> bool:
+        try:
+            importlib.import_module(self.module)
+        except ImportError:
+            return False
+        return True
+
+    def open(self, stream: BufferReader):
+        """Open a document from a stream the caller closes after close(document)."""
+        raise NotImplementedError
+
+    def page_count(self, document) -> int:
+        raise NotImplementedError
+
+    def page_text(self, document, index: int) -> str:
+        raise NotImplementedError
+
+    def close(self, document) -> None:
+        pass
+
+
+class PyPDF2Backend(PdfBackend):
+    name = 'pypdf2'
+    module = 'PyPDF2'
+
+    def open(self, stream):
+        import PyPDF2
+        return PyPDF2.PdfReader(stream)
+
+    def page_count(self, document):
+        return len(document.pages)
+
+    def page_text(self, document, index):
+        return document.pages[index].extract_text() or ''
+
+
+class PypdfBackend(PyPDF2Backend):
+    """pypdf, the maintained successor of PyPDF2 with a faster text extractor."""
+    name = 'pypdf'
+    module = 'pypdf'
+
+    def open(self, stream):
+        import pypdf
+        return pypdf.PdfReader(stream)
+
+
+class PdfminerBackend(PdfBackend):
+    """pdfminer.six: slow, but the most careful layout analysis of the pure-Python libraries."""
+    name = 'pdfminer'
+    module = 'pdfminer'
+
+    def open(self, stream):
+        from pdfminer.pdfpage import PDFPage
+        return list(PDFPage.get_pages(stream))
+
+    def page_count(self, document):
+        return len(document)
+
+    def page_text(self, document, index):
+        from pdfminer.converter import TextConverter
+        from pdfminer.layout import LAParams
+        from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+
+        out = io.StringIO()
+        resources = PDFResourceManager()
+        device = TextConverter(resources, out, laparams=LAParams())
+        try:
+            PDFPageInterpreter(resources, device).process_page(document[index])
+        finally:
+            device.close()
+        return out.getvalue()
+
+
+class PyMuPDFBackend(PdfBackend):
+    """PyMuPDF (MuPDF, C). Not thread-safe, but fast enough on one thread."""
+    name = 'pymupdf'
+    module = 'fitz'
+
+    def open(self, stream):
+        import fitz
+        # MuPDF only opens bytes it can keep, so this backend takes a copy
+        return fitz.open(stream=stream.read(), filetype='pdf')
+
+    def page_count(self, document):
+        return document.page_count
+
+    def page_text(self, document, index):
+        return document[index].get_text('text')
+
+    def close(self, document):
+        document.close()
+
+
+class Pypdfium2Backend(PdfBackend):
+    """pypdfium2 (PDFium, C). PDFium is not thread-safe."""
+    name = 'pypdfium2'
+    module = 'pypdfium2'
+
+    def open(self, stream):
+        import pypdfium2
+        # Read through the stream's readinto, without a copy of the whole file
+        return pypdfium2.PdfDocument(stream)
+
+    def page_count(self, document):
+        return len(document)
+
+    def page_text(self, document, index):
+        page = document[index]
+        try:
+            text_page = page.get_textpage()
+            try:
+                return text_page.get_text_range()
+            finally:
+                text_page.close()
+        finally:
+            page.close()
+
+    def close(self, document):
+        document.close()
+
+
+PDF_BACKENDS: Dict[str, PdfBackend] = {
+    backend.name: backend
+    for backend in (PyPDF2Backend(), PypdfBackend(), PdfminerBackend(), PyMuPDFBackend(), Pypdfium2Backend())
+}
+
+_chosen: Optional[PdfBackend] = None
+_chosen_lock = threading.Lock()
+
+
+def available_backends() -> List[PdfBackend]:
+    return [backend for backend in PDF_BACKENDS.values() if backend.available()]
+
+
+def backend_choice_path() -> str:
+    return get_setting('RESUME_PARSER_PDF_BACKEND_FILE') or os.path.join(
+        tempfile.gettempdir(), 'talentlink-resume-parser', 'pdf_backend.json'
+    )
+
+
+def load_backend_choice() -> Optional[str]:
+    """Return the backend name stored by the benchmark command, if any."""
+    try:
+        with open(backend_choice_path()) as choice_file:
+            return json.load(choice_file).get('backend')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def save_backend_choice(name: str, report: Optional[Dict] = None) -> str:
+    """Store the chosen backend (and the report it was chosen from) for 'auto'; returns the path."""
+    path = backend_choice_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    with os.fdopen(fd, 'w') as choice_file:
+        json.dump({'backend': name, 'report': report}, choice_file, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+    reset_backend()
+    return path
+
+
+def _resolve_backend() -> PdfBackend:
+    name = get_setting('RESUME_PARSER_PDF_BACKEND')
+    if name == 'auto':
+        name = load_backend_choice() or DEFAULT_BACKEND
+    backend = PDF_BACKENDS.get(name)
+    if backend is None or not backend.available():
+        print(f"PDF backend {name!r} is not available, using {DEFAULT_BACKEND}")
+        backend = PDF_BACKENDS[DEFAULT_BACKEND]
+    return backend
+
+
+def get_pdf_backend(name: Optional[str] = None) -> PdfBackend:
+    """Return the named backend, or the configured one."""
+    global _chosen
+    if name is not None:
+        return PDF_BACKENDS[name]
+    if _chosen is None:
+        with _chosen_lock:
+            if _chosen is None:
+                _chosen = _resolve_backend()
+    return _chosen
+
+
+def reset_backend() -> None:
+    """Forget the resolved backend so the next extraction reads the settings again."""
+    global _chosen
+    with _chosen_lock:
+        _chosen = None
@@ -1,99 +1,126 @@
+import io
+import mmap
 import os
 import re
-import json
-import tempfile
-from typing import Dict, List, Set
+import threading
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
 from collections import defaultdict
-import PyPDF2
-from docx import Document
-import spacy
-import numpy as np
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
-import nltk
-from transformers import pipeline
-import torch
+from functools import partial
 from concurrent.futures import ThreadPoolExecutor
-import numpy as np
-from collections import defaultdict
 
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
-
-try:
-    nltk.data.find('taggers/averaged_perceptron_tagger')
-except LookupError:
-    nltk.download('averaged_perceptron_tagger')
-
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
-
-# Initialize spaCy model
-try:
-    print("Loading spaCy model...")
-    nlp = spacy.load('en_core_web_lg')
-    print("spaCy model loaded successfully")
-except Exception as e:
-    print(f"Error loading spaCy model: {str(e)}")
-    nlp = spacy.blank('en')
-
-# Dictionary of common abbreviations and their full forms
-skill_abbreviations = {
-    'ML': 'Machine Learning',
-    'AI': 'Artificial Intelligence',
-    'DL': 'Deep Learning',
-    'NLP': 'Natural Language Processing',
-    'CV': 'Computer Vision',
-    'JS': 'JavaScript',
-    'TS': 'TypeScript',
-    'BE': 'Backend',
-    'FE': 'Frontend',
-    'FS': 'Full Stack',
-    'DB': 'Database',
-    'UI': 'User Interface',
-    'UX': 'User Experience',
-    'CI': 'Continuous Integration',
-    'CD': 'Continuous Deployment',
-    'AWS': 'Amazon Web Services',
-    'GCP': 'Google Cloud Platform',
-    'K8s': 'Kubernetes',
-}
+from .cache import parse_cache
+from .conf import get_setting
+from .contact import HEADER_LINES, extract_contact, resolve_name, scan_contact
+from .deadline import allows as within_budget, deadline, expired as budget_expired, optional_stage, skipped_stages
+from .docx_extractor import iter_docx_lines
+from .instrumentation import stage, trace
+from .model_registry import registry as model_registry
+from .pdf_backends import (
+    DEFAULT_BACKEND as DEFAULT_PDF_BACKEND, BufferReader, PdfBackend, get_pdf_backend, normalize_page_text
+)
+from .sections import Section, ner_text, section_spans, segment_resume
+from .semantic import load_skill_embeddings, match_skills_semantic
+from .skill_matcher import SkillMatcher
+from .taxonomy import TaxonomyView, get_taxonomy
 
-# Comprehensive skill database
-SKILL_DB = {
-    'Programming Languages': {
-        'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'ruby', 'php', 'swift',
-        'kotlin', 'go', 'rust', 'scala', 'perl', 'r', 'matlab', 'sql', 'bash', 'powershell'
-    },
-    'Web Technologies': {
-        'html', 'css', 'react', 'angular', 'vue.js', 'node.js', 'express.js', 'django',
-        'flask', 'spring', 'asp.net', 'jquery', 'bootstrap', 'tailwind', 'webpack',
-        'graphql', 'rest api', 'web services', 'microservices'
-    },
-    'Databases': {
-        'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch', 'oracle', 'sql server',
-        'sqlite', 'cassandra', 'dynamodb', 'mariadb', 'neo4j', 'firebase', 'nosql'
-    },
-    'Cloud & DevOps': {
-        'aws', 'azure', 'google cloud', 'docker', 'kubernetes', 'jenkins', 'terraform',
-        'ansible', 'circleci', 'github actions', 'gitlab ci', 'prometheus', 'grafana',
-        'devops', 'ci/cd', 'cloud computing'
-    },
-    'AI & Data Science': {
-        'machine learning', 'deep learning', 'neural networks', 'nlp', 'computer vision',
-        'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy', 'keras', 'opencv',
-        'data analysis', 'data visualization', 'big data', 'hadoop', 'spark'
-    },
-    'Tools & Methodologies': {
-        'git', 'jira', 'agile', 'scrum', 'kanban', 'tdd', 'unit testing', 'ci/cd',
-        'rest', 'soap', 'design patterns', 'oop', 'functional programming'
-    }
+# Bump whenever parse output changes so cached results are not reused
+PARSER_VERSION = '1.7'
+
+SUPPORTED_FILE_TYPES = ('.pdf', '.docx')
+
+# Longest prefix of the resume text that skill extraction looks at
+MAX_SKILL_TEXT_CHARS = 100000
+
+# Only entity output is ever read, so everything except NER is switched off
+UNUSED_PIPELINE_COMPONENTS = ['tagger', 'parser', 'attribute_ruler', 'lemmatizer', 'senter', 'morphologizer']
+
+def _trim_pipeline(model):
+    """Disable the shared tok2vec layer when no remaining component listens to it."""
+    if 'tok2vec' in model.pipe_names:
+        listeners = getattr(model.get_pipe('tok2vec'), 'listening_components', [])
+        if not any(name in model.pipe_names for name in listeners):
+            model.select_pipes(disable=['tok2vec'])
+    return model
+
+class ModelTier(NamedTuple):
+    """A spaCy model and the NER stages it is trusted with."""
+    model: Optional[str]
+    name_ner: bool
+    skills_ner: bool
+
+# RESUME_PARSER_MODEL_TIER trades recall for latency and memory; rules-only loads no model at all
+MODEL_TIERS = {
+    'lg': ModelTier('en_core_web_lg', name_ner=True, skills_ner=True),
+    'md': ModelTier('en_core_web_md', name_ner=True, skills_ner=True),
+    'sm': ModelTier('en_core_web_sm', name_ner=True, skills_ner=False),
+    'rules-only': ModelTier(None, name_ner=False, skills_ner=False),
 }
+DEFAULT_MODEL_TIER = 'lg'
+
+def get_model_tier_name() -> str:
+    """Return the configured model tier, falling back to the default for unknown values."""
+    tier = get_setting('RESUME_PARSER_MODEL_TIER')
+    if tier not in MODEL_TIERS:
+        print(f"Warning: Unknown RESUME_PARSER_MODEL_TIER {tier!r}, using {DEFAULT_MODEL_TIER!r}")
+        return DEFAULT_MODEL_TIER
+    return tier
+
+def get_model_tier() -> ModelTier:
+    return MODEL_TIERS[get_model_tier_name()]
+
+def _load_spacy_model(model_name: str):
+    """Load a spaCy NER pipeline, falling back to a blank English model."""
+    import spacy
+    try:
+        print(f"Loading spaCy model {model_name}...")
+        model = _trim_pipeline(spacy.load(model_name, exclude=UNUSED_PIPELINE_COMPONENTS))
+        print(f"spaCy model loaded successfully (pipeline: {', '.join(model.pipe_names)})")
+        return model
+    except Exception as e:
+        print(f"Error loading spaCy model {model_name}, falling back to a blank pipeline: {str(e)}")
+        return spacy.blank('en')
+
+# Each tier's pipeline is loaded on first use through the shared model registry
+for _tier_name, _tier in MODEL_TIERS.items():
+    if _tier.model:
+        model_registry.register(f'spacy.{_tier_name}', partial(_load_spacy_model, _tier.model))
+
+def get_nlp():
+    """Return the spaCy pipeline of the configured tier, loading it on first use (None for rules-only)."""
+    tier_name = get_model_tier_name()
+    if not MODEL_TIERS[tier_name].model:
+        return None
+    name = f'spacy.{tier_name}'
+    if model_registry.is_loaded(name):
+        return model_registry.get(name)
+    # A cold load is timed as its own stage, so its cost is never mistaken for NER
+    with stage('model_load'), optional_stage('model_load'):
+        return model_registry.get(name)
+
+def _nlp_within_budget(stage_name: str):
+    """
+    The pipeline for an optional NER stage, or None when the parse deadline
+    leaves no time for the stage, or for loading the model before it.
+
+    The budget is checked before the model is touched, so a spent budget
+    never pays for a cold load.
+    """
+    tier_name = get_model_tier_name()
+    if not MODEL_TIERS[tier_name].model or not within_budget(stage_name):
+        return None
+    if not model_registry.is_loaded(f'spacy.{tier_name}') and not within_budget('model_load'):
+        return None
+    return get_nlp()
+
+def _name_nlp():
+    """The pipeline used for PERSON entities, or None when the tier or time budget leaves names to the rules."""
+    if not get_model_tier().name_ner:
+        return None
+    return _nlp_within_budget('name_ner')
+
+# Derived, read-only views of the data-driven skill taxonomy (see taxonomy.py)
+skill_abbreviations = TaxonomyView('abbreviations')
+SKILL_DB = TaxonomyView('skill_db')
 
 def clean_text(text):
     """Remove leading unwanted symbols and spaces."""
@@ -102,125 +129,233 @@ def clean_text(text):
 
 def extract_email(text):
     """Extract the first valid email address from the text."""
-    try:
-        # First, try to find email in lines containing email-related keywords
-        lines = text.lower().split('\n')
-        for i, line in enumerate(lines):
-            if any(keyword in line for keyword in ['email', 'e-mail', 'mail', '@']):
-                # Search this line and the next few lines
-                search_text = '\n'.join(lines[i:i+3])
-                email_pattern = r'(?i)([a-z0-9._%+-]+@[a-z0-9.-]+\.[a-z]{2,})'
-                matches = re.findall(email_pattern, search_text)
-                if matches:
-                    return matches[0].strip()
-        
-        # If no email found in email-related sections, search entire text
-        email_pattern = r'(?i)([a-z0-9._%+-]+@[a-z0-9.-]+\.[a-z]{2,})'
-        matches = re.findall(email_pattern, text)
-        if matches:
-            return matches[0].strip()
-        
+    email = scan_contact(text).email
+    if not email:
         print("Warning: No email found in text")
-        return None
-    except Exception as e:
-        print(f"Error in email extraction: {str(e)}")
-        return None
+    return email
 
 def extract_phone(text):
     """Extract the first valid phone number from the text."""
-    phone_pattern = r'\+?\d{1,3}[-\s]?\(?\d{2,4}\)?[-\s]?\d{3,4}[-\s]?\d{3,4}'
-    matches = re.findall(phone_pattern, text)
-    for match in matches:
-        phone = clean_text(match)
-        phone = re.sub(r'[^\d+]', '', phone)
-        if phone.startswith('+'):
-            return phone
-        elif len(phone) == 10:
-            return f"{phone[:3]}-{phone[3:6]}-{phone[6:]}"
-        elif len(phone) > 10:
-            return phone
-    return None
-
-def extract_name(text):
-    """Extract full name using multiple approaches."""
+    return scan_contact(text).phone
+
+def header_chunk(text: str) -> str:
+    """Return the first lines of the resume, where names are typically found."""
+    return '\n'.join(text.split('\n', HEADER_LINES)[:HEADER_LINES])
+
+def extract_name(text, doc=None):
+    """Extract full name using multiple approaches.
+
+    ``doc`` is an optional spaCy Doc of the resume text, shared with skill
+    extraction so the pipeline runs only once per resume. Only entities
+    inside the header chunk are considered.
+    """
     try:
-        # Get the first few chunks of text where names are typically found
-        first_chunk = '\n'.join(text.split('\n')[:10])  # Look at first 5 lines
-        
-        # Method 1: Try to find name after common resume header patterns
-        name_patterns = [
-            r'(?i)name\s*[:-]?\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3})',
-            r'(?i)^\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3})\s*$',
-            r'(?i)^\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3})\s*[,\n]'
-        ]
-        
-        for pattern in name_patterns:
-            matches = re.findall(pattern, first_chunk)
-            if matches:
-                candidate = matches[0].strip()
-                if len(candidate.split()) >= 2:
-                    print(f"Found name using pattern matching: {candidate}")
-                    return candidate
-        
-        # Method 2: Use spaCy NER
-        doc = nlp(first_chunk)
-        for ent in doc.ents:
-            if ent.label_ == 'PERSON':
-                name = ent.text.strip()
-                if len(name.split()) >= 2:
-                    print(f"Found name using NER: {name}")
-                    return name
-        
-        # Method 3: Look for name-like patterns in the first few lines
-        lines = [line.strip() for line in first_chunk.split('\n')]
-        for line in lines:
-            # Skip lines that are clearly not names
-            if any(skip in line.lower() for skip in ['resume', 'cv', 'curriculum', 'vitae', '@', 'email', 'phone', 'address', 'http', 'www']):
-                continue
-            
-            # Clean and check the line
-            clean_line = ' '.join(word for word in line.split() if word.isalpha())
-            words = clean_line.split()
-            
-            if 2 <= len(words) <= 4 and all(word[0].isupper() for word in words):
-                print(f"Found name using fallback method: {clean_line}")
-                return clean_line
-        
-        print("Warning: No name found in text")
-        return None
+        name = resolve_name(scan_contact(text), _name_nlp, doc if get_model_tier().name_ner else None)
+        if not name:
+            print("Warning: No name found in text")
+        return name
     except Exception as e:
         print(f"Error in name extraction: {str(e)}")
         return None
 
-def extract_text_from_pdf(pdf_file):
-    """Extract text from PDF with better error handling and text cleaning."""
+def _extract_page_text(backend: PdfBackend, document, index: int) -> str:
     try:
-        reader = PyPDF2.PdfReader(pdf_file)
-        text = ''
-        for page in reader.pages:
-            try:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + '\n'
-            except Exception as e:
-                print(f"Error extracting text from PDF page: {str(e)}")
-        
-        if not text.strip():
+        return backend.page_text(document, index)
+    except Exception as e:
+        print(f"Error extracting text from PDF page: {str(e)}")
+        return ''
+
+def _pdf_buffer(pdf_file):
+    """Return the PDF as a buffer, without copying mmaps, bytes-like objects or BytesIO contents."""
+    if isinstance(pdf_file, (str, os.PathLike)):
+        with open(pdf_file, 'rb') as f:
+            return f.read()
+    if isinstance(pdf_file, (bytes, bytearray, memoryview, mmap.mmap)):
+        return pdf_file
+    if isinstance(pdf_file, io.BytesIO):
+        return pdf_file.getbuffer()
+    pdf_file.seek(0)
+    return pdf_file.read()
+
+def iter_pdf_pages(pdf_file, max_pages: Optional[int] = None,
+                   stats: Optional[Dict[str, int]] = None, backend: Optional[PdfBackend] = None) -> Iterator[str]:
+    """
+    Yield page texts from a PDF in page order.
+
+    Text comes from ``backend``, or the configured PDF backend (see
+    pdf_backends.py). Pages are read one after another unless the backend
+    releases the GIL (``parallel``) and RESUME_PARSER_PDF_WORKERS is above 1;
+    then they are extracted on a thread pool in windows of that many pages,
+    with one document per thread, because readers seek a shared stream.
+    At most ``max_pages`` pages are read, and closing the generator stops
+    extraction after the current window. When a ``stats`` dict is given it
+    is kept up to date with the page counts, including how many pages were
+    skipped.
+    """
+    max_pages = max_pages if max_pages is not None else get_setting('RESUME_PARSER_PDF_MAX_PAGES')
+    workers = max(1, get_setting('RESUME_PARSER_PDF_WORKERS'))
+    stats = stats if stats is not None else {}
+    backend = backend or get_pdf_backend()
+
+    # Every document opened below reads the same buffer through its own stream
+    data = _pdf_buffer(pdf_file)
+    streams = []
+    documents = []
+
+    def open_document():
+        stream = BufferReader(data)
+        streams.append(stream)
+        document = backend.open(stream)
+        documents.append(document)
+        return document
+
+    try:
+        document = open_document()
+        total_pages = backend.page_count(document)
+        page_limit = min(total_pages, max_pages) if max_pages else total_pages
+        stats.update(pages_total=total_pages, pages_extracted=0, pages_skipped=total_pages)
+
+        def extracted():
+            stats['pages_extracted'] += 1
+            stats['pages_skipped'] -= 1
+
+        if workers == 1 or page_limit <= 1 or not backend.parallel:
+            for index in range(page_limit):
+                # Past the parse deadline, keep what has been read so far
+                if index and budget_expired('extract_text'):
+                    return
+                page_text = _extract_page_text(backend, document, index)
+                extracted()
+                yield page_text
+            return
+
+        local = threading.local()
+
+        def extract(index):
+            if getattr(local, 'document', None) is None:
+                local.document = open_document()
+            return _extract_page_text(backend, local.document, index)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for window_start in range(0, page_limit, workers):
+                if window_start and budget_expired('extract_text'):
+                    return
+                window = range(window_start, min(window_start + workers, page_limit))
+                for page_text in executor.map(extract, window):
+                    extracted()
+                    yield page_text
+    finally:
+        for opened in documents:
+            backend.close(opened)
+        # Readers keep no views of the buffer once closed, so a caller's mmap can be closed
+        for stream in streams:
+            stream.close()
+        if isinstance(data, memoryview) and data is not pdf_file:
+            data.release()
+
+def join_within_budget(chunks: Iterable[str], max_chars: Optional[int] = None, separator: str = '\n',
+                       stats: Optional[Dict[str, int]] = None) -> str:
+    """
+    Join text chunks, stopping once ``max_chars`` characters have been produced.
+
+    The budget is enforced while the chunks are produced rather than on the
+    finished text: the source generator is closed as soon as the budget is
+    spent, so the rest of the document is never extracted. A ``max_chars``
+    of 0 disables the budget.
+    """
+    max_chars = max_chars if max_chars is not None else get_setting('RESUME_PARSER_MAX_TEXT_CHARS')
+    parts = []
+    used = 0
+    truncated = False
+    try:
+        for chunk in chunks:
+            gap = len(separator) if parts else 0
+            if max_chars and used + gap + len(chunk) > max_chars:
+                remaining = max(max_chars - used - gap, 0)
+                if remaining:
+                    parts.append(chunk[:remaining])
+                    used += gap + remaining
+                truncated = True
+                break
+            parts.append(chunk)
+            used += gap + len(chunk)
+    finally:
+        if hasattr(chunks, 'close'):
+            chunks.close()
+    if stats is not None:
+        stats['chars'] = used
+        stats['truncated'] = truncated
+    return separator.join(parts)
+
+def normalize_pdf_chunk(text: str) -> str:
+    """Clean up common PDF extraction issues in one page of text, keeping its lines."""
+    return normalize_page_text(text)
+
+def extract_pdf_pages(pdf_file, max_pages: Optional[int] = None, max_chars: Optional[int] = None,
+                      backend: Optional[PdfBackend] = None) -> Tuple[List[str], Dict[str, int]]:
+    """
+    Extract page texts from a PDF in page order, stopping once a budget is reached.
+
+    Extraction stops after ``max_pages`` pages or once ``max_chars`` characters
+    have been collected; the returned stats say how many pages were skipped.
+    """
+    max_chars = max_chars if max_chars is not None else get_setting('RESUME_PARSER_MAX_TEXT_CHARS')
+    stats = {}
+    pages = []
+    chars = 0
+    source = iter_pdf_pages(pdf_file, max_pages, stats, backend)
+    try:
+        for page_text in source:
+            pages.append(page_text)
+            chars += len(page_text)
+            if max_chars and chars >= max_chars:
+                break
+    finally:
+        source.close()
+    return pages, stats
+
+def extract_text_from_pdf(pdf_file, stats: Optional[Dict[str, int]] = None,
+                          backend: Optional[PdfBackend] = None):
+    """
+    Extract text from PDF with better error handling and text cleaning.
+
+    Pages are normalized one at a time, keeping their line structure, and
+    joined with a blank line between pages. Extraction stops once the
+    RESUME_PARSER_MAX_TEXT_CHARS budget is spent. When a ``stats`` dict is
+    given it is filled with page counts and whether the text was truncated.
+    """
+    stats = stats if stats is not None else {}
+    try:
+        pages = iter_pdf_pages(pdf_file, stats=stats, backend=backend)
+        try:
+            chunks = (chunk for chunk in map(normalize_pdf_chunk, pages) if chunk)
+            text = join_within_budget(chunks, separator='\n\n', stats=stats)
+        finally:
+            pages.close()
+        if not text:
             print("Warning: No text extracted from PDF")
-            return ''
-        
-        # Clean up common PDF extraction issues
-        text = re.sub(r'\s+', ' ', text)  # Replace multiple spaces with single space
-        text = text.replace('\x0c', '\n')  # Replace form feed with newline
-        text = '\n'.join(line.strip() for line in text.splitlines())
         return text
     except Exception as e:
         print(f"Error in PDF text extraction: {str(e)}")
         return ''
 
-def extract_text_from_docx(docx_file):
-    """Extract text from DOCX file."""
+def extract_text_from_docx(docx_file, stats: Optional[Dict[str, int]] = None):
+    """
+    Extract text from DOCX file, including tables, headers, footers and text boxes.
+
+    The document is streamed and parsing stops once the
+    RESUME_PARSER_MAX_TEXT_CHARS budget is spent.
+    """
+    try:
+        return join_within_budget(iter_docx_lines(docx_file), stats=stats)
+    except Exception as e:
+        print(f"Error in DOCX text extraction: {str(e)}")
+        return ''
+
+def extract_text_from_docx_legacy(docx_file):
+    """Extract body paragraph text with python-docx; kept for benchmark comparisons."""
     try:
+        from docx import Document
         doc = Document(docx_file)
         text = '\n'.join([paragraph.text for paragraph in doc.paragraphs])
         return text
@@ -228,48 +363,44 @@ def extract_text_from_docx(docx_file):
         print(f"Error in DOCX text extraction: {str(e)}")
         return ''
 
-def extract_skills_rule_based(text: str) -> Dict[str, Set[str]]:
-    """Extract skills using exact keyword matching and common variations."""
-    skills = defaultdict(set)
-    text_lower = text.lower()
-    
+def get_skill_matcher() -> SkillMatcher:
+    """Return the skill matcher compiled with the current taxonomy."""
+    return get_taxonomy().matcher
+
+def extract_skills_rule_based(text: str, sections: Optional[List[Section]] = None) -> Dict[str, Set[str]]:
+    """
+    Extract skills using exact keyword matching and common variations.
+
+    Inside the skills section, skills that are also common words ('go',
+    'rest') match without the list or capitalisation cues prose needs.
+    """
     try:
-        # First check abbreviations and expand them
-        for abbr, full_form in skill_abbreviations.items():
-            if abbr.lower() in text_lower:
-                # Find appropriate category for the skill
-                for category, category_skills in SKILL_DB.items():
-                    if full_form in category_skills:
-                        skills[category].add(full_form)
-                        break
-        
-        # Then check for exact matches from skill database
-        for category, category_skills in SKILL_DB.items():
-            for skill in category_skills:
-                skill_lower = skill.lower()
-                # Check for exact match or match with common separators
-                if any(pattern in text_lower for pattern in [
-                    skill_lower,
-                    skill_lower.replace(' ', '-'),
-                    skill_lower.replace(' ', '_'),
-                    skill_lower.replace(' ', '')
-                ]):
-                    skills[category].add(skill)
-        
-        return skills
+        # One linear pass over the text finds every skill and abbreviation
+        return get_skill_matcher().match(text, section_spans(sections or [], ('skills',)))
     except Exception as e:
         print(f"Error in rule-based extraction: {str(e)}")
         return defaultdict(set)
 
-def extract_skills_ner(text: str) -> Dict[str, Set[str]]:
-    """Extract skills using spaCy's NER."""
+def extract_skills_ner(text: str, doc=None) -> Dict[str, Set[str]]:
+    """
+    Extract skills using spaCy's NER, reusing ``doc`` when one is given.
+
+    Without a ``doc`` only the sections that list skills are analysed (see
+    ner_input); the rule-based matcher covers the rest of the text. Only
+    SKILL entities count, so a pipeline without that label (the stock
+    en_core_web models) adds nothing here.
+    """
+    nlp = get_nlp()
     if not nlp:
         print("NER model not available, skipping NER extraction")
         return defaultdict(set)
     
     try:
         skills = defaultdict(set)
-        doc = nlp(text)
+        taxonomy = get_taxonomy()
+        if doc is None:
+            with optional_stage('ner'):
+                doc = nlp(ner_input(text))
         
         # Extract skills from NER
         for ent in doc.ents:
@@ -279,14 +410,16 @@ def extract_skills_ner(text: str) -> Dict[str, Set[str]]:
                 if not skill:
                     continue
                     
-                # Add to relevant categories
-                skill_lower = skill.lower()
-                for category, category_skills in SKILL_DB.items():
-                    if any(s.lower() in skill_lower or skill_lower in s.lower() for s in category_skills):
-                        skills[category].add(skill)
+                # Add to relevant categories: an exact name or synonym first,
+                # then any taxonomy skill mentioned inside the entity
+                categories = {category for category, _ in taxonomy.lookup(skill)}
+                if not categories:
+                    categories = set(taxonomy.matcher.match(skill))
+                for category in categories:
+                    skills[category].add(skill)
                         
                 # If no category found, add to a general skills category
-                if not any(skill in category_skills for skills in skills.values()):
+                if not categories:
                     skills['Other Skills'].add(skill)
         
         return skills
@@ -294,22 +427,52 @@ def extract_skills_ner(text: str) -> Dict[str, Set[str]]:
         print(f"Error in NER extraction: {str(e)}")
         return defaultdict(set)
 
-def extract_skills(text: str) -> Dict[str, List[str]]:
+def _load_skill_embeddings():
+    return load_skill_embeddings(get_taxonomy().skill_db)
+
+# The taxonomy embedding matrix is built once, persisted, and shared like any other model
+model_registry.register('skill_embeddings', _load_skill_embeddings)
+
+def extract_skills_semantic(text: str, sections: Optional[List[Section]] = None, doc=None) -> Dict[str, Set[str]]:
+    """Extract skills by embedding similarity to SKILL_DB, when enabled in settings."""
+    if not get_setting('RESUME_PARSER_SEMANTIC_MATCHING') or not within_budget('semantic'):
+        return defaultdict(set)
+    try:
+        print("Performing semantic skill matching...")
+        with optional_stage('semantic'):
+            return match_skills_semantic(text, model_registry.get('skill_embeddings'), sections, doc)
+    except Exception as e:
+        print(f"Error in semantic extraction: {str(e)}")
+        return defaultdict(set)
+
+def extract_skills(text: str, doc=None, sections: Optional[List[Section]] = None) -> Dict[str, List[str]]:
     """Hybrid skill extraction combining multiple approaches."""
     try:
         # Limit text size to prevent memory issues
-        text = text[:100000]
+        text = text[:MAX_SKILL_TEXT_CHARS]
         print("Starting skill extraction...")
         
         # Step 1: Rule-based extraction (fast, exact matches)
         print("Performing rule-based extraction...")
-        rule_based_skills = extract_skills_rule_based(text)
+        with stage('skills_rule_based', len(text)):
+            rule_based_skills = extract_skills_rule_based(text, sections)
         
         # Step 2: NER-based extraction (context-aware) - only if model is available
         ner_skills = defaultdict(set)
+        if not get_model_tier().skills_ner:
+            nlp = None
+        elif doc is not None:
+            nlp = get_nlp()
+        else:
+            nlp = _nlp_within_budget('ner')
         if nlp:
             print("Performing NER-based extraction...")
-            ner_skills = extract_skills_ner(text)
+            with stage('skills_ner', len(text)):
+                ner_skills = extract_skills_ner(text, doc)
+        
+        # Step 3: Semantic matching for skills spelled differently from SKILL_DB (optional)
+        with stage('skills_semantic', len(text)):
+            semantic_skills = extract_skills_semantic(text, sections, doc)
         
         # Merge results from all methods
         final_skills = defaultdict(set)
@@ -323,6 +486,9 @@ def extract_skills(text: str) -> Dict[str, List[str]]:
             for category, skills in ner_skills.items():
                 final_skills[category].update(skills)
         
+        for category, skills in semantic_skills.items():
+            final_skills[category].update(skills)
+        
         # Post-process: Remove duplicates and sort
         processed_skills = {}
         for category, skill_set in final_skills.items():
@@ -361,45 +527,299 @@ def format_skills_for_display(skills_dict: Dict[str, List[str]]) -> str:
     
     return ", ".join(formatted_skills)
 
-def parse_resume_file(file_path: str) -> Dict:
-    """Main function to parse a resume file and extract information."""
+def _extract_text(data, file_type: str, stats: Optional[Dict[str, int]] = None) -> str:
+    """Extract text from in-memory file contents based on the file type."""
+    # mmap objects are already seekable streams; plain buffers need wrapping
+    stream = data if isinstance(data, mmap.mmap) else io.BytesIO(data)
+    if file_type == '.pdf':
+        return extract_text_from_pdf(stream, stats)
+    if file_type == '.docx':
+        return extract_text_from_docx(stream, stats)
+    raise ValueError("Unsupported file format. Please upload PDF or DOCX")
+
+def _map_file(path) -> mmap.mmap:
+    """Memory-map a file read-only so it is parsed without copying it into memory."""
+    with open(path, 'rb') as mapped_file:
+        return mmap.mmap(mapped_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+def _load_source(source, filename: Optional[str] = None):
+    """
+    Return (buffer, file type) for a resume given as a path, bytes-like object or file object.
+
+    Paths and uploads Django has already spooled to disk are memory-mapped;
+    everything else is read straight from memory, so small uploads never
+    touch the filesystem.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        data = source
+        filename = filename or ''
+    elif isinstance(source, (str, os.PathLike)):
+        data = _map_file(source)
+        filename = filename or os.fspath(source)
+    elif hasattr(source, 'temporary_file_path'):
+        # Large Django uploads (TemporaryUploadedFile) already live on disk
+        data = _map_file(source.temporary_file_path())
+        filename = filename or source.name
+    elif hasattr(source, 'read'):
+        if hasattr(source, 'seek'):
+            source.seek(0)
+        data = source.read()
+        filename = filename or getattr(source, 'name', '') or ''
+    else:
+        raise TypeError(f"Unsupported resume source: {type(source).__name__}")
+
+    return data, os.path.splitext(filename)[1].lower()
+
+def ner_input(text: str, sections: Optional[List[Section]] = None) -> str:
+    """
+    Return the part of the resume the spaCy pipeline runs over: the header
+    plus the contact, summary, skills and projects sections.
+    """
+    if sections is None:
+        sections = segment_resume(text)
+    return ner_text(text, sections, prefix=len(header_chunk(text)))[:MAX_SKILL_TEXT_CHARS]
+
+def analyze_text(text: str, sections: Optional[List[Section]] = None):
+    """
+    Run the spaCy pipeline once over the sections of the resume the extractors read.
+
+    Returns None when the model tier does not run skill NER, or the parse
+    deadline leaves no time for it; name extraction then runs the pipeline
+    over the header alone, if at all.
+    """
+    nlp = _nlp_within_budget('ner') if get_model_tier().skills_ner else None
+    if not nlp:
+        return None
+    text = ner_input(text, sections)
+    with stage('spacy', len(text)), optional_stage('ner'):
+        return nlp(text)
+
+def _build_result(text: str, doc=None, sections: Optional[List[Section]] = None) -> Dict:
+    """Run contact and skill extraction over extracted text, sharing one spaCy Doc."""
+    if sections is None:
+        with stage('segment', len(text)):
+            sections = segment_resume(text)
+    if doc is None:
+        doc = analyze_text(text, sections)
+    name_ner = get_model_tier().name_ner
+    with stage('extract_contact', len(text)):
+        contact = extract_contact(text, _name_nlp, doc if name_ner else None)
+    skills_dict = extract_skills(text, doc, sections)
+    skills_string = format_skills_for_display(skills_dict)
+
+    return {
+        'name': contact['name'] or '',
+        'email': contact['email'] or '',
+        'phone': contact['phone'] or '',
+        'skills': skills_string,
+        'skills_by_category': skills_dict,
+        'sections': [section.to_dict() for section in sections],
+        'ner_tokens': len(doc) if doc is not None else 0,
+        'degraded': skipped_stages(),
+        'success': True,
+        'message': 'Resume parsed successfully. Please review and edit the extracted information.'
+    }
+
+def parser_output_version() -> str:
+    """Parser version plus the settings that change parse output, for cache keys and stored parses."""
+    version = f'{PARSER_VERSION}+taxonomy.{get_taxonomy().fingerprint}'
+    tier = get_model_tier_name()
+    if tier != DEFAULT_MODEL_TIER:
+        version += f'+{tier}'
+    pdf_backend = get_pdf_backend().name
+    if pdf_backend != DEFAULT_PDF_BACKEND:
+        version += f'+pdf.{pdf_backend}'
+    if get_setting('RESUME_PARSER_SEMANTIC_MATCHING'):
+        version += '+semantic'
+    return version
+
+def parse_resume_document(source, filename: Optional[str] = None) -> Tuple[str, Dict]:
+    """
+    Return the extracted text and the parse result for a resume.
+
+    Unlike parse_resume_file this bypasses the result cache and raises on
+    failure, for callers that persist the text alongside the result.
+    """
+    data = None
     try:
-        # Extract text based on file type
-        if file_path.lower().endswith('.pdf'):
-            text = extract_text_from_pdf(file_path)
-        elif file_path.lower().endswith('.docx'):
-            text = extract_text_from_docx(file_path)
-        else:
+        data, file_type = _load_source(source, filename)
+        if file_type not in SUPPORTED_FILE_TYPES:
             raise ValueError("Unsupported file format. Please upload PDF or DOCX")
-        
+        text = _extract_text(data, file_type)
+        if not text.strip():
+            raise ValueError("No text could be extracted from the file")
+        return text, _build_result(text)
+    finally:
+        if isinstance(data, mmap.mmap):
+            data.close()
+
+def _error_result(error: Exception) -> Dict:
+    return {
+        'name': '',
+        'email': '',
+        'phone': '',
+        'skills': '',
+        'skills_by_category': {},
+        'sections': [],
+        'ner_tokens': 0,
+        'degraded': [],
+        'success': False,
+        'message': f'Error parsing resume: {str(error)}'
+    }
+
+def parse_resume_file(source, filename: Optional[str] = None, collect_timings: bool = False,
+                      budget_ms: Optional[float] = None) -> Dict:
+    """
+    Main function to parse a resume file and extract information.
+
+    ``source`` may be a file path, bytes, a memoryview or a file-like object
+    such as a Django upload. ``filename`` supplies the file type when the
+    source does not carry a name of its own (e.g. raw bytes). With
+    ``collect_timings`` the result carries a per-stage ``timings`` block.
+
+    With ``budget_ms`` the parse aims to finish within that many
+    milliseconds: optional stages are skipped once the time runs out and
+    listed in the result's ``degraded`` field. Degraded results are not cached.
+    """
+    with trace(collect_timings, filename=filename or getattr(source, 'name', None)) as parse_trace, \
+            deadline(budget_ms):
+        result = _parse_resume_file(source, filename)
+        if parse_trace is not None:
+            parse_trace.context.update(success=result['success'], cached=result.get('cached', False))
+    if collect_timings and parse_trace is not None:
+        result['timings'] = parse_trace.to_dict()
+    return result
+
+def _parse_resume_file(source, filename: Optional[str] = None) -> Dict:
+    data = None
+    try:
+        with stage('load_source'):
+            data, file_type = _load_source(source, filename)
+        if file_type not in SUPPORTED_FILE_TYPES:
+            raise ValueError("Unsupported file format. Please upload PDF or DOCX")
+
+        # Identical uploads are answered from the cache without touching the NLP models
+        with stage('cache_lookup', len(data)):
+            cache_key = parse_cache.make_key(data, file_type, parser_output_version())
+            cached = parse_cache.get(cache_key)
+        if cached is not None:
+            cached.setdefault('degraded', [])
+            cached['cached'] = True
+            return cached
+
+        # Extract text based on file type
+        extraction_stats = {}
+        with stage('extract_text', len(data)):
+            text = _extract_text(data, file_type, extraction_stats)
         if not text.strip():
             raise ValueError("No text could be extracted from the file")
         
         # Extract information
-        name = extract_name(text)
-        email = extract_email(text)
-        phone = extract_phone(text)
-        skills_dict = extract_skills(text)
-        skills_string = format_skills_for_display(skills_dict)
-        
-        result = {
-            'name': name or '',
-            'email': email or '',
-            'phone': phone or '',
-            'skills': skills_string,
-            'success': True,
-            'message': 'Resume parsed successfully. Please review and edit the extracted information.'
-        }
+        result = _build_result(text)
+        result['pages_skipped'] = extraction_stats.get('pages_skipped', 0)
+        result['text_truncated'] = extraction_stats.get('truncated', False)
+        if not result['degraded']:
+            # A degraded result would be served in place of a full parse of the same file
+            with stage('cache_store'):
+                parse_cache.set(cache_key, result)
         
+        result['cached'] = False
         return result
         
     except Exception as e:
         print(f"Error parsing resume: {str(e)}")
-        return {
-            'name': '',
-            'email': '',
-            'phone': '',
-            'skills': '',
-            'success': False,
-            'message': f'Error parsing resume: {str(e)}'
-        } 
\ No newline at end of file
+        return _error_result(e)
+    finally:
+        if isinstance(data, mmap.mmap):
+            data.close()
+
+def parse_resume_batch(files: Iterable[Tuple[str, bytes]], batch_size: Optional[int] = None) -> Iterator[Dict]:
+    """
+    Parse many resumes, batching the spaCy work through ``nlp.pipe``.
+
+    ``files`` yields (filename, file contents) pairs. One result is yielded per
+    file as soon as it is ready, so cached files and failures come back before
+    the batch they were queued with; every result carries its 'filename'.
+    """
+    batch_size = batch_size or get_setting('RESUME_PARSER_BATCH_SIZE')
+    pending = []
+
+    for filename, data in files:
+        try:
+            file_type = os.path.splitext(filename)[1].lower()
+            if file_type not in SUPPORTED_FILE_TYPES:
+                raise ValueError("Unsupported file format. Please upload PDF or DOCX")
+
+            cache_key = parse_cache.make_key(data, file_type, parser_output_version())
+            cached = parse_cache.get(cache_key)
+            if cached is not None:
+                cached.update(cached=True, filename=filename)
+                yield cached
+                continue
+
+            extraction_stats = {}
+            text = _extract_text(data, file_type, extraction_stats)
+            if not text.strip():
+                raise ValueError("No text could be extracted from the file")
+        except Exception as e:
+            print(f"Error parsing resume {filename}: {str(e)}")
+            result = _error_result(e)
+            result['filename'] = filename
+            yield result
+            continue
+
+        pending.append((filename, cache_key, text, extraction_stats))
+        if len(pending) >= batch_size:
+            yield from _parse_pending_batch(pending, batch_size)
+            pending = []
+
+    if pending:
+        yield from _parse_pending_batch(pending, batch_size)
+
+def _pipe_docs(nlp, texts: List[str], batch_size: int) -> List:
+    """
+    Run texts through one nlp.pipe pass.
+
+    If the batch fails, each text is retried on its own, and a text that
+    still fails gets its exception in place of a Doc.
+    """
+    try:
+        return list(nlp.pipe(texts, batch_size=batch_size))
+    except Exception as e:
+        print(f"Error in batch NER, retrying resumes one at a time: {str(e)}")
+    docs = []
+    for text in texts:
+        try:
+            docs.append(nlp(text))
+        except Exception as e:
+            docs.append(e)
+    return docs
+
+def _parse_pending_batch(pending: List[Tuple[str, str, str, Dict]], batch_size: int) -> Iterator[Dict]:
+    """Run one nlp.pipe pass over a batch of extracted texts and yield results."""
+    segmented = [segment_resume(text) for _, _, text, _ in pending]
+    try:
+        nlp = _nlp_within_budget('ner') if get_model_tier().skills_ner else None
+        if nlp:
+            docs = _pipe_docs(nlp, [ner_input(text, sections)
+                                    for (_, _, text, _), sections in zip(pending, segmented)], batch_size)
+        else:
+            docs = [None] * len(pending)
+    except Exception as e:
+        # The model failed to load; every resume of the batch reports it
+        docs = [e] * len(pending)
+
+    for (filename, cache_key, text, extraction_stats), sections, doc in zip(pending, segmented, docs):
+        try:
+            if isinstance(doc, Exception):
+                raise doc
+            result = _build_result(text, doc, sections)
+            result['pages_skipped'] = extraction_stats.get('pages_skipped', 0)
+            result['text_truncated'] = extraction_stats.get('truncated', False)
+            parse_cache.set(cache_key, result)
+            result['cached'] = False
+        except Exception as e:
+            print(f"Error parsing resume {filename}: {str(e)}")
+            result = _error_result(e)
+        result['filename'] = filename
+        yield result
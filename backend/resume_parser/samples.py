@@ -0,0 +1,122 @@
+"""
+Minimal PDF and DOCX writers for sample resumes.
+
+Used by the model warm-up and the benchmark corpus. Both formats are written
+by hand, with no third-party packages and fixed metadata, so the same lines
+always produce byte-identical files.
+"""
+import io
+import zipfile
+from typing import List
+from xml.sax.saxutils import escape
+
+# Warm-up resume: a short, typical header, summary, skills and experience
+SAMPLE_RESUME_LINES = (
+    'Jane Doe',
+    'jane.doe@example.com | +1 555 010 0199',
+    'Summary',
+    'Backend engineer building data-heavy web services.',
+    'Skills',
+    'Python, Django, PostgreSQL, Docker, AWS, React',
+    'Experience',
+    'Senior Software Engineer, Example Corp, 2019 - present',
+)
+
+
+def _pdf_escape(line: str) -> str:
+    return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def render_pdf(pages: List[List[str]]) -> bytes:
+    """Render lines of text into a minimal PDF using the built-in Helvetica font."""
+    objects = []  # Object bodies; object number is index + 1
+
+    def add(body: bytes) -> int:
+        objects.append(body)
+        return len(objects)
+
+    catalog = add(b'')  # Filled in once the page tree exists
+    pages_id = add(b'')
+    font_id = add(b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>')
+
+    page_ids = []
+    for lines in pages:
+        content = ['BT', '/F1 10 Tf', '14 TL', '50 760 Td']
+        for line in lines:
+            content.append(f'({_pdf_escape(line)}) Tj T*')
+        content.append('ET')
+        stream = '\n'.join(content).encode('latin-1', 'replace')
+        content_id = add(b'<< /Length %d >>\nstream\n%s\nendstream' % (len(stream), stream))
+        page_ids.append(add(
+            b'<< /Type /Page /Parent %d 0 R /MediaBox [0 0 612 792] '
+            b'/Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>' % (pages_id, font_id, content_id)
+        ))
+
+    objects[catalog - 1] = b'<< /Type /Catalog /Pages %d 0 R >>' % pages_id
+    kids = b' '.join(b'%d 0 R' % page_id for page_id in page_ids)
+    objects[pages_id - 1] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % (kids, len(page_ids))
+
+    out = io.BytesIO()
+    out.write(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b'%d 0 obj\n%s\nendobj\n' % (number, body))
+    xref = out.tell()
+    out.write(b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b'%010d 00000 n \n' % offset)
+    out.write(b'trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, catalog, xref))
+    return out.getvalue()
+
+
+_DOCX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+_DOCX_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    '</Relationships>'
+)
+# Earliest date a zip entry can carry
+_DOCX_TIMESTAMP = (1980, 1, 1, 0, 0, 0)
+
+
+def docx_paragraph(line: str) -> str:
+    return f'<w:p><w:r><w:t xml:space="preserve">{escape(line)}</w:t></w:r></w:p>'
+
+
+def render_docx_xml(body_xml: str) -> bytes:
+    """Package WordprocessingML body content as a DOCX file."""
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f'<w:body>{body_xml}</w:body></w:document>'
+    )
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for name, content in (('[Content_Types].xml', _DOCX_CONTENT_TYPES), ('_rels/.rels', _DOCX_RELS),
+                              ('word/document.xml', document)):
+            # A fixed timestamp keeps the bytes, and so cache keys and baselines, reproducible
+            archive.writestr(zipfile.ZipInfo(name, date_time=_DOCX_TIMESTAMP), content,
+                             compress_type=zipfile.ZIP_DEFLATED)
+    return out.getvalue()
+
+
+def sample_pdf() -> bytes:
+    """The sample resume as a one-page PDF."""
+    return render_pdf([list(SAMPLE_RESUME_LINES)])
+
+
+def sample_docx() -> bytes:
+    """The sample resume as a minimal DOCX."""
+    return render_docx_xml(''.join(docx_paragraph(line) for line in SAMPLE_RESUME_LINES))
@@ -0,0 +1,134 @@
+"""
+Rule-based resume segmentation.
+
+Resumes are split into sections (contact, summary, skills, experience,
+education, ...) by matching known headings at the start of a line. The
+spaCy pipeline then only runs over the sections where entities matter,
+while the rule-based skill matcher still reads the whole text. Long
+experience narratives and references, the bulk of most resumes, never go
+through NER.
+"""
+import re
+from typing import Dict, List, NamedTuple, Tuple
+
+# Everything before the first recognised heading
+CONTACT_SECTION = 'contact'
+# The whole text when no heading is recognised
+UNSEGMENTED_SECTION = 'other'
+
+SECTION_HEADINGS = {
+    'summary': ('summary', 'professional summary', 'career summary', 'profile', 'professional profile',
+                'objective', 'career objective', 'about me'),
+    'skills': ('skills', 'technical skills', 'key skills', 'core skills', 'skills and abilities',
+               'core competencies', 'competencies', 'technologies', 'technical expertise',
+               'areas of expertise', 'tech stack', 'tools and technologies'),
+    'experience': ('experience', 'work experience', 'professional experience', 'employment',
+                   'employment history', 'work history', 'career history'),
+    'education': ('education', 'academic background', 'education and training', 'qualifications'),
+    'projects': ('projects', 'personal projects', 'key projects', 'selected projects'),
+    'certifications': ('certifications', 'certificates', 'licenses and certifications'),
+    'awards': ('awards', 'honors', 'honours', 'achievements'),
+    'publications': ('publications',),
+    'languages': ('languages',),
+    'interests': ('interests', 'hobbies'),
+    'references': ('references',),
+}
+
+# Sections whose entities (names, skill mentions) the NER stages look for
+NER_SECTIONS = frozenset({CONTACT_SECTION, 'summary', 'skills', 'projects', UNSEGMENTED_SECTION})
+
+_HEADING_SECTIONS = {heading: name for name, headings in SECTION_HEADINGS.items() for heading in headings}
+
+
+def _alternation(headings) -> str:
+    """Regex alternation of headings, longest first, with flexible spacing between words."""
+    return '|'.join(r'[ \t]+'.join(map(re.escape, heading.split()))
+                    for heading in sorted(headings, key=len, reverse=True))
+
+
+# A heading on a line of its own, or followed by a colon and the section's first entries
+HEADING_PATTERN = re.compile(
+    r'^[ \t]*(?:#+[ \t]*)?(?P<heading>' + _alternation(_HEADING_SECTIONS) + r')[ \t]*(?::[^\n]*)?$',
+    re.IGNORECASE | re.MULTILINE,
+)
+# Upper-case headings inside text whose line breaks were lost in extraction
+INLINE_HEADING_PATTERN = re.compile(
+    r'(?<![\w&])(?P<heading>' + _alternation(heading.upper() for heading in _HEADING_SECTIONS) + r')(?![\w&])'
+)
+# Fewer line breaks than this and the text is treated as flattened
+_MIN_LINES = 4
+
+
+class Section(NamedTuple):
+    """A section of the resume text, as character offsets into it."""
+    name: str
+    heading: str
+    start: int
+    end: int
+
+    def to_dict(self) -> Dict:
+        return self._asdict()
+
+
+def _heading_matches(text: str):
+    if text.count('\n') + 1 >= _MIN_LINES:
+        return HEADING_PATTERN.finditer(text)
+    return INLINE_HEADING_PATTERN.finditer(text)
+
+
+def segment_resume(text: str) -> List[Section]:
+    """
+    Split resume text into sections in document order.
+
+    Text before the first heading is the contact section. When no heading is
+    recognised the whole text is one 'other' section, so callers fall back to
+    treating the resume as a whole.
+    """
+    boundaries = []
+    for match in _heading_matches(text):
+        heading = ' '.join(match.group('heading').split())
+        boundaries.append((match.start(), _HEADING_SECTIONS[heading.lower()], heading))
+
+    if not boundaries:
+        return [Section(UNSEGMENTED_SECTION, '', 0, len(text))] if text else []
+
+    sections = []
+    if text[:boundaries[0][0]].strip():
+        sections.append(Section(CONTACT_SECTION, '', 0, boundaries[0][0]))
+    for index, (start, name, heading) in enumerate(boundaries):
+        end = boundaries[index + 1][0] if index + 1 < len(boundaries) else len(text)
+        sections.append(Section(name, heading, start, end))
+    return sections
+
+
+def section_spans(sections: List[Section], names) -> List[Tuple[int, int]]:
+    """Return the (start, end) offsets of the sections with one of the given names."""
+    return [(section.start, section.end) for section in sections if section.name in names]
+
+
+def ner_spans(sections: List[Section], prefix: int = 0) -> List[Tuple[int, int]]:
+    """
+    Return the merged character ranges NER should run over.
+
+    ``prefix`` characters from the start of the text are always included, so
+    the resume header is analysed even when a heading appears inside it.
+    """
+    spans = [(0, prefix)] if prefix else []
+    spans += section_spans(sections, NER_SECTIONS)
+    merged = []
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def ner_text(text: str, sections: List[Section], prefix: int = 0, separator: str = '\n\n') -> str:
+    """
+    Join the parts of ``text`` that NER runs over.
+
+    The first span always starts at offset 0, so entity offsets inside the
+    header are offsets into the original text as well.
+    """
+    return separator.join(text[start:end] for start, end in ner_spans(sections, prefix))
@@ -0,0 +1,168 @@
+"""
+Optional semantic skill matching.
+
+Rule-based matching only finds skills spelled the way SKILL_DB spells them.
+This stage embeds every taxonomy skill once into a normalized matrix that is
+persisted to disk, then embeds candidate phrases from a resume in one batch
+and assigns each to its nearest taxonomy skills with a single matrix product.
+
+Enable it with RESUME_PARSER_SEMANTIC_MATCHING. numpy and
+sentence-transformers are only imported when the stage actually runs.
+"""
+import hashlib
+import json
+import os
+import re
+import tempfile
+from collections import defaultdict
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from .conf import get_setting
+from .model_registry import registry as model_registry
+from .sections import Section
+
+# Separators between list items in skills sections ("Python, Django | REST")
+_PHRASE_SPLIT = re.compile(r'[\n,;|/•·()\[\]]+|\s+-\s+|\s+and\s+', re.IGNORECASE)
+_HAS_LETTER = re.compile(r'[A-Za-z]')
+# Sections candidate phrases are taken from, in priority order
+SEMANTIC_SECTIONS = ('skills', 'summary')
+
+
+def _load_sentence_model():
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(get_setting('RESUME_PARSER_SEMANTIC_MODEL'))
+
+model_registry.register('sentence_model', _load_sentence_model)
+
+
+class SkillEmbeddings:
+    """Unit-normalized embedding matrix with one row per (category, skill)."""
+
+    def __init__(self, skills: List[Tuple[str, str]], matrix):
+        self.skills = skills
+        self.matrix = matrix
+
+
+def taxonomy_skills(skill_db: Mapping[str, Iterable[str]]) -> List[Tuple[str, str]]:
+    """Return the taxonomy as a stable, sorted list of (category, skill) pairs."""
+    return sorted((category, skill) for category, skills in skill_db.items() for skill in skills)
+
+
+def taxonomy_fingerprint(skills: List[Tuple[str, str]], model_name: str) -> str:
+    digest = hashlib.sha256(model_name.encode())
+    digest.update(json.dumps(skills).encode())
+    return digest.hexdigest()[:16]
+
+
+def _embeddings_dir() -> str:
+    return get_setting('RESUME_PARSER_EMBEDDINGS_DIR') or os.path.join(
+        tempfile.gettempdir(), 'talentlink-skill-embeddings'
+    )
+
+
+def _encode(phrases: List[str]):
+    model = model_registry.get('sentence_model')
+    return model.encode(phrases, batch_size=64, convert_to_numpy=True,
+                        normalize_embeddings=True, show_progress_bar=False)
+
+
+def load_skill_embeddings(skill_db: Mapping[str, Iterable[str]]) -> SkillEmbeddings:
+    """
+    Load the taxonomy embedding matrix, embedding and persisting it on first use.
+
+    The file name carries a fingerprint of the taxonomy and model, so a
+    taxonomy change produces a new matrix instead of serving a stale one.
+    """
+    import numpy as np
+
+    skills = taxonomy_skills(skill_db)
+    model_name = get_setting('RESUME_PARSER_SEMANTIC_MODEL')
+    path = os.path.join(_embeddings_dir(), f'skills-{taxonomy_fingerprint(skills, model_name)}.npy')
+
+    if os.path.exists(path):
+        # Memory-mapped, so every process on the host shares the same pages
+        return SkillEmbeddings(skills, np.load(path, mmap_mode='r'))
+
+    print(f"Embedding {len(skills)} taxonomy skills with {model_name}...")
+    matrix = _encode([skill for _, skill in skills]).astype(np.float32)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.npy')
+        with os.fdopen(fd, 'wb') as tmp:
+            np.save(tmp, matrix)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Warning: Could not persist skill embeddings: {str(e)}")
+    return SkillEmbeddings(skills, matrix)
+
+
+def _section_texts(text: str, sections: Optional[List[Section]]) -> List[Tuple[str, str]]:
+    """Return (heading, text) of the sections candidates come from, skills first, or the whole text."""
+    chosen = [(section.heading, text[section.start:section.end])
+              for name in SEMANTIC_SECTIONS for section in sections or () if section.name == name]
+    return chosen or [('', text)]
+
+
+def _noun_chunks(doc, source: str) -> List[str]:
+    """Noun chunks of ``doc`` inside ``source``, or an empty list when the pipeline has no parser."""
+    if doc is None or not doc.has_annotation('DEP'):
+        return []
+    start = doc.text.find(source)
+    if start < 0:
+        return []
+    end = start + len(source)
+    return [chunk.text for chunk in doc.noun_chunks if start <= chunk.start_char and chunk.end_char <= end]
+
+
+def extract_candidate_phrases(text: str, max_candidates: int, sections: Optional[List[Section]] = None,
+                              doc=None) -> List[str]:
+    """
+    Return short, distinct phrases that could name a skill.
+
+    Phrases come from the skills sections, then the summary, so the
+    candidate cap is not spent on experience narratives; the whole text is
+    only read when neither section was found. Noun chunks are added when
+    ``doc`` was produced by a pipeline with a dependency parser.
+    """
+    seen = set()
+    phrases = []
+    for heading, source in _section_texts(text, sections):
+        seen.add(heading.lower())
+        for phrase in _PHRASE_SPLIT.split(source) + _noun_chunks(doc, source):
+            phrase = phrase.strip(' \t.:*-')
+            if not 2 <= len(phrase) <= 40 or not _HAS_LETTER.search(phrase):
+                continue
+            if len(phrase.split()) > 4:
+                continue
+            key = phrase.lower()
+            if key in seen:
+                continue
+            seen.add(key)
+            phrases.append(phrase)
+            if len(phrases) >= max_candidates:
+                return phrases
+    return phrases
+
+
+def match_skills_semantic(text: str, embeddings: SkillEmbeddings, sections: Optional[List[Section]] = None,
+                          doc=None) -> Dict[str, Set[str]]:
+    """Assign candidate phrases to their nearest taxonomy skills above the similarity threshold."""
+    import numpy as np
+
+    skills = defaultdict(set)
+    candidates = extract_candidate_phrases(text, get_setting('RESUME_PARSER_SEMANTIC_MAX_CANDIDATES'),
+                                           sections, doc)
+    if not candidates or not embeddings.skills:
+        return skills
+
+    # Rows are unit vectors, so one matrix product gives every cosine similarity
+    scores = _encode(candidates) @ np.asarray(embeddings.matrix).T
+    top_k = min(get_setting('RESUME_PARSER_SEMANTIC_TOP_K'), scores.shape[1])
+    threshold = get_setting('RESUME_PARSER_SEMANTIC_THRESHOLD')
+
+    top = np.argpartition(-scores, top_k - 1, axis=1)[:, :top_k]
+    top_scores = np.take_along_axis(scores, top, axis=1)
+    for row, col in zip(*np.nonzero(top_scores >= threshold)):
+        category, skill = embeddings.skills[top[row, col]]
+        skills[category].add(skill)
+    return skills
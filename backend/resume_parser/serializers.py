@@ -0,0 +1,10 @@
+from rest_framework import serializers
+
+from .models import ParsedResume
+
+
+class ParsedResumeSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ParsedResume
+        fields = ['id', 'filename', 'name', 'email', 'phone', 'skills', 'parser_version', 'updated_at']
+        read_only_fields = fields
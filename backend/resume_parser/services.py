@@ -0,0 +1,98 @@
+"""
+Persisted resume parses.
+
+Structured resume data is stored in ParsedResume rows keyed by the file's
+content hash, so recruiter views and matching read it from the database
+instead of running the parser again. A stored parse is only redone when the
+parser output version (parser version, taxonomy and parse settings) changes.
+"""
+import hashlib
+from typing import Optional
+
+from django.db.models import Q
+
+from .models import ParsedResume
+from .resume_parser import format_skills_for_display, parser_output_version
+from .worker_pool import dispatch_parse_document
+
+
+def content_hash(data) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def is_current(parsed: Optional[ParsedResume]) -> bool:
+    """True if a stored parse was produced by the running parser version."""
+    return parsed is not None and parsed.parser_version == parser_output_version()
+
+
+def get_or_parse_resume(user, data: bytes, filename: str) -> ParsedResume:
+    """
+    Return the stored parse of a resume, parsing and storing it if needed.
+
+    The parse runs in the dedicated worker pool when one is configured.
+    Raises ValueError (or the underlying extraction error) if the file
+    cannot be parsed.
+    """
+    digest = content_hash(data)
+    parsed = ParsedResume.objects.filter(user=user, content_hash=digest).first()
+    if is_current(parsed):
+        return parsed
+
+    text, result = dispatch_parse_document(data, filename)
+    parsed, _ = ParsedResume.objects.update_or_create(
+        user=user,
+        content_hash=digest,
+        defaults={
+            'filename': filename[:255],
+            'text': text,
+            'name': result['name'][:255],
+            'email': result['email'][:254],
+            'phone': result['phone'][:50],
+            'skills': result['skills_by_category'],
+            'parser_version': parser_output_version(),
+        },
+    )
+    return parsed
+
+
+def parsed_resume_for_application(application) -> Optional[ParsedResume]:
+    """
+    Return the stored parse of an application's resume, parsing it on first use.
+
+    Returns None when the application has no resume attached.
+    """
+    if is_current(application.parsed_resume):
+        return application.parsed_resume
+    if not application.resume:
+        return None
+
+    with application.resume.open('rb') as resume_file:
+        data = resume_file.read()
+    parsed = get_or_parse_resume(application.applicant, data, application.resume.name)
+    if application.parsed_resume_id != parsed.id:
+        application.parsed_resume = parsed
+        application.save(update_fields=['parsed_resume'])
+    return parsed
+
+
+def fill_application_from_resume(application) -> Optional[ParsedResume]:
+    """
+    Link an application to the stored parse of its resume and fill in its
+    skills when the applicant left them empty.
+
+    Resumes whose content hash was already parsed by the running parser
+    version are not parsed again.
+    """
+    parsed = parsed_resume_for_application(application)
+    if parsed is not None and parsed.skills and not (application.skills or '').strip():
+        application.skills = format_skills_for_display(parsed.skills)
+        application.save(update_fields=['skills'])
+    return parsed
+
+
+def applications_needing_parse(queryset):
+    """Narrow a JobApplication queryset to those with a resume but no current stored parse."""
+    return (queryset
+            .exclude(resume='')
+            .exclude(resume__isnull=True)
+            .filter(Q(parsed_resume__isnull=True) | ~Q(parsed_resume__parser_version=parser_output_version())))
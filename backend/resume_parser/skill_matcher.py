@@ -0,0 +1,166 @@
+"""
+Multi-pattern skill matcher for rule-based skill extraction.
+
+Every skill spelling is indexed under its first word, so a resume is scanned
+in a single pass with one hash lookup per word no matter how many skills the
+taxonomy holds, and compiling the index is cheap enough to redo on every
+taxonomy reload. Matches are only accepted on word boundaries, which keeps
+short skills such as 'r', 'go' or 'ai' from matching inside other words.
+
+Spellings that are also ordinary words ('go', 'rest') or too short to tell
+apart from initials ('r' in 'R&D') are ambiguous: they only match as a list
+item ("Python, Go, R"), inside a skills section, or capitalised mid-sentence
+("written in Go").
+"""
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
+
+# Separators a multi-word skill may be written with ("unit testing", "unit-testing", ...)
+SKILL_SEPARATOR_VARIANTS = (' ', '-', '_', '')
+
+# A maximal run of letters and digits; '_' counts as a separator, as in str.isalnum
+_WORD = re.compile(r'[^\W_]+')
+
+# Alphanumeric spellings this short are ambiguous unless matched case-sensitively
+AMBIGUOUS_MAX_LENGTH = 2
+# What may surround an ambiguous spelling for it to count as a list item
+_LIST_ITEM_BEFORE = frozenset('\n,;|/:([-*\u2022\u00b7')
+_LIST_ITEM_AFTER = frozenset('\n,;|/)].\u2022\u00b7')
+# A capitalised word right after these starts a sentence, so its case says nothing
+_SENTENCE_BREAK = frozenset('\n.!?')
+
+
+def is_ambiguous_spelling(spelling: str) -> bool:
+    """Whether a (lower-cased) spelling is too short to trust in running prose."""
+    return spelling.isalnum() and len(spelling) <= AMBIGUOUS_MAX_LENGTH
+
+
+def _in_context(text: str, original: str, start: int, end: int,
+                context_spans: Sequence[Tuple[int, int]]) -> bool:
+    """Whether an ambiguous match at text[start:end] is clearly meant as a skill."""
+    if any(span_start <= start and end <= span_end for span_start, span_end in context_spans):
+        return True
+    before = start - 1
+    while before >= 0 and text[before] in ' \t':
+        before -= 1
+    after = end
+    while after < len(text) and text[after] in ' \t':
+        after += 1
+    previous = text[before] if before >= 0 else '\n'
+    following = text[after] if after < len(text) else '\n'
+    if previous in _LIST_ITEM_BEFORE and following in _LIST_ITEM_AFTER:
+        return True
+    # Capitalised mid-sentence, and not part of an initialism such as R&D
+    return (original[start:end] != text[start:end] and previous not in _SENTENCE_BREAK
+            and text[start - 1:start] != '&' and text[end:end + 1] != '&')
+
+
+class SkillPattern:
+    """A single spelling to search for and the skill it resolves to."""
+
+    __slots__ = ('text', 'category', 'skill', 'case_sensitive')
+
+    def __init__(self, text: str, category: str, skill: str, case_sensitive: bool = False):
+        self.text = text
+        self.category = category
+        self.skill = skill
+        self.case_sensitive = case_sensitive
+
+
+class SkillMatcher:
+    """Hashed index of lower-cased skill spellings keyed by their first word."""
+
+    def __init__(self, patterns: Iterable[SkillPattern] = ()):
+        # first word -> [(offset of that word in the spelling, lower-cased spelling, pattern, ambiguous)]
+        self._index: Dict[str, List[Tuple[int, str, SkillPattern, bool]]] = {}
+        self.pattern_count = 0
+        for pattern in patterns:
+            self.add(pattern)
+
+    def add(self, pattern: SkillPattern, spelling: Optional[str] = None, ambiguous: bool = False) -> None:
+        """
+        Index one spelling of a pattern (its own text by default).
+
+        Case-insensitive patterns may be shared between many spellings, since
+        only case-sensitive matches are checked against ``pattern.text``.
+        ``ambiguous`` marks a spelling that is also a common word; very short
+        spellings are ambiguous anyway, unless the pattern is case-sensitive.
+        """
+        key = (spelling or pattern.text).lower()
+        if not pattern.case_sensitive:
+            ambiguous = ambiguous or is_ambiguous_spelling(key)
+        first = key.split(' ', 1)[0]
+        if first.isalnum():
+            offset = 0
+        else:
+            word = _WORD.search(key)
+            if word is None:
+                return
+            offset, first = word.start(), word.group()
+        candidates = self._index.get(first)
+        if candidates is None:
+            self._index[first] = [(offset, key, pattern, ambiguous)]
+        else:
+            candidates.append((offset, key, pattern, ambiguous))
+        self.pattern_count += 1
+
+    def iter_matches(self, text: str, context_spans: Sequence[Tuple[int, int]] = ()
+                     ) -> Iterator[Tuple[int, int, SkillPattern]]:
+        """
+        Yield (start, end, pattern) for every word-bounded match in text.
+
+        Ambiguous spellings anywhere inside ``context_spans`` (e.g. the skills
+        section) match without any further cue.
+        """
+        lowered = text.lower()
+        # Case-sensitive patterns are verified against the original text, which
+        # is only possible when lower-casing kept character offsets aligned
+        original = text if len(lowered) == len(text) else lowered
+        index = self._index
+        length = len(lowered)
+        for word in _WORD.finditer(lowered):
+            candidates = index.get(word.group())
+            if candidates is None:
+                continue
+            for offset, key, pattern, ambiguous in candidates:
+                start = word.start() - offset
+                end = start + len(key)
+                if start < 0 or (start > 0 and lowered[start - 1].isalnum()):
+                    continue
+                if end < length and lowered[end].isalnum():
+                    continue
+                if not lowered.startswith(key, start):
+                    continue
+                if pattern.case_sensitive and original[start:end] != pattern.text:
+                    continue
+                if ambiguous and not _in_context(lowered, original, start, end, context_spans):
+                    continue
+                yield start, end, pattern
+
+    def match(self, text: str, context_spans: Sequence[Tuple[int, int]] = ()) -> Dict[str, Set[str]]:
+        """Return the matched skills grouped by category."""
+        skills = defaultdict(set)
+        for _, _, pattern in self.iter_matches(text, context_spans):
+            skills[pattern.category].add(pattern.skill)
+        return skills
+
+
+def build_skill_matcher(skill_db: Mapping[str, Iterable[str]],
+                        abbreviations: Optional[Mapping[str, str]] = None) -> SkillMatcher:
+    """Compile a matcher from a category -> skills mapping and an abbreviation table."""
+    patterns = []
+    categories_by_skill = defaultdict(list)
+    for category, category_skills in skill_db.items():
+        for skill in category_skills:
+            categories_by_skill[skill.lower()].append((category, skill))
+            spellings = {skill.lower().replace(' ', separator) for separator in SKILL_SEPARATOR_VARIANTS}
+            for spelling in spellings:
+                patterns.append(SkillPattern(spelling, category, skill))
+
+    # Abbreviations are acronyms, so they only match as written ("CI", not the word "ci")
+    for abbr, full_form in (abbreviations or {}).items():
+        for category, skill in categories_by_skill.get(full_form.lower(), ()):
+            patterns.append(SkillPattern(abbr, category, skill, case_sensitive=True))
+
+    return SkillMatcher(patterns)
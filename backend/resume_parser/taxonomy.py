@@ -0,0 +1,199 @@
+"""
+Skill taxonomy loaded from a versioned data file.
+
+The taxonomy lives in ``data/skills_taxonomy.json`` (or the file named by
+RESUME_PARSER_TAXONOMY_PATH) so it can grow without a code change:
+
+    {
+      "version": "2026.10.1",
+      "common_words": ["go"],
+      "skills": [
+        {"name": "kubernetes", "category": "Cloud & DevOps",
+         "synonyms": ["k8s cluster"], "abbreviations": ["K8s"]},
+        {"name": "ci/cd", "category": ["Cloud & DevOps", "Tools & Methodologies"]}
+      ]
+    }
+
+Names and synonyms listed in ``common_words`` are also ordinary English
+words, so the matcher only accepts them where they read as a skill (see
+skill_matcher).
+
+Loading compiles hashed lookup tables and the skill matcher in one pass.
+Running processes check the file every RESUME_PARSER_TAXONOMY_CHECK_SECONDS
+and swap in a recompiled taxonomy when it changes, without a restart.
+"""
+import gc
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+
+from .conf import get_setting
+from .model_registry import registry as model_registry
+from .skill_matcher import SKILL_SEPARATOR_VARIANTS, SkillMatcher, SkillPattern
+
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'skills_taxonomy.json')
+
+
+class Taxonomy:
+    """A compiled skill taxonomy: hashed lookups plus the rule-based matcher."""
+
+    def __init__(self, version: str, skills: List[Dict], fingerprint: str = '', common_words: Iterable[str] = ()):
+        self.version = version
+        self.fingerprint = fingerprint
+        # category -> canonical skill names
+        self.skill_db: Dict[str, Set[str]] = defaultdict(set)
+        # abbreviation -> canonical skill name
+        self.abbreviations: Dict[str, str] = {}
+        # lower-cased name or synonym -> ((category, canonical skill), ...)
+        self.terms: Dict[str, Tuple[Tuple[str, str], ...]] = {}
+
+        self.matcher = SkillMatcher()
+        add_spelling = self.matcher.add
+        terms = self.terms
+        common_words = {word.lower() for word in common_words}
+
+        for entry in skills:
+            name = entry['name']
+            categories = entry['category']
+            if isinstance(categories, str):
+                categories = (categories,)
+            owners = tuple((category, name) for category in categories)
+            patterns = [SkillPattern(name, category, name) for category in categories]
+            for category in categories:
+                self.skill_db[category].add(name)
+
+            for term in (name, *entry.get('synonyms', ())):
+                term = term.lower()
+                terms[term] = terms.get(term, ()) + owners
+                if ' ' in term:
+                    spellings = {term.replace(' ', separator) for separator in SKILL_SEPARATOR_VARIANTS}
+                else:
+                    spellings = (term,)
+                for spelling in spellings:
+                    for pattern in patterns:
+                        add_spelling(pattern, spelling, spelling in common_words)
+
+            # Abbreviations are acronyms, so they only match as written ("CI", not the word "ci")
+            for abbr in entry.get('abbreviations', ()):
+                self.abbreviations[abbr] = name
+                for category in categories:
+                    add_spelling(SkillPattern(abbr, category, name, case_sensitive=True))
+
+        self.skill_db = dict(self.skill_db)
+
+    @classmethod
+    def from_file(cls, path: str) -> 'Taxonomy':
+        with open(path, 'rb') as taxonomy_file:
+            raw = taxonomy_file.read()
+        # Compiling allocates hundreds of thousands of small acyclic objects;
+        # pausing the cyclic collector roughly halves the load time
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            data = json.loads(raw)
+            return cls(str(data.get('version', '')), data['skills'], hashlib.sha256(raw).hexdigest()[:12],
+                       data.get('common_words', ()))
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    def lookup(self, term: str) -> Tuple[Tuple[str, str], ...]:
+        """Return the (category, skill) pairs a skill name or synonym resolves to."""
+        return self.terms.get(term.lower().strip(), ())
+
+    def __len__(self) -> int:
+        return sum(len(skills) for skills in self.skill_db.values())
+
+
+_taxonomy: Optional[Taxonomy] = None
+_taxonomy_stat: Optional[Tuple[int, int]] = None
+_next_check = 0.0
+_lock = threading.Lock()
+
+
+def taxonomy_path() -> str:
+    return get_setting('RESUME_PARSER_TAXONOMY_PATH') or DEFAULT_TAXONOMY_PATH
+
+
+def _stat(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def get_taxonomy() -> Taxonomy:
+    """Return the compiled taxonomy, reloading it if the data file has changed."""
+    global _next_check
+    if _taxonomy is not None and time.monotonic() < _next_check:
+        return _taxonomy
+    with _lock:
+        if _taxonomy is None or time.monotonic() >= _next_check:
+            _reload_if_changed()
+            interval = get_setting('RESUME_PARSER_TAXONOMY_CHECK_SECONDS')
+            # A non-positive interval loads the file once and never checks it again
+            _next_check = time.monotonic() + interval if interval > 0 else float('inf')
+    return _taxonomy
+
+
+def reload_taxonomy() -> Taxonomy:
+    """Reload the taxonomy now, regardless of the check interval."""
+    global _taxonomy_stat
+    with _lock:
+        _taxonomy_stat = None
+        _reload_if_changed()
+    return _taxonomy
+
+
+def _reload_if_changed() -> None:
+    """Recompile the taxonomy when the data file changed (callers hold _lock)."""
+    global _taxonomy, _taxonomy_stat
+    path = taxonomy_path()
+    stat = _stat(path)
+    if _taxonomy is not None and stat == _taxonomy_stat:
+        return
+    started = time.perf_counter()
+    try:
+        taxonomy = Taxonomy.from_file(path)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        if _taxonomy is None:
+            raise
+        # Keep serving the previous taxonomy rather than failing every parse
+        print(f"Warning: Could not reload skill taxonomy from {path}: {str(e)}")
+        _taxonomy_stat = stat
+        return
+
+    replaced = _taxonomy is not None
+    _taxonomy, _taxonomy_stat = taxonomy, stat
+    print(f"Loaded skill taxonomy {taxonomy.version} ({len(taxonomy)} skills) "
+          f"in {time.perf_counter() - started:.2f}s")
+    if replaced:
+        # Embeddings are keyed by taxonomy content, so the next use loads the matching matrix
+        model_registry.evict('skill_embeddings')
+
+
+class TaxonomyView(Mapping):
+    """Read-only mapping over one table of the current taxonomy; follows reloads."""
+
+    def __init__(self, table: str):
+        self._table = table
+
+    def _data(self) -> Mapping:
+        return getattr(get_taxonomy(), self._table)
+
+    def __getitem__(self, key):
+        return self._data()[key]
+
+    def __iter__(self) -> Iterator:
+        return iter(self._data())
+
+    def __len__(self) -> int:
+        return len(self._data())
+
+    def __repr__(self) -> str:
+        return f'TaxonomyView({self._table!r})'
@@ -1,3 +1,1339 @@
-from django.test import TestCase
+import fcntl
+import io
+import json
+import mmap
+import multiprocessing
+import os
+import pathlib
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.core.files.uploadedfile import SimpleUploadedFile, TemporaryUploadedFile
+from django.db.models import QuerySet
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from . import deadline as deadlines, instrumentation
+from .admission import AdmissionController, ParserOverloaded
+from .benchmarks.corpus import generate_corpus
+from .benchmarks.runner import PreparedResume, percentile
+from .benchmarks.tiers import evaluate_active_tier, has_skill_label
+from .cache import ParseCache
+from .contact import resolve_name, scan_contact
+from .docx_extractor import iter_docx_lines
+from .jobs import claim_next_job, enqueue_parse, requeue_stale_jobs, run_job
+from .model_registry import ModelRegistry, peak_rss, registry as model_registry
+from .models import ParsedResume, ResumeParseJob
+from .pdf_backends import (
+    PDF_BACKENDS, BufferReader, _resolve_backend, get_pdf_backend, load_backend_choice, normalize_page_text,
+    reset_backend, save_backend_choice,
+)
+from .resume_parser import (
+    MODEL_TIERS, _load_source, _map_file, _name_nlp, _pipe_docs, extract_text_from_pdf, get_model_tier_name, get_nlp,
+    join_within_budget, parse_resume_document, parse_resume_file,
+)
+from .samples import render_docx_xml, sample_docx, sample_pdf
+from .services import get_or_parse_resume
+from .sections import Section, ner_spans, ner_text, segment_resume
+from .semantic import extract_candidate_phrases
+from .skill_matcher import build_skill_matcher
+from . import taxonomy as taxonomies
+from .taxonomy import Taxonomy, get_taxonomy
+from .worker_pool import ParserPool, PoolNotConfigured, dispatch_parse
+
+
+def _taxonomy(skills, common_words=()):
+    return Taxonomy('test', skills, common_words=common_words)
+
+
+class SkillMatcherTests(SimpleTestCase):
+    def setUp(self):
+        self.matcher = _taxonomy([
+            {'name': 'sql', 'category': 'Languages'},
+            {'name': 'mysql', 'category': 'Databases'},
+            {'name': 'c++', 'category': 'Languages', 'synonyms': ['cpp']},
+            {'name': 'c#', 'category': 'Languages', 'synonyms': ['csharp']},
+            {'name': 'ci/cd', 'category': 'DevOps', 'synonyms': ['continuous integration']},
+            {'name': 'go', 'category': 'Languages', 'synonyms': ['golang']},
+            {'name': 'r', 'category': 'Languages'},
+            {'name': 'rest', 'category': 'Methodologies'},
+            {'name': 'unit testing', 'category': 'Methodologies'},
+            {'name': 'machine learning', 'category': 'AI', 'abbreviations': ['ML']},
+        ], common_words=['go', 'rest']).matcher
+
+    def skills(self, text, context_spans=()):
+        return {skill for skills in self.matcher.match(text, context_spans).values() for skill in skills}
+
+    def test_matches_on_word_boundaries_only(self):
+        self.assertEqual(self.skills('Tuned MySQL queries'), {'mysql'})
+        self.assertEqual(self.skills('sql and mysql'), {'sql', 'mysql'})
+        self.assertEqual(self.skills('nosql stores'), set())
+
+    def test_matches_skills_with_symbols(self):
+        self.assertEqual(self.skills('Experienced in C++ and C# with CI/CD'), {'c++', 'c#', 'ci/cd'})
+        self.assertEqual(self.skills('cpp, csharp'), {'c++', 'c#'})
+
+    def test_matches_separator_variants(self):
+        for text in ('unit testing', 'unit-testing', 'unit_testing', 'unittesting'):
+            self.assertEqual(self.skills(text), {'unit testing'}, text)
+
+    def test_abbreviations_match_case_sensitively(self):
+        self.assertEqual(self.skills('Applied ML to ranking'), {'machine learning'})
+        self.assertEqual(self.skills('1 ml of water'), set())
+
+    def test_ambiguous_skills_ignored_in_prose(self):
+        self.assertEqual(self.skills('I go to the store'), set())
+        self.assertEqual(self.skills('Go to market strategy'), set())
+        self.assertEqual(self.skills('We rest on weekends'), set())
+        self.assertEqual(self.skills('Led r&d and R&D teams'), set())
+
+    def test_ambiguous_skills_match_as_list_items(self):
+        self.assertEqual(self.skills('Skills: Python, Go, R'), {'go', 'r'})
+        self.assertEqual(self.skills('- go\n- r\n'), {'go', 'r'})
+
+    def test_ambiguous_skills_match_capitalised_mid_sentence(self):
+        self.assertEqual(self.skills('Services written in Go and REST'), {'go', 'rest'})
+
+    def test_ambiguous_skills_match_inside_context_spans(self):
+        text = 'I go to the store'
+        self.assertEqual(self.skills(text, [(0, len(text))]), {'go'})
+
+    def test_unambiguous_synonym_matches_in_prose(self):
+        self.assertEqual(self.skills('I write golang daily'), {'go'})
+
+    def test_build_skill_matcher_treats_short_skills_as_ambiguous(self):
+        matcher = build_skill_matcher({'Languages': ['r', 'python']})
+        self.assertEqual(dict(matcher.match('r&d in python')), {'Languages': {'python'}})
+        self.assertEqual(dict(matcher.match('python, r')), {'Languages': {'python', 'r'}})
+
+
+class ParseCacheTests(SimpleTestCase):
+    def setUp(self):
+        self.disk_dir = tempfile.mkdtemp()
+        self.addCleanup(lambda: ParseCache(disk_dir=self.disk_dir, enabled=True).clear())
+
+    def cache(self, **kwargs):
+        options = {'memory_max_entries': 8, 'memory_max_bytes': 1 << 20, 'disk_dir': self.disk_dir,
+                   'disk_max_bytes': 1 << 20, 'enabled': True}
+        options.update(kwargs)
+        return ParseCache(**options)
+
+    def test_key_depends_on_content_type_and_version(self):
+        key = ParseCache.make_key(b'resume', '.pdf', '1.0')
+        self.assertEqual(key, ParseCache.make_key(b'resume', '.PDF', '1.0'))
+        self.assertNotEqual(key, ParseCache.make_key(b'resume!', '.pdf', '1.0'))
+        self.assertNotEqual(key, ParseCache.make_key(b'resume', '.docx', '1.0'))
+        self.assertNotEqual(key, ParseCache.make_key(b'resume', '.pdf', '1.1'))
+
+    def test_returns_a_copy_of_the_stored_result(self):
+        cache = self.cache()
+        cache.set('a' * 64, {'skills': ['python']})
+        result = cache.get('a' * 64)
+        result['skills'].append('go')
+        self.assertEqual(cache.get('a' * 64), {'skills': ['python']})
+        self.assertEqual(cache.memory_hits, 2)
+
+    def test_memory_tier_evicts_least_recently_used(self):
+        cache = self.cache(memory_max_entries=2, disk_dir='')
+        cache.set('a', {'n': 1})
+        cache.set('b', {'n': 2})
+        cache.get('a')
+        cache.set('c', {'n': 3})
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), {'n': 1})
+        self.assertEqual(cache.get('c'), {'n': 3})
+        self.assertEqual(cache.stats()['memory_entries'], 2)
+
+    def test_memory_tier_is_bounded_by_bytes(self):
+        cache = self.cache(memory_max_bytes=40, disk_dir='')
+        cache.set('a', {'text': 'x' * 20})
+        cache.set('b', {'text': 'y' * 20})
+        self.assertIsNone(cache.get('a'))
+        self.assertLessEqual(cache.stats()['memory_bytes'], 40)
+
+    def test_disk_tier_is_shared_between_instances(self):
+        self.cache().set('ab' + 'c' * 62, {'name': 'Ada'})
+        other = self.cache()
+        self.assertEqual(other.get('ab' + 'c' * 62), {'name': 'Ada'})
+        self.assertEqual((other.memory_hits, other.disk_hits), (0, 1))
+        # The disk hit is promoted into memory
+        self.assertEqual(other.get('ab' + 'c' * 62), {'name': 'Ada'})
+        self.assertEqual(other.memory_hits, 1)
+
+    def test_disk_tier_evicts_least_recently_used(self):
+        cache = self.cache(memory_max_entries=0, disk_max_bytes=100)
+        for index, key in enumerate(('aa1', 'bb2', 'cc3')):
+            cache.set(key, {'text': str(index) * 30})
+            os.utime(cache._disk_path(key), (index, index))
+        cache.set('dd4', {'text': 'd' * 30})
+        self.assertIsNone(cache.get('aa1'))
+        self.assertEqual(cache.get('dd4'), {'text': 'd' * 30})
+
+    def test_disk_writes_are_atomic(self):
+        cache = self.cache(memory_max_entries=0)
+        with mock.patch('resume_parser.cache.os.replace', side_effect=OSError('disk full')):
+            cache.set('ee5', {'name': 'Ada'})
+        self.assertIsNone(cache.get('ee5'))
+        cache.set('ee5', {'name': 'Ada'})
+        shard = os.path.dirname(cache._disk_path('ee5'))
+        self.assertEqual(os.listdir(shard), ['ee5.json'])
+
+    def test_disabled_cache_stores_nothing(self):
+        cache = self.cache(enabled=False)
+        cache.set('ff6', {'name': 'Ada'})
+        self.assertIsNone(cache.get('ff6'))
+        self.assertFalse(os.listdir(self.disk_dir))
+
+
+def _hold_slot(directory, held, done):
+    controller = AdmissionController(directory, max_concurrent=1, max_queued=0)
+    controller.acquire()
+    held.set()
+    done.wait(10)
+
+
+class AdmissionControllerTests(SimpleTestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def controller(self, max_concurrent=1, max_queued=0):
+        return AdmissionController(self.directory, max_concurrent, max_queued)
+
+    def test_limit_holds_across_processes(self):
+        context = multiprocessing.get_context('fork')
+        held, done = context.Event(), context.Event()
+        holder = context.Process(target=_hold_slot, args=(self.directory, held, done))
+        holder.start()
+        self.addCleanup(holder.join)
+        self.addCleanup(done.set)
+        self.assertTrue(held.wait(10))
+
+        with self.assertRaises(ParserOverloaded) as raised:
+            self.controller().acquire(timeout=0)
+        self.assertGreaterEqual(raised.exception.retry_after, 1)
+        self.assertEqual(self.controller().stats()['in_flight'], 1)
+
+    def test_slot_of_a_dead_process_is_freed(self):
+        context = multiprocessing.get_context('fork')
+        held, done = context.Event(), context.Event()
+        holder = context.Process(target=_hold_slot, args=(self.directory, held, done))
+        holder.start()
+        self.assertTrue(held.wait(10))
+        holder.kill()
+        holder.join()
+
+        controller = self.controller()
+        # Its pid is still in the slot file, but it no longer counts
+        self.assertEqual(controller.stats()['in_flight'], 0)
+        controller.release(controller.acquire(timeout=0))
+
+    def test_queued_request_gets_the_freed_slot(self):
+        holder = self.controller()
+        slot = holder.acquire()
+        threading.Timer(0.1, holder.release, args=(slot,)).start()
+
+        controller = self.controller(max_queued=1)
+        controller.release(controller.acquire(timeout=5))
+        self.assertEqual(controller.admitted, 1)
+
+    def test_queued_request_times_out(self):
+        holder = self.controller()
+        slot = holder.acquire()
+        self.addCleanup(holder.release, slot)
+
+        controller = self.controller(max_queued=1)
+        started = time.monotonic()
+        with self.assertRaises(ParserOverloaded):
+            controller.acquire(timeout=0.1)
+        self.assertLess(time.monotonic() - started, 2)
+        self.assertEqual(controller.timed_out, 1)
+        # The queue place was given back
+        self.assertEqual(controller.stats()['queued'], 0)
+
+    def test_full_queue_rejects_immediately(self):
+        holder = self.controller()
+        slot = holder.acquire()
+        self.addCleanup(holder.release, slot)
+
+        controller = self.controller(max_queued=0)
+        with self.assertRaises(ParserOverloaded):
+            controller.acquire(timeout=10)
+        self.assertEqual(controller.rejected, 1)
+
+
+    def test_counting_slots_leaves_their_locks_alone(self):
+        controller = self.controller(max_queued=1)
+        slot = controller.acquire(timeout=0)
+        with mock.patch('fcntl.flock', wraps=fcntl.flock) as flock:
+            stats = controller.stats()
+            controller.retry_after()
+        controller.release(slot)
+
+        self.assertEqual((stats['in_flight'], stats['queued']), (1, 0))
+        # Only the blocking coordination lock is taken, so a count never makes a free slot look taken
+        self.assertTrue(flock.called)
+        self.assertTrue(all(call.args[1] == fcntl.LOCK_EX for call in flock.call_args_list))
+        self.assertEqual(controller.stats()['in_flight'], 0)
+
+
+class ParseResumeAdmissionTests(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.client = APIClient()
+        self.client.force_authenticate(get_user_model().objects.create_user(
+            email='candidate@example.com', username='candidate', password='secret'))
+
+    def post_resume(self, data=b'%PDF-1.4', query=''):
+        upload = SimpleUploadedFile('resume.pdf', data, content_type='application/pdf')
+        return self.client.post(reverse('parse_resume') + query, {'resume': upload}, format='multipart')
+
+    @mock.patch('resume_parser.views.dispatch_parse', return_value={'success': True})
+    def test_returns_429_when_every_slot_is_taken(self, dispatch_parse):
+        with override_settings(RESUME_PARSER_ADMISSION_DIR=self.directory, RESUME_PARSER_MAX_CONCURRENT_PARSES=1,
+                               RESUME_PARSER_MAX_QUEUED_PARSES=0):
+            # Another web worker is parsing
+            other_worker = AdmissionController()
+            slot = other_worker.acquire()
+            try:
+                response = self.post_resume()
+            finally:
+                other_worker.release(slot)
+
+            self.assertEqual(response.status_code, 429)
+            self.assertGreaterEqual(int(response['Retry-After']), 1)
+            dispatch_parse.assert_not_called()
+
+            self.assertEqual(self.post_resume().status_code, 200)
+            dispatch_parse.assert_called_once()
+
+    @override_settings(RESUME_PARSER_MAX_FILE_BYTES=16)
+    @mock.patch('resume_parser.views.dispatch_parse', return_value={'success': True})
+    def test_oversized_upload_is_rejected_before_parsing_or_queueing(self, dispatch_parse):
+        for query in ('', '?async=1'):
+            response = self.post_resume(b'%PDF-1.4' + b' ' * 16, query)
+            self.assertEqual(response.status_code, 413, query)
+        dispatch_parse.assert_not_called()
+        self.assertFalse(ResumeParseJob.objects.exists())
+
+    @override_settings(RESUME_PARSER_MAX_QUEUED_JOBS=2)
+    def test_async_upload_is_refused_once_the_queue_is_full(self):
+        self.assertEqual(self.post_resume(query='?async=1').status_code, 202)
+        self.assertEqual(self.post_resume(query='?async=1').status_code, 202)
+
+        response = self.post_resume(query='?async=1')
+        self.assertEqual(response.status_code, 429)
+        self.assertGreaterEqual(int(response['Retry-After']), 1)
+        self.assertEqual(ResumeParseJob.objects.count(), 2)
+
+        # Finished jobs no longer count against the queue
+        ResumeParseJob.objects.update(status=ResumeParseJob.STATUS_DONE, upload=b'')
+        self.assertEqual(self.post_resume(query='?async=1').status_code, 202)
+
+def _fake_extract_text(data, file_type, stats=None):
+    if data == b'broken':
+        raise ValueError('Could not read PDF')
+    return 'Jane Doe\njane@example.com\n\nSkills\nPython, Django\n'
+
+
+_recorded_traces = []
+
+
+def _record_trace(trace):
+    _recorded_traces.append(trace)
+
+
+@override_settings(RESUME_PARSER_MODEL_TIER='rules-only', RESUME_PARSER_CACHE_ENABLED=False,
+                   RESUME_PARSER_POOL_ADDRESS=None)
+class InstrumentationTests(TestCase):
+    def setUp(self):
+        admission_dir = override_settings(RESUME_PARSER_ADMISSION_DIR=tempfile.mkdtemp())
+        admission_dir.enable()
+        self.addCleanup(admission_dir.disable)
+        self.client = APIClient()
+
+    def post_resume(self, is_staff):
+        username = 'staff' if is_staff else 'candidate'
+        user = get_user_model().objects.create_user(
+            email=f'{username}@example.com', username=username, password='secret', is_staff=is_staff)
+        self.client.force_authenticate(user)
+        upload = SimpleUploadedFile('resume.pdf', sample_pdf(), content_type='application/pdf')
+        return self.client.post(reverse('parse_resume') + '?timings=1', {'resume': upload}, format='multipart')
+
+    def test_only_staff_get_timings(self):
+        response = self.post_resume(is_staff=True)
+        self.assertEqual(response.status_code, 200)
+        stages = [span['stage'] for span in response.data['timings']['stages']]
+        self.assertIn('extract_text', stages)
+        self.assertIn('extract_contact', stages)
+
+        response = self.post_resume(is_staff=False)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['email'], 'jane.doe@example.com')
+        self.assertNotIn('timings', response.data)
+
+    def test_settings_hooks_receive_the_stage_spans(self):
+        self.addCleanup(setattr, instrumentation, '_settings_hooks', instrumentation._settings_hooks)
+        self.addCleanup(_recorded_traces.clear)
+        instrumentation._settings_hooks = None
+        hooks = ['resume_parser.tests._record_trace', 'resume_parser.tests.missing_hook']
+        with override_settings(RESUME_PARSER_METRICS_HOOKS=hooks), mock.patch('builtins.print') as printed:
+            result = parse_resume_file(sample_pdf(), 'resume.pdf')
+
+        self.assertNotIn('timings', result)
+        self.assertEqual(len(_recorded_traces), 1)
+        recorded = _recorded_traces[0]
+        self.assertEqual(recorded.context['filename'], 'resume.pdf')
+        spans = {span.name: span for span in recorded.spans}
+        self.assertIn('skills_rule_based', spans)
+        self.assertEqual(spans['extract_text'].input_size, len(sample_pdf()))
+        # A hook that cannot be imported is reported and skipped
+        self.assertTrue(any('missing_hook' in str(call.args[0]) for call in printed.call_args_list))
+
+    def test_failing_hook_does_not_fail_the_parse(self):
+        hook = mock.Mock(side_effect=RuntimeError('sink down'))
+        instrumentation.register_metrics_hook(hook)
+        self.addCleanup(instrumentation.unregister_metrics_hook, hook)
+        with mock.patch('builtins.print'):
+            result = parse_resume_file(sample_pdf(), 'resume.pdf')
+        self.assertTrue(result['success'])
+        hook.assert_called_once()
+
+
+@override_settings(RESUME_PARSER_MODEL_TIER='rules-only', RESUME_PARSER_CACHE_ENABLED=False,
+                   RESUME_PARSER_POOL_ADDRESS=None)
+class ParseResumeBatchTests(TestCase):
+    def setUp(self):
+        admission_dir = override_settings(RESUME_PARSER_ADMISSION_DIR=tempfile.mkdtemp())
+        admission_dir.enable()
+        self.addCleanup(admission_dir.disable)
+        self.client = APIClient()
+        self.url = reverse('parse_resume_batch')
+
+    def login(self, user_type, is_staff=False):
+        user = get_user_model().objects.create_user(
+            email=f'{user_type}@example.com', username=user_type, password='secret',
+            user_type=user_type, is_staff=is_staff)
+        self.client.force_authenticate(user)
+
+    def upload(self, name, data=b'%PDF-1.4'):
+        return SimpleUploadedFile(name, data)
+
+    def results(self, response):
+        body = b''.join(response.streaming_content).decode()
+        response.close()
+        return {line['filename']: line for line in map(json.loads, body.splitlines())}
+
+    def test_requires_authentication(self):
+        response = self.client.post(self.url, {'resumes': [self.upload('a.pdf')]}, format='multipart')
+        self.assertIn(response.status_code, (401, 403))
+
+    def test_candidates_are_forbidden(self):
+        self.login('candidate')
+        response = self.client.post(self.url, {'resumes': [self.upload('a.pdf')]}, format='multipart')
+        self.assertEqual(response.status_code, 403)
+
+    def test_staff_are_allowed(self):
+        self.login('candidate', is_staff=True)
+        with mock.patch('resume_parser.resume_parser._extract_text', _fake_extract_text):
+            response = self.client.post(self.url, {'resumes': [self.upload('a.pdf')]}, format='multipart')
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(self.results(response)['a.pdf']['success'])
+
+    def test_requires_files(self):
+        self.login('company')
+        response = self.client.post(self.url, {}, format='multipart')
+        self.assertEqual(response.status_code, 400)
+
+    def test_each_file_reports_its_own_result(self):
+        self.login('company')
+        resumes = [self.upload('good.pdf'), self.upload('broken.pdf', b'broken'), self.upload('notes.txt')]
+        with mock.patch('resume_parser.resume_parser._extract_text', _fake_extract_text):
+            response = self.client.post(self.url, {'resumes': resumes}, format='multipart')
+            self.assertEqual(response.status_code, 200)
+            results = self.results(response)
+
+        self.assertEqual(set(results), {'good.pdf', 'broken.pdf', 'notes.txt'})
+        self.assertTrue(results['good.pdf']['success'])
+        self.assertEqual(results['good.pdf']['email'], 'jane@example.com')
+        self.assertFalse(results['broken.pdf']['success'])
+        self.assertIn('Could not read PDF', results['broken.pdf']['message'])
+        self.assertFalse(results['notes.txt']['success'])
+
+    def test_batch_holds_an_admission_slot_until_closed(self):
+        self.login('company')
+        with override_settings(RESUME_PARSER_MAX_CONCURRENT_PARSES=1, RESUME_PARSER_MAX_QUEUED_PARSES=0), \
+                mock.patch('resume_parser.resume_parser._extract_text', _fake_extract_text):
+            response = self.client.post(self.url, {'resumes': [self.upload('a.pdf')]}, format='multipart')
+            self.assertEqual(response.status_code, 200)
+            busy = self.client.post(self.url, {'resumes': [self.upload('b.pdf')]}, format='multipart')
+            self.assertEqual(busy.status_code, 429)
+            response.close()
+            again = self.client.post(self.url, {'resumes': [self.upload('c.pdf')]}, format='multipart')
+            self.assertEqual(again.status_code, 200)
+            again.close()
+
+
+class PipeDocsTests(SimpleTestCase):
+    def test_failed_batch_is_retried_one_text_at_a_time(self):
+        def analyse(text):
+            if text == 'bad':
+                raise RuntimeError('bad text')
+            return f'doc:{text}'
+
+        nlp = mock.Mock(side_effect=analyse)
+        nlp.pipe.side_effect = RuntimeError('batch failed')
+
+        docs = _pipe_docs(nlp, ['one', 'bad', 'two'], batch_size=8)
+
+        self.assertEqual(docs[0], 'doc:one')
+        self.assertIsInstance(docs[1], RuntimeError)
+        self.assertEqual(docs[2], 'doc:two')
+
+
+class SectionSegmenterTests(SimpleTestCase):
+    RESUME = (
+        'Jane Doe\n'
+        'jane@example.com\n'
+        'Professional Summary\n'
+        'Backend engineer.\n'
+        'TECHNICAL   SKILLS: Python, Django\n'
+        'Experience\n'
+        'Built things at Example Corp, using skills daily.\n'
+        '## Education\n'
+        'BSc Computer Science\n'
+    )
+
+    def test_headings_split_the_text_in_document_order(self):
+        sections = segment_resume(self.RESUME)
+        self.assertEqual([(section.name, section.heading) for section in sections], [
+            ('contact', ''),
+            ('summary', 'Professional Summary'),
+            ('skills', 'TECHNICAL SKILLS'),
+            ('experience', 'Experience'),
+            ('education', 'Education'),
+        ])
+        # Sections tile the text without gaps
+        self.assertEqual(sections[0].start, 0)
+        self.assertEqual(sections[-1].end, len(self.RESUME))
+        for previous, section in zip(sections, sections[1:]):
+            self.assertEqual(previous.end, section.start)
+        self.assertTrue(self.RESUME[sections[2].start:sections[2].end].startswith('TECHNICAL   SKILLS: Python'))
+
+    def test_heading_words_inside_a_sentence_are_not_headings(self):
+        names = [section.name for section in segment_resume(self.RESUME)]
+        self.assertEqual(names.count('skills'), 1)
+
+    def test_text_without_headings_is_one_section(self):
+        text = 'Jane Doe\nPython developer'
+        self.assertEqual(segment_resume(text), [Section('other', '', 0, len(text))])
+        self.assertEqual(segment_resume(''), [])
+
+    def test_flattened_text_uses_upper_case_headings(self):
+        text = 'Jane Doe jane@example.com SUMMARY Backend engineer SKILLS Python, Django EXPERIENCE Example Corp'
+        sections = segment_resume(text)
+        self.assertEqual([section.name for section in sections], ['contact', 'summary', 'skills', 'experience'])
+        self.assertEqual(text[sections[2].start:sections[2].end], 'SKILLS Python, Django ')
+
+    def test_ner_text_skips_experience_and_education(self):
+        sections = segment_resume(self.RESUME)
+        spans = ner_spans(sections)
+        # Contact, summary and skills are adjacent, so they merge into one span
+        self.assertEqual(spans, [(0, sections[3].start)])
+        text = ner_text(self.RESUME, sections)
+        self.assertIn('Python, Django', text)
+        self.assertNotIn('Example Corp', text)
+        self.assertNotIn('BSc', text)
+
+    def test_ner_prefix_keeps_the_header(self):
+        text = 'Experience\nExample Corp\nworked there\nSkills\nPython\n'
+        sections = segment_resume(text)
+        self.assertEqual(ner_text(text, sections), 'Skills\nPython\n')
+        self.assertEqual(ner_text(text, sections, prefix=10), 'Experience\n\nSkills\nPython\n')
+
+
+class SemanticCandidateTests(SimpleTestCase):
+    RESUME = (
+        'Jane Doe\n'
+        'Experience\n'
+        'Led the team, shipped billing, reduced costs, hired engineers, ran on-call\n'
+        'Summary\n'
+        'Payments engineer\n'
+        'Skills\n'
+        'Postgres, Kubernetes, event sourcing\n'
+    )
+
+    def test_skills_and_summary_sections_come_first(self):
+        phrases = extract_candidate_phrases(self.RESUME, 4, segment_resume(self.RESUME))
+        self.assertEqual(phrases, ['Postgres', 'Kubernetes', 'event sourcing', 'Payments engineer'])
+
+    def test_whole_text_is_used_without_skills_or_summary(self):
+        text = 'Postgres, Kubernetes'
+        self.assertEqual(extract_candidate_phrases(text, 10, segment_resume(text)), ['Postgres', 'Kubernetes'])
+
+    def test_noun_chunks_are_added_when_the_doc_was_parsed(self):
+        import spacy
+        from spacy.tokens import Doc
+
+        nlp = spacy.blank('en')
+        text = 'Jane Doe\nSummary\nBuilt distributed systems\n'
+        words = ['Jane', 'Doe', '\n', 'Summary', '\n', 'Built', 'distributed', 'systems', '\n']
+        doc = Doc(nlp.vocab, words=words, spaces=[True, False, False, False, False, True, True, False, False],
+                  pos=['PROPN', 'PROPN', 'SPACE', 'NOUN', 'SPACE', 'VERB', 'ADJ', 'NOUN', 'SPACE'],
+                  deps=['compound', 'ROOT', 'dep', 'ROOT', 'dep', 'ROOT', 'amod', 'dobj', 'dep'],
+                  heads=[1, 1, 1, 3, 3, 5, 7, 5, 5])
+        self.assertEqual(doc.text, text)
+
+        phrases = extract_candidate_phrases(text, 10, segment_resume(text), doc)
+        self.assertEqual(phrases, ['Built distributed systems', 'distributed systems'])
+        # Without a parse there are no noun chunks to add
+        self.assertEqual(extract_candidate_phrases(text, 10, segment_resume(text), nlp(text)),
+                         ['Built distributed systems'])
+
+
+def _docx_part(body_xml):
+    return ('<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+            'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006">'
+            f'<w:body>{body_xml}</w:body></w:document>')
+
+
+def _docx_paragraph(text):
+    return f'<w:p><w:r><w:t>{text}</w:t></w:r></w:p>'
+
+
+class DocxExtractorTests(SimpleTestCase):
+    def extract(self, body_xml, headers=(), footers=()):
+        out = io.BytesIO()
+        with zipfile.ZipFile(out, 'w') as archive:
+            archive.writestr('word/document.xml', _docx_part(body_xml))
+            for index, text in enumerate(headers, 1):
+                archive.writestr(f'word/header{index}.xml', _docx_part(_docx_paragraph(text)))
+            for index, text in enumerate(footers, 1):
+                archive.writestr(f'word/footer{index}.xml', _docx_part(_docx_paragraph(text)))
+        out.seek(0)
+        return list(iter_docx_lines(out))
+
+    def test_paragraph_runs_tabs_and_breaks(self):
+        body = '<w:p><w:r><w:t>Jane</w:t></w:r><w:r><w:t> Doe</w:t><w:tab/><w:t>CV</w:t><w:br/></w:r></w:p>'
+        self.assertEqual(self.extract(body), ['Jane Doe\tCV\n'])
+
+    def test_table_rows_become_tab_separated_lines(self):
+        body = ('<w:tbl><w:tr><w:tc>' + _docx_paragraph('Skills') + '</w:tc>'
+                '<w:tc>' + _docx_paragraph('Python') + _docx_paragraph('Django') + '</w:tc></w:tr>'
+                '<w:tr><w:tc>' + _docx_paragraph('Email') + '</w:tc><w:tc>' + _docx_paragraph('jane@example.com')
+                + '</w:tc></w:tr></w:tbl>' + _docx_paragraph('After'))
+        self.assertEqual(self.extract(body), ['Skills\tPython\nDjango', 'Email\tjane@example.com', 'After'])
+
+    def test_headers_come_before_the_body_and_footers_after(self):
+        lines = self.extract(_docx_paragraph('Body'), headers=['Jane Doe', 'Second header'],
+                             footers=['jane@example.com'])
+        self.assertEqual(lines, ['Jane Doe', 'Second header', 'Body', 'jane@example.com'])
+
+    def test_fallback_content_is_not_read_twice(self):
+        body = ('<w:p><w:r><mc:AlternateContent>'
+                '<mc:Choice Requires="wps"><w:txbxContent>' + _docx_paragraph('Kubernetes') + '</w:txbxContent>'
+                '</mc:Choice><mc:Fallback><w:txbxContent>' + _docx_paragraph('Kubernetes') + '</w:txbxContent>'
+                '</mc:Fallback></mc:AlternateContent></w:r><w:r><w:t>Title</w:t></w:r></w:p>')
+        self.assertEqual(self.extract(body), ['Kubernetes', 'Title'])
+
+
+class BenchmarkTests(SimpleTestCase):
+    def test_rendered_docx_is_reproducible(self):
+        first = render_docx_xml(_docx_paragraph('Jane Doe'))
+        with mock.patch('time.time', return_value=time.time() + 86400 * 400):
+            second = render_docx_xml(_docx_paragraph('Jane Doe'))
+        self.assertEqual(first, second)
+        self.assertEqual(list(iter_docx_lines(io.BytesIO(first))), ['Jane Doe'])
+
+    def test_percentile_uses_the_nearest_rank(self):
+        values = list(range(1, 11))
+        self.assertEqual(percentile(values, 50), 5)
+        self.assertEqual(percentile(values, 95), 10)
+        self.assertEqual(percentile(values, 10), 1)
+        self.assertEqual(percentile([3.0, 1.0, 2.0, 4.0], 50), 2.0)
+        self.assertEqual(percentile([], 50), 0.0)
+
+    def test_peak_rss_is_reported_in_bytes(self):
+        usage = mock.Mock(ru_maxrss=2048)
+        with mock.patch('resource.getrusage', return_value=usage), mock.patch('sys.platform', 'linux'):
+            self.assertEqual(peak_rss(), 2048 * 1024)
+
+
+class JoinWithinBudgetTests(SimpleTestCase):
+    def test_text_within_budget_is_joined_whole(self):
+        stats = {}
+        self.assertEqual(join_within_budget(['abc', 'de'], max_chars=6, stats=stats), 'abc\nde')
+        self.assertEqual(stats, {'chars': 6, 'truncated': False})
+
+    def test_chunk_crossing_the_budget_is_cut(self):
+        stats = {}
+        text = join_within_budget(['abcd', 'efgh', 'ijkl'], max_chars=7, separator='--', stats=stats)
+        # The separator counts towards the budget
+        self.assertEqual(text, 'abcd--e')
+        self.assertEqual(stats, {'chars': 7, 'truncated': True})
+
+    def test_budget_spent_on_a_separator_adds_nothing(self):
+        stats = {}
+        self.assertEqual(join_within_budget(['abcd', 'efgh'], max_chars=5, stats=stats), 'abcd')
+        self.assertEqual(stats, {'chars': 4, 'truncated': True})
+
+    def test_source_is_closed_once_the_budget_is_spent(self):
+        produced = []
+        closed = []
+
+        def chunks():
+            try:
+                for index in range(100):
+                    produced.append(index)
+                    yield 'x' * 10
+            finally:
+                closed.append(True)
+
+        text = join_within_budget(chunks(), max_chars=25)
+        self.assertEqual(len(text), 25)
+        self.assertEqual(produced, [0, 1, 2])
+        self.assertEqual(closed, [True])
+
+    def test_zero_budget_disables_truncation(self):
+        stats = {}
+        self.assertEqual(join_within_budget(['a' * 50, 'b' * 50], max_chars=0, stats=stats), 'a' * 50 + '\n' + 'b' * 50)
+        self.assertFalse(stats['truncated'])
+
+    @override_settings(RESUME_PARSER_MAX_TEXT_CHARS=3)
+    def test_budget_defaults_to_the_setting(self):
+        self.assertEqual(join_within_budget(['abcdef']), 'abc')
+
+
+@override_settings(RESUME_PARSER_MODEL_TIER='rules-only')
+class WarmUpTests(SimpleTestCase):
+    def test_sample_parse_does_not_import_the_benchmarks(self):
+        script = (
+            'import sys, django; django.setup()\n'
+            'from resume_parser.warmup import _exercise_parser\n'
+            '_exercise_parser()\n'
+            "print(sorted(name for name in sys.modules if name.startswith('resume_parser.benchmarks')))\n"
+        )
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE='core.settings', RESUME_PARSER_MODEL_TIER='rules-only')
+        output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, env=env,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))), check=True)
+        self.assertEqual(output.stdout.strip().splitlines()[-1], '[]')
+
+    def test_sample_documents_parse(self):
+        for data, filename in ((sample_pdf(), 'warmup.pdf'), (sample_docx(), 'warmup.docx')):
+            text, result = parse_resume_document(io.BytesIO(data), filename)
+            self.assertTrue(text.startswith('Jane Doe\njane.doe@example.com'), filename)
+            self.assertEqual(result['email'], 'jane.doe@example.com')
+
+
+class ModelRegistryTests(SimpleTestCase):
+    def setUp(self):
+        self.now = 1000.0
+        for target, replacement in (('resume_parser.model_registry.time.monotonic', lambda: self.now),
+                                    ('resume_parser.model_registry.time.sleep', self.sleep),
+                                    ('builtins.print', None)):
+            patcher = mock.patch(target, side_effect=replacement)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.registry = ModelRegistry(ttl=60)
+        self.loader = mock.Mock(side_effect=lambda: object())
+        self.registry.register('model', self.loader)
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+    def test_idle_models_are_evicted_after_the_ttl(self):
+        with mock.patch.object(ModelRegistry, '_ensure_janitor'):
+            model = self.registry.get('model')
+            self.assertIs(self.registry.get('model'), model)
+            self.assertEqual(self.loader.call_count, 1)
+
+            self.now += 59
+            self.assertEqual(self.registry.evict_idle(), [])
+            self.registry.get('model')  # Using a model restarts its idle clock
+            self.now += 59
+            self.assertEqual(self.registry.evict_idle(), [])
+            self.assertEqual(self.registry.stats()['model']['idle_seconds'], 59)
+
+            self.now += 2
+            self.assertEqual(self.registry.evict_idle(), ['model'])
+            self.assertFalse(self.registry.is_loaded('model'))
+            self.assertIsNone(self.registry.stats()['model']['idle_seconds'])
+
+            self.assertIsNot(self.registry.get('model'), model)
+            self.assertEqual(self.registry.stats()['model']['load_count'], 2)
+
+    def test_zero_ttl_keeps_models_resident(self):
+        self.registry.ttl = 0
+        self.registry.get('model')
+        self.assertIsNone(self.registry._janitor)
+        self.now += 10 ** 6
+        self.assertEqual(self.registry.evict_idle(), [])
+        self.assertTrue(self.registry.is_loaded('model'))
+
+    def test_janitor_evicts_idle_models_then_stops(self):
+        with mock.patch('threading.Thread.start'):
+            self.registry.get('model')
+        self.assertIsNotNone(self.registry._janitor)
+
+        # Each pass sleeps a quarter of the TTL; the model goes on the first
+        # pass after it has been idle for longer than the TTL
+        self.registry._janitor_loop()
+        self.assertFalse(self.registry.is_loaded('model'))
+        self.assertEqual(self.now, 1075.0)
+        self.assertIsNone(self.registry._janitor)
+
+    def test_unknown_model(self):
+        with self.assertRaises(KeyError):
+            self.registry.get('missing')
+        self.assertFalse(self.registry.evict('missing'))
+
+class ModelTierTests(SimpleTestCase):
+    def test_configured_tier_is_used(self):
+        for tier_name in MODEL_TIERS:
+            with self.subTest(tier=tier_name), override_settings(RESUME_PARSER_MODEL_TIER=tier_name):
+                self.assertEqual(get_model_tier_name(), tier_name)
+
+    def test_unknown_tier_falls_back_to_the_default(self):
+        with override_settings(RESUME_PARSER_MODEL_TIER='xl'), mock.patch('builtins.print') as printed:
+            self.assertEqual(get_model_tier_name(), 'lg')
+        self.assertIn("'xl'", printed.call_args.args[0])
+
+    @override_settings(RESUME_PARSER_MODEL_TIER='rules-only', RESUME_PARSER_CACHE_ENABLED=False)
+    @mock.patch.object(model_registry, 'get')
+    def test_rules_only_never_loads_a_model(self, get):
+        self.assertIsNone(get_nlp())
+        self.assertIsNone(_name_nlp())
+        result = parse_resume_file(sample_pdf(), 'resume.pdf')
+        self.assertTrue(result['success'])
+        self.assertEqual(result['name'], 'Jane Doe')
+        self.assertIn('python', result['skills'])
+        get.assert_not_called()
+
+    def test_skill_label_is_reported_only_when_the_pipeline_predicts_it(self):
+        import spacy
+
+        nlp = spacy.blank('en')
+        self.assertFalse(has_skill_label(None))
+        self.assertFalse(has_skill_label(nlp))
+        nlp.add_pipe('ner').add_label('PERSON')
+        self.assertFalse(has_skill_label(nlp))
+        nlp.get_pipe('ner').add_label('SKILL')
+        self.assertTrue(has_skill_label(nlp))
+
+    @override_settings(RESUME_PARSER_MODEL_TIER='rules-only', RESUME_PARSER_CACHE_ENABLED=False)
+    def test_tier_report_flags_missing_skill_entities(self):
+        items = [PreparedResume(resume) for resume in generate_corpus(2, seed=7)]
+        report = evaluate_active_tier(items, iterations=1)
+        self.assertEqual(report['pipeline'], [])
+        self.assertFalse(report['skill_label'])
+        self.assertGreater(report['accuracy']['skills']['recall'], 0)
+
+@override_settings(RESUME_PARSER_MODEL_TIER='lg', RESUME_PARSER_CACHE_ENABLED=False)
+class DeadlineTests(SimpleTestCase):
+    def setUp(self):
+        costs = mock.patch.dict(deadlines._stage_costs, clear=True)
+        costs.start()
+        self.addCleanup(costs.stop)
+
+    def parse(self, budget_ms=60000):
+        return parse_resume_file(sample_pdf(), 'resume.pdf', budget_ms=budget_ms)
+
+    def test_stage_is_skipped_when_it_usually_takes_longer_than_the_time_left(self):
+        with deadlines.deadline(1000) as current:
+            self.assertTrue(deadlines.allows('ner'))
+            deadlines.record_cost('ner', 5000)
+            self.assertFalse(deadlines.allows('ner'))
+            self.assertFalse(deadlines.expired('extract_text'))
+            self.assertEqual(deadlines.skipped_stages(), ['ner'])
+        self.assertEqual(current.skipped, ['ner'])
+        # Outside a deadline every stage runs
+        self.assertTrue(deadlines.allows('ner'))
+        self.assertEqual(deadlines.skipped_stages(), [])
+
+    def test_expired_deadline_records_the_stage_cut_short(self):
+        with deadlines.deadline(1):
+            time.sleep(0.005)
+            self.assertTrue(deadlines.expired('extract_text'))
+            self.assertEqual(deadlines.skipped_stages(), ['extract_text'])
+        self.assertFalse(deadlines.expired('extract_text'))
+
+    def test_cost_is_a_moving_average(self):
+        deadlines.record_cost('ner', 100)
+        deadlines.record_cost('ner', 200)
+        self.assertAlmostEqual(deadlines.expected_cost_ms('ner'), 120)
+
+    @mock.patch.object(model_registry, 'is_loaded', return_value=False)
+    @mock.patch.object(model_registry, 'get')
+    def test_spent_budget_does_not_load_the_model(self, get, is_loaded):
+        deadlines.record_cost('ner', 10 ** 9)
+        result = self.parse()
+        self.assertTrue(result['success'])
+        self.assertEqual(result['degraded'], ['ner'])
+        self.assertIn('python', result['skills'])
+        get.assert_not_called()
+
+    @mock.patch.object(model_registry, 'is_loaded', return_value=False)
+    @mock.patch.object(model_registry, 'get')
+    def test_cold_model_load_is_a_stage_of_its_own(self, get, is_loaded):
+        deadlines.record_cost('model_load', 10 ** 9)
+        result = self.parse()
+        self.assertEqual(result['degraded'], ['model_load'])
+        get.assert_not_called()
+
+        deadlines._stage_costs.clear()
+        get.return_value = nlp = mock.Mock()
+        self.assertIs(get_nlp(), nlp)
+        self.assertIn('model_load', deadlines._stage_costs)
+        self.assertNotIn('ner', deadlines._stage_costs)
+
+    def test_name_ner_is_timed_and_skipped_with_the_budget(self):
+        scan = scan_contact('jane@example.com\nSenior engineer\n')
+        self.assertIsNone(scan.pattern_name())
+        nlp = mock.Mock(return_value=mock.Mock(ents=[]))
+        resolve_name(scan, lambda: nlp)
+        nlp.assert_called_once_with(scan.header)
+        self.assertIn('name_ner', deadlines._stage_costs)
+
+        deadlines.record_cost('name_ner', 10 ** 9)
+        with mock.patch.object(model_registry, 'get') as get, deadlines.deadline(1000) as current:
+            self.assertIsNone(_name_nlp())
+        get.assert_not_called()
+        self.assertEqual(current.skipped, ['name_ner'])
+
+
+class TaxonomyReloadTests(SimpleTestCase):
+    def setUp(self):
+        state = (taxonomies._taxonomy, taxonomies._taxonomy_stat, taxonomies._next_check)
+        self.addCleanup(self.restore, state)
+        taxonomies._taxonomy = taxonomies._taxonomy_stat = None
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        self.path = os.path.join(directory, 'skills_taxonomy.json')
+        settings = override_settings(RESUME_PARSER_TAXONOMY_PATH=self.path, RESUME_PARSER_TAXONOMY_CHECK_SECONDS=30)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        self.now = 1000.0
+        clock = mock.patch('resume_parser.taxonomy.time.monotonic', side_effect=lambda: self.now)
+        clock.start()
+        self.addCleanup(clock.stop)
+        evict = mock.patch.object(model_registry, 'evict')
+        self.evict = evict.start()
+        self.addCleanup(evict.stop)
+
+    def restore(self, state):
+        taxonomies._taxonomy, taxonomies._taxonomy_stat, taxonomies._next_check = state
+
+    def write(self, content, mtime):
+        with open(self.path, 'w') as taxonomy_file:
+            taxonomy_file.write(content if isinstance(content, str) else json.dumps(content))
+        os.utime(self.path, ns=(mtime, mtime))
+
+    def taxonomy(self, version, *skills):
+        return {'version': version, 'skills': [{'name': skill, 'category': 'Languages'} for skill in skills]}
+
+    def test_changed_file_is_reloaded_after_the_check_interval(self):
+        self.write(self.taxonomy('1', 'python'), 10 ** 18)
+        first = get_taxonomy()
+        self.assertEqual(first.version, '1')
+        self.evict.assert_not_called()
+
+        self.write(self.taxonomy('2', 'python', 'rust'), 2 * 10 ** 18)
+        self.assertIs(get_taxonomy(), first)  # Not checked again until the interval passes
+        self.now += 31
+        second = get_taxonomy()
+        self.assertEqual(second.version, '2')
+        self.assertEqual(second.lookup('Rust'), (('Languages', 'rust'),))
+        self.evict.assert_called_once_with('skill_embeddings')
+
+        self.now += 31
+        self.assertIs(get_taxonomy(), second)  # Unchanged file, nothing recompiled
+        self.evict.assert_called_once()
+
+    def test_broken_file_keeps_the_previous_taxonomy(self):
+        self.write(self.taxonomy('1', 'python'), 10 ** 18)
+        first = get_taxonomy()
+
+        for broken in ('{"version": "2", "skills": [', {'version': '2'}, {'skills': [{'name': 'rust'}]}):
+            with self.subTest(broken=broken):
+                self.write(broken, 2 * 10 ** 18 + len(str(broken)))
+                self.now += 31
+                with mock.patch('builtins.print'):
+                    self.assertIs(get_taxonomy(), first)
+        self.evict.assert_not_called()
+
+    def test_missing_file_fails_the_first_load(self):
+        with self.assertRaises(OSError):
+            get_taxonomy()
+
+
+class ContactExtractionTests(SimpleTestCase):
+    def test_skip_words_apply_to_the_first_line(self):
+        scan = scan_contact('Curriculum Vitae\nJane Doe\njane@example.com\n')
+        self.assertIsNone(scan.first_line_name)
+        self.assertEqual(scan.fallback_name, 'Jane Doe')
+        self.assertEqual(resolve_name(scan), 'Jane Doe')
+
+    def test_labeled_name_wins_over_the_first_line(self):
+        scan = scan_contact('Jane Doe\nName: Janet Doe\n')
+        self.assertEqual(scan.first_line_name, 'Jane Doe')
+        self.assertEqual(resolve_name(scan), 'Janet Doe')
+
+    def test_phone_numbers_do_not_span_lines(self):
+        self.assertIsNone(scan_contact('Employee ID 123 456\n7890 1234\n').phone)
+        self.assertEqual(scan_contact('Jane Doe\nPhone: 555 010 0199\n').phone, '555-010-0199')
+
+    def test_body_is_searched_only_for_missing_contact_details(self):
+        header = ['Jane Doe', 'jane@example.com'] + ['Summary'] * 10
+        scan = scan_contact('\n'.join(header + ['other@example.com', '+44 20 7946 0958']))
+        self.assertEqual(scan.email, 'jane@example.com')
+        self.assertEqual(scan.phone, '+442079460958')
+
+    def test_name_falls_back_to_ner_lazily(self):
+        load_nlp = mock.Mock()
+        self.assertEqual(resolve_name(scan_contact('Jane Doe\n'), load_nlp), 'Jane Doe')
+        load_nlp.assert_not_called()
+
+        scan = scan_contact('jane@example.com\nJANE DOE\n')
+        person = mock.Mock(label_='PERSON', text='JANE DOE', start_char=17)
+        nlp = load_nlp.return_value
+        nlp.return_value = mock.Mock(ents=[person])
+        self.assertEqual(resolve_name(scan, load_nlp), 'JANE DOE')
+        nlp.assert_called_once_with(scan.header)
+
+    def test_without_a_model_the_name_is_the_first_name_like_line(self):
+        scan = scan_contact('jane@example.com\nSenior Backend Engineer\n')
+        self.assertEqual(resolve_name(scan, lambda: None), 'Senior Backend Engineer')
+
+
+class PdfExtractionTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.pdf = generate_corpus(1, seed=7)[0].to_pdf()
+
+    def test_buffer_reader_reads_and_seeks_without_copying_the_buffer(self):
+        buffer = bytearray(b'0123456789')
+        reader = BufferReader(buffer)
+        self.assertEqual(reader.read(3), b'012')
+        reader.seek(-2, os.SEEK_END)
+        self.assertEqual(reader.read(), b'89')
+        reader.seek(4)
+        target = bytearray(3)
+        self.assertEqual(reader.readinto(target), 3)
+        self.assertEqual(target, b'456')
+        # The reader exports a view of the buffer until it is closed
+        with self.assertRaises(BufferError):
+            buffer.append(0)
+        reader.close()
+        buffer.append(0)
+
+    def test_memory_mapped_pdf_is_read_in_place(self):
+        with tempfile.NamedTemporaryFile(suffix='.pdf') as pdf_file:
+            pdf_file.write(self.pdf)
+            pdf_file.flush()
+            mapped = _map_file(pdf_file.name)
+            text = extract_text_from_pdf(mapped)
+            # Closing fails while any view of the mapping is still alive
+            mapped.close()
+        self.assertTrue(text)
+        self.assertEqual(text, extract_text_from_pdf(self.pdf))
+
+    def test_load_source_accepts_every_source_type(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        path = os.path.join(directory, 'resume.pdf')
+        with open(path, 'wb') as pdf_file:
+            pdf_file.write(self.pdf)
+        spooled = TemporaryUploadedFile('upload.pdf', 'application/pdf', len(self.pdf), None)
+        spooled.write(self.pdf)
+        spooled.flush()
+        self.addCleanup(spooled.close)
+
+        # (label, source, filename, memory-mapped); bytes carry no name of their own
+        cases = [
+            ('bytes', self.pdf, 'resume.PDF', False),
+            ('memoryview', memoryview(self.pdf), 'resume.pdf', False),
+            ('path', path, None, True),
+            ('PathLike', pathlib.Path(path), None, True),
+            ('upload on disk', spooled, None, True),
+            ('upload in memory', SimpleUploadedFile('upload.pdf', self.pdf), None, False),
+        ]
+        for label, source, filename, mapped in cases:
+            with self.subTest(source=label):
+                data, file_type = _load_source(source, filename)
+                try:
+                    self.assertEqual(file_type, '.pdf')
+                    self.assertEqual(isinstance(data, mmap.mmap), mapped)
+                    self.assertEqual(bytes(data), self.pdf)
+                finally:
+                    if mapped:
+                        data.close()
+
+        with self.assertRaises(TypeError):
+            _load_source(42)
+
+
+class PdfBackendTests(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        self.choice_path = os.path.join(directory, 'pdf_backend.json')
+        settings = override_settings(RESUME_PARSER_PDF_BACKEND_FILE=self.choice_path)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.addCleanup(reset_backend)
+
+    def test_normalized_text_keeps_its_lines(self):
+        text = 'Jane  Doe \r\n\ufb01nance\u00ad\tanalyst\f\n\n\nSkills\u2028Python\u200b, Go\n'
+        self.assertEqual(normalize_page_text(text), 'Jane Doe\nfinance analyst\n\nSkills\nPython, Go')
+
+    def test_backend_setting_picks_the_backend(self):
+        save_backend_choice('pypdfium2')
+        cases = [('pdfminer', 'pdfminer'), ('pypdf', 'pypdf'), ('auto', 'pypdfium2'), ('missing', 'pypdf2')]
+        for setting, expected in cases:
+            with self.subTest(setting=setting), override_settings(RESUME_PARSER_PDF_BACKEND=setting), \
+                    mock.patch('builtins.print'):
+                self.assertEqual(_resolve_backend().name, expected)
+
+    def test_auto_without_a_stored_choice_uses_the_default(self):
+        with override_settings(RESUME_PARSER_PDF_BACKEND='auto'):
+            self.assertIsNone(load_backend_choice())
+            self.assertEqual(_resolve_backend().name, 'pypdf2')
+
+    def test_unavailable_backend_falls_back_to_the_default(self):
+        with override_settings(RESUME_PARSER_PDF_BACKEND='pymupdf'), \
+                mock.patch.object(PDF_BACKENDS['pymupdf'], 'available', return_value=False), \
+                mock.patch('builtins.print'):
+            self.assertEqual(_resolve_backend().name, 'pypdf2')
+
+    def test_unreadable_choice_file_is_ignored(self):
+        for content in ('{"backend": ', '["pypdf"]'):
+            with self.subTest(content=content):
+                with open(self.choice_path, 'w') as choice_file:
+                    choice_file.write(content)
+                self.assertIsNone(load_backend_choice())
+
+    def test_resolved_backend_is_kept_until_reset(self):
+        with override_settings(RESUME_PARSER_PDF_BACKEND='pypdf'):
+            reset_backend()
+            self.assertEqual(get_pdf_backend().name, 'pypdf')
+        self.assertEqual(get_pdf_backend().name, 'pypdf')
+        self.assertEqual(get_pdf_backend('pdfminer').name, 'pdfminer')
+        # Storing a new choice resets the resolved backend
+        with override_settings(RESUME_PARSER_PDF_BACKEND='auto'):
+            save_backend_choice('pypdfium2')
+            self.assertEqual(get_pdf_backend().name, 'pypdfium2')
+
+
+@override_settings(RESUME_PARSER_JOB_STALE_SECONDS=600, RESUME_PARSER_JOB_MAX_ATTEMPTS=3)
+class ResumeParseJobQueueTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            email='candidate@example.com', username='candidate', password='secret')
+
+    def job(self, **fields):
+        fields.setdefault('filename', 'resume.pdf')
+        return ResumeParseJob.objects.create(user=self.user, upload=b'%PDF-1.4', **fields)
+
+    def test_claims_the_oldest_queued_job(self):
+        first, second = self.job(), self.job()
+        self.job(status=ResumeParseJob.STATUS_DONE)
+
+        claimed = claim_next_job()
+        self.assertEqual(claimed.id, first.id)
+        self.assertEqual(claimed.status, ResumeParseJob.STATUS_RUNNING)
+        self.assertEqual(claimed.attempts, 1)
+        self.assertIsNotNone(claimed.started_at)
+
+        self.assertEqual(claim_next_job().id, second.id)
+        self.assertIsNone(claim_next_job())
+
+    def test_a_job_claimed_by_another_consumer_is_skipped(self):
+        first, second = self.job(), self.job()
+        real_update = QuerySet.update
+        lost_race = []
+
+        def update(queryset, **fields):
+            if not lost_race:
+                # Another consumer wins the first job between the lookup and the UPDATE
+                lost_race.append(real_update(ResumeParseJob.objects.filter(id=first.id),
+                                             status=ResumeParseJob.STATUS_RUNNING))
+                return 0
+            return real_update(queryset, **fields)
+
+        with mock.patch.object(QuerySet, 'update', autospec=True, side_effect=update):
+            claimed = claim_next_job()
+
+        self.assertEqual(claimed.id, second.id)
+        first.refresh_from_db()
+        self.assertEqual(first.attempts, 0)
+
+    def test_requeues_stale_jobs_and_fails_exhausted_ones(self):
+        long_ago = timezone.now() - timedelta(seconds=3600)
+        stale = self.job(status=ResumeParseJob.STATUS_RUNNING, started_at=long_ago, attempts=1)
+        exhausted = self.job(status=ResumeParseJob.STATUS_RUNNING, started_at=long_ago, attempts=3)
+        running = self.job(status=ResumeParseJob.STATUS_RUNNING, started_at=timezone.now(), attempts=1)
+
+        self.assertEqual(requeue_stale_jobs(), 1)
+
+        stale.refresh_from_db()
+        exhausted.refresh_from_db()
+        running.refresh_from_db()
+        self.assertEqual(stale.status, ResumeParseJob.STATUS_QUEUED)
+        self.assertEqual(exhausted.status, ResumeParseJob.STATUS_FAILED)
+        self.assertFalse(exhausted.result['success'])
+        self.assertEqual(bytes(exhausted.upload), b'')
+        self.assertEqual(running.status, ResumeParseJob.STATUS_RUNNING)
+
+    @mock.patch('resume_parser.jobs.dispatch_parse', return_value={'success': True, 'name': 'Jane Doe'})
+    def test_run_job_stores_the_result_and_drops_the_upload(self, dispatch_parse):
+        job = run_job(self.job())
+
+        dispatch_parse.assert_called_once_with(b'%PDF-1.4', 'resume.pdf')
+        job.refresh_from_db()
+        self.assertEqual(job.status, ResumeParseJob.STATUS_DONE)
+        self.assertEqual(job.result['name'], 'Jane Doe')
+        self.assertEqual(bytes(job.upload), b'')
+
+    @mock.patch('resume_parser.jobs.start_background_worker')
+    def test_web_process_does_not_parse_by_default(self, start_background_worker):
+        upload = SimpleUploadedFile('resume.pdf', b'%PDF-1.4')
+        with self.captureOnCommitCallbacks(execute=True):
+            job = enqueue_parse(self.user, upload)
+        self.assertEqual(job.status, ResumeParseJob.STATUS_QUEUED)
+        start_background_worker.assert_not_called()
+
+        with override_settings(RESUME_PARSER_JOBS_INLINE_WORKER=True), \
+                self.captureOnCommitCallbacks(execute=True):
+            enqueue_parse(self.user, SimpleUploadedFile('other.pdf', b'%PDF-1.4'))
+        start_background_worker.assert_called_once()
+
+
+@mock.patch('resume_parser.services.dispatch_parse_document')
+class StoredParseTests(TestCase):
+    RESULT = {'name': 'Jane Doe', 'email': 'jane@example.com', 'phone': '555-010-0199',
+              'skills_by_category': {'Languages': ['python']}}
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            email='jane@example.com', password='secret', username='jane'
+        )
+
+    def test_resume_is_parsed_once_and_stored(self, dispatch_parse_document):
+        dispatch_parse_document.return_value = ('resume text', self.RESULT)
+
+        parsed = get_or_parse_resume(self.user, b'%PDF-1.4 resume', 'resume.pdf')
+        dispatch_parse_document.assert_called_once_with(b'%PDF-1.4 resume', 'resume.pdf')
+        self.assertEqual(parsed.name, 'Jane Doe')
+        self.assertEqual(parsed.skills, {'Languages': ['python']})
+        self.assertEqual(parsed.text, 'resume text')
+
+        # The same file is answered from the database
+        self.assertEqual(get_or_parse_resume(self.user, b'%PDF-1.4 resume', 'copy.pdf').id, parsed.id)
+        dispatch_parse_document.assert_called_once()
+        # A different file is parsed on its own
+        get_or_parse_resume(self.user, b'%PDF-1.4 other', 'other.pdf')
+        self.assertEqual(dispatch_parse_document.call_count, 2)
+
+    def test_parser_version_change_parses_again(self, dispatch_parse_document):
+        dispatch_parse_document.return_value = ('resume text', self.RESULT)
+        with mock.patch('resume_parser.services.parser_output_version', return_value='1.0'):
+            parsed = get_or_parse_resume(self.user, b'%PDF-1.4 resume', 'resume.pdf')
+
+        dispatch_parse_document.return_value = ('resume text', dict(self.RESULT, name='Jane Q. Doe'))
+        with mock.patch('resume_parser.services.parser_output_version', return_value='2.0'):
+            reparsed = get_or_parse_resume(self.user, b'%PDF-1.4 resume', 'resume.pdf')
+
+        self.assertEqual(dispatch_parse_document.call_count, 2)
+        # The stored row is updated in place
+        self.assertEqual(reparsed.id, parsed.id)
+        self.assertEqual(reparsed.parser_version, '2.0')
+        self.assertEqual(reparsed.name, 'Jane Q. Doe')
+        self.assertEqual(ParsedResume.objects.count(), 1)
+
+    def test_parse_failure_stores_nothing(self, dispatch_parse_document):
+        dispatch_parse_document.side_effect = ValueError('No text could be extracted from the file')
+        with self.assertRaises(ValueError):
+            get_or_parse_resume(self.user, b'%PDF-1.4 empty', 'empty.pdf')
+        self.assertFalse(ParsedResume.objects.exists())
+
+
+@override_settings(RESUME_PARSER_MODEL_TIER='rules-only', RESUME_PARSER_CACHE_ENABLED=False,
+                   RESUME_PARSER_WORKER_START_METHOD='fork', RESUME_PARSER_POOL_AUTHKEY='test-key')
+class ParserPoolTests(SimpleTestCase):
+    def pool(self, **options):
+        pool = ParserPool(size=1, preload=False, **options)
+        pool.start()
+        self.addCleanup(pool.shutdown)
+        return pool
+
+    def wait_for_replacement(self, pool, old_pids):
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            pids = {worker['pid'] for worker in pool.stats()['workers']}
+            if pids and not pids & old_pids:
+                return pids
+            time.sleep(0.05)
+        self.fail('Parser worker was not replaced')
+
+    def test_worker_is_recycled_after_max_jobs(self):
+        pool = self.pool(max_jobs=2)
+        first_pids = {worker['pid'] for worker in pool.stats()['workers']}
+
+        results = [pool.parse((sample_pdf(), 'resume.pdf', False, None)) for _ in range(2)]
+        self.assertTrue(all(result['success'] for result in results))
+        self.assertEqual(pool.stats()['recycled'], 1)
+        self.wait_for_replacement(pool, first_pids)
+        # The replacement takes the next job
+        self.assertTrue(pool.parse((sample_pdf(), 'resume.pdf', False, None))['success'])
+        self.assertEqual(pool.stats()['jobs_completed'], 3)
+
+    def test_worker_over_the_memory_limit_is_recycled(self):
+        pool = self.pool(max_jobs=0, max_rss_mb=1)
+        first_pids = {worker['pid'] for worker in pool.stats()['workers']}
+        self.assertTrue(pool.parse((sample_pdf(), 'resume.pdf', False, None))['success'])
+        self.assertEqual(pool.stats()['recycled'], 1)
+        self.wait_for_replacement(pool, first_pids)
+
+    def test_crashed_worker_is_replaced(self):
+        pool = self.pool()
+        first_pids = {worker['pid'] for worker in pool.stats()['workers']}
+        for pid in first_pids:
+            os.kill(pid, 9)
+
+        result = pool.parse((sample_pdf(), 'resume.pdf', False, None))
+        self.assertFalse(result['success'])
+        self.assertEqual(pool.stats()['failures'], 1)
+        self.wait_for_replacement(pool, first_pids)
+        self.assertTrue(pool.parse((sample_pdf(), 'resume.pdf', False, None))['success'])
+
+    @override_settings(RESUME_PARSER_POOL_AUTHKEY=None)
+    def test_pool_does_not_start_without_an_authkey(self):
+        with self.assertRaises(PoolNotConfigured):
+            ParserPool(size=1, preload=False).start()
+        with tempfile.TemporaryDirectory() as directory, self.assertRaises(CommandError):
+            call_command('run_parser_pool', address=os.path.join(directory, 'pool.sock'), workers=1)
+
+    def test_unreachable_pool_falls_back_to_parsing_inline(self):
+        with tempfile.TemporaryDirectory() as directory, \
+                override_settings(RESUME_PARSER_POOL_ADDRESS=os.path.join(directory, 'missing.sock')):
+            result = dispatch_parse(sample_pdf(), 'resume.pdf')
+            self.assertTrue(result['success'])
+            self.assertEqual(result['email'], 'jane.doe@example.com')
+            # A web process without the key never talks to the socket either
+            with override_settings(RESUME_PARSER_POOL_AUTHKEY=None), \
+                    mock.patch('resume_parser.worker_pool.Client') as client:
+                self.assertTrue(dispatch_parse(sample_pdf(), 'resume.pdf')['success'])
+            client.assert_not_called()
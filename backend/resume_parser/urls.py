@@ -3,4 +3,7 @@ from . import views
 
 urlpatterns = [
     path('parse/', views.parse_resume, name='parse_resume'),
+    path('parse-batch/', views.parse_resume_batch_view, name='parse_resume_batch'),
+    path('jobs/<uuid:job_id>/', views.resume_job_status, name='resume_job_status'),
+    path('metrics/', views.resume_parser_metrics, name='resume_parser_metrics'),
 ]
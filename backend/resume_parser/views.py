@@ -1,14 +1,21 @@
+import json
 import os
-import tempfile
+import zipfile
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
-from django.core.files.storage import default_storage
-from django.core.files.base import ContentFile
-from django.conf import settings
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
+from django.http import StreamingHttpResponse
+from django.urls import reverse
 
-from .resume_parser import parse_resume_file
+from .admission import ParserOverloaded, admission
+from .cache import parse_cache
+from .conf import get_setting
+from .jobs import enqueue_parse
+from .model_registry import registry as model_registry
+from .models import ResumeParseJob
+from .resume_parser import SUPPORTED_FILE_TYPES, _error_result
+from .worker_pool import dispatch_parse, dispatch_parse_batch, pool_stats
 
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
@@ -18,10 +25,21 @@ def parse_resume(request):
     
     Expected POST data:
     - resume: The resume file (PDF or DOCX)
+
+    Query parameters:
+    - async: When "1", queue the parse and return a job id immediately;
+      poll /api/resume/jobs/<id>/ for the result
+    - timings: When "1" and the user is staff, include per-stage timings
+    - budget_ms: Time budget for the parse in milliseconds (default
+      RESUME_PARSER_REQUEST_BUDGET_MS, 0 for none). Optional stages that do
+      not fit are skipped and listed in the result's "degraded" field
     
     Returns:
     - 200: Successfully parsed resume with extracted data
+    - 202: Parse job queued (async=1)
     - 400: Invalid or missing file
+    - 413: File larger than RESUME_PARSER_MAX_FILE_BYTES
+    - 429: Too many parses in progress or queued; retry after the Retry-After header
     - 500: Error processing the file
     """
     if 'resume' not in request.FILES:
@@ -40,30 +58,241 @@ def parse_resume(request):
             status=status.HTTP_400_BAD_REQUEST
         )
     
-    # Save the file temporarily
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=file_ext)
+    max_bytes = get_setting('RESUME_PARSER_MAX_FILE_BYTES')
+    if resume_file.size > max_bytes:
+        return Response(
+            {'error': f'Resume file size should be less than {max_bytes // (1024 * 1024)}MB.'},
+            status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+        )
+    
     try:
-        # Save the uploaded file to the temporary file
-        for chunk in resume_file.chunks():
-            temp_file.write(chunk)
-        temp_file.close()
-        
-        # Parse the resume
-        result = parse_resume_file(temp_file.name)
+        budget_ms = int(request.query_params.get('budget_ms', get_setting('RESUME_PARSER_REQUEST_BUDGET_MS')))
+        if budget_ms < 0:
+            raise ValueError
+    except (TypeError, ValueError):
+        return Response(
+            {'error': 'budget_ms must be a non-negative integer.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    try:
+        if request.query_params.get('async') in ('1', 'true'):
+            job = enqueue_parse(request.user, resume_file)
+            return Response(
+                {
+                    'job_id': str(job.id),
+                    'status': job.status,
+                    'status_url': request.build_absolute_uri(reverse('resume_job_status', args=[job.id])),
+                },
+                status=status.HTTP_202_ACCEPTED
+            )
+
+        # Parse the upload straight from memory in the dedicated worker pool
+        collect_timings = request.user.is_staff and request.query_params.get('timings') in ('1', 'true')
+        with admission.admit():
+            result = dispatch_parse(resume_file, collect_timings=collect_timings, budget_ms=budget_ms)
         
         # Add the original filename to the result
         result['filename'] = resume_file.name
         
         return Response(result)
         
+    except ParserOverloaded as e:
+        return Response(
+            {'error': f'{str(e)}. Please try again later.', 'retry_after': e.retry_after},
+            status=status.HTTP_429_TOO_MANY_REQUESTS,
+            headers={'Retry-After': str(e.retry_after)}
+        )
     except Exception as e:
         return Response(
             {'error': f'Error processing resume: {str(e)}'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
-    finally:
-        # Clean up the temporary file
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def resume_job_status(request, job_id):
+    """
+    API endpoint to check on an asynchronous resume parse job.
+
+    Returns:
+    - 200: The job status, plus the parse result once the job has finished
+    - 404: No such job for this user
+    """
+    jobs = ResumeParseJob.objects.defer('upload')
+    if not request.user.is_staff:
+        jobs = jobs.filter(user=request.user)
+    try:
+        job = jobs.get(id=job_id)
+    except ResumeParseJob.DoesNotExist:
+        return Response(
+            {'detail': 'Resume parse job not found.'},
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    data = {
+        'job_id': str(job.id),
+        'status': job.status,
+        'filename': job.filename,
+        'created_at': job.created_at,
+        'finished_at': job.finished_at,
+    }
+    if job.status in (ResumeParseJob.STATUS_DONE, ResumeParseJob.STATUS_FAILED):
+        data['result'] = job.result
+    return Response(data)
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def resume_parser_metrics(request):
+    """
+    API endpoint with live resume parser metrics (staff only).
+
+    Returns the machine-wide in-flight and queued parse counts, plus this web
+    process's parse cache and loaded models and, when one is configured, the
+    dedicated worker pool.
+    """
+    return Response({
+        'admission': admission.stats(),
+        'cache': parse_cache.stats(),
+        'models': model_registry.stats(),
+        'pool': pool_stats(),
+    })
+
+
+def _iter_batch_uploads(uploads, errors):
+    """
+    Yield (filename, bytes) for every resume in the uploaded files, expanding ZIP archives.
+
+    Entries that cannot be parsed are appended to ``errors`` instead.
+    """
+    max_files = get_setting('RESUME_PARSER_BATCH_MAX_FILES')
+    max_bytes = get_setting('RESUME_PARSER_MAX_FILE_BYTES')
+    count = 0
+
+    def accept(filename, size):
+        nonlocal count
+        if count >= max_files:
+            errors.append({'filename': filename, 'success': False,
+                           'message': f'Batch limit of {max_files} files reached.'})
+            return False
+        if size > max_bytes:
+            errors.append({'filename': filename, 'success': False,
+                           'message': f'Resume file size should be less than {max_bytes // (1024 * 1024)}MB.'})
+            return False
+        count += 1
+        return True
+
+    for upload in uploads:
+        file_ext = os.path.splitext(upload.name)[1].lower()
+        if file_ext == '.zip':
+            try:
+                with zipfile.ZipFile(upload) as archive:
+                    for member in archive.infolist():
+                        member_ext = os.path.splitext(member.filename)[1].lower()
+                        if member.is_dir() or member_ext not in SUPPORTED_FILE_TYPES:
+                            continue
+                        # file_size is the uncompressed size, which guards against zip bombs
+                        if not accept(member.filename, member.file_size):
+                            continue
+                        try:
+                            data = archive.read(member)
+                        except Exception as e:
+                            errors.append({'filename': member.filename, 'success': False,
+                                           'message': f'Could not read file from ZIP archive: {str(e)}'})
+                            continue
+                        yield member.filename, data
+            except zipfile.BadZipFile:
+                errors.append({'filename': upload.name, 'success': False,
+                               'message': 'Invalid ZIP archive.'})
+        elif file_ext in SUPPORTED_FILE_TYPES:
+            if accept(upload.name, upload.size):
+                yield upload.name, upload.read()
+        else:
+            errors.append({'filename': upload.name, 'success': False,
+                           'message': 'Invalid file type. Please upload PDF, DOCX or ZIP files.'})
+
+
+class _AdmittedStream:
+    """
+    A streaming response body that holds an admission slot until the response is closed.
+
+    Django closes the body even when the client disconnects before the first
+    line, which a generator's ``finally`` would not see.
+    """
+
+    def __init__(self, lines, slot):
+        self._lines = lines
+        self._slot = slot
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._lines)
+
+    def close(self):
+        if self._slot is not None:
+            admission.release(self._slot)
+            self._slot = None
+        self._lines.close()
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def parse_resume_batch_view(request):
+    """
+    API endpoint to parse many resumes in one request.
+
+    Expected POST data:
+    - resumes: One or more resume files (PDF or DOCX) and/or ZIP archives of them
+
+    Returns:
+    - 200: An NDJSON stream with one parse result per resume, written as soon
+      as each resume finishes. Every line includes the 'filename' it belongs to;
+      a resume that fails has 'success' false and does not end the stream.
+    - 400: No files provided
+    - 403: User is not an employer
+    - 429: Too many parses in progress; retry after the Retry-After header
+
+    The whole batch takes one admission slot and runs in the dedicated worker
+    pool when one is configured, a chunk of RESUME_PARSER_BATCH_SIZE files at a time.
+    """
+    user = request.user
+    if not user.is_staff and getattr(user, 'user_type', None) not in ['employer', 'company']:
+        return Response(
+            {'detail': 'Only employers can parse resumes in bulk.'},
+            status=status.HTTP_403_FORBIDDEN
+        )
+
+    uploads = request.FILES.getlist('resumes')
+    if not uploads:
+        return Response(
+            {'error': 'No resume files provided'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    try:
+        slot = admission.acquire()
+    except ParserOverloaded as e:
+        return Response(
+            {'error': f'{str(e)}. Please try again later.', 'retry_after': e.retry_after},
+            status=status.HTTP_429_TOO_MANY_REQUESTS,
+            headers={'Retry-After': str(e.retry_after)}
+        )
+
+    def stream():
+        errors = []
         try:
-            os.unlink(temp_file.name)
-        except:
-            pass
+            for result in dispatch_parse_batch(_iter_batch_uploads(uploads, errors)):
+                while errors:
+                    yield json.dumps(errors.pop(0)) + '\n'
+                yield json.dumps(result) + '\n'
+        except Exception as e:
+            # Report the failure in-band; the status line has already been sent
+            print(f"Error in batch resume parsing: {str(e)}")
+            errors.append(_error_result(e))
+        while errors:
+            yield json.dumps(errors.pop(0)) + '\n'
+
+    return StreamingHttpResponse(_AdmittedStream(stream(), slot), content_type='application/x-ndjson')
@@ -0,0 +1,133 @@
+"""
+Model warm-up for pre-forking servers.
+
+Without it every forked web worker loads its own copy of the spaCy model on
+its first parse: N workers hold N copies, and the first requests after a
+deploy wait for the load. ``warm_up()`` loads and exercises every parser
+model once, then moves everything loaded so far into the permanent GC
+generation (``gc.freeze()``). Run in the master before forking (gunicorn's
+``preload_app``), the workers then share those pages copy-on-write, and the
+collector no longer writes to them.
+
+``memory_report()`` reads /proc/<pid>/smaps_rollup to show how much of a
+worker's memory is its own and how much is still shared.
+"""
+import gc
+import io
+import os
+import time
+from typing import Dict, Iterable, List, Optional
+
+from .conf import get_setting
+from .model_registry import current_rss, registry as model_registry
+from .samples import sample_docx, sample_pdf
+
+_warmed_up = False
+
+# smaps_rollup fields, reported in bytes under these names
+_SMAPS_FIELDS = {
+    'Rss': 'rss',
+    'Pss': 'pss',
+    'Shared_Clean': 'shared_clean',
+    'Shared_Dirty': 'shared_dirty',
+    'Private_Clean': 'private_clean',
+    'Private_Dirty': 'private_dirty',
+}
+
+
+def _exercise_parser() -> None:
+    """Parse a small PDF and DOCX so lazily built state (readers, vocab, caches) exists before forking."""
+    from .resume_parser import parse_resume_document
+
+    # parse_resume_document bypasses the result cache, so nothing is stored for the sample
+    parse_resume_document(io.BytesIO(sample_pdf()), 'warmup.pdf')
+    parse_resume_document(io.BytesIO(sample_docx()), 'warmup.docx')
+
+
+def warm_up(sample_parse: bool = True, freeze: bool = True) -> Dict:
+    """
+    Load every model the parser uses, optionally run a sample parse, and
+    freeze the heap. Returns what was loaded and what it cost.
+
+    Preloaded models are pinned: eviction is turned off, since unloading a
+    shared model in one worker would only make it load a private copy again.
+    """
+    global _warmed_up
+    from .resume_parser import get_nlp, get_skill_matcher
+
+    start = time.perf_counter()
+    rss_before = current_rss()
+    model_registry.ttl = 0
+
+    get_skill_matcher()
+    get_nlp()
+    if get_setting('RESUME_PARSER_SEMANTIC_MATCHING'):
+        model_registry.get('skill_embeddings')
+    if sample_parse:
+        _exercise_parser()
+
+    gc.collect()
+    if freeze and hasattr(gc, 'freeze'):
+        gc.freeze()
+    _warmed_up = True
+
+    report = {
+        'seconds': round(time.perf_counter() - start, 3),
+        'rss_growth_bytes': max(current_rss() - rss_before, 0),
+        'frozen_objects': gc.get_freeze_count() if hasattr(gc, 'get_freeze_count') else 0,
+        'models': {name: stats for name, stats in model_registry.stats().items() if stats['loaded']},
+    }
+    print(f"Resume parser warmed up in {report['seconds']:.2f}s "
+          f"(+{report['rss_growth_bytes'] / (1024 * 1024):.1f} MB, {report['frozen_objects']} objects frozen)")
+    return report
+
+
+def is_warmed_up() -> bool:
+    return _warmed_up
+
+
+def preload_if_enabled() -> Optional[Dict]:
+    """Warm up when RESUME_PARSER_PRELOAD is set; called from the WSGI module."""
+    if not get_setting('RESUME_PARSER_PRELOAD') or _warmed_up:
+        return None
+    try:
+        return warm_up()
+    except Exception as e:
+        # A failed warm-up only costs the lazy load on first use
+        print(f"Error warming up the resume parser: {str(e)}")
+        return None
+
+
+def memory_report(pid: Optional[int] = None) -> Dict[str, int]:
+    """
+    Return a process's memory split into unique (private) and shared bytes.
+
+    Returns an empty dict where /proc/<pid>/smaps_rollup is unavailable
+    (non-Linux systems, kernels before 4.14).
+    """
+    path = f"/proc/{pid or 'self'}/smaps_rollup"
+    values = {}
+    try:
+        with open(path) as smaps:
+            for line in smaps:
+                field, _, rest = line.partition(':')
+                if field in _SMAPS_FIELDS:
+                    values[_SMAPS_FIELDS[field]] = int(rest.split()[0]) * 1024
+    except (OSError, ValueError, IndexError):
+        return {}
+    values['unique'] = values.get('private_clean', 0) + values.get('private_dirty', 0)
+    values['shared'] = values.get('shared_clean', 0) + values.get('shared_dirty', 0)
+    values['pid'] = pid or os.getpid()
+    return values
+
+
+def memory_reports(pids: Iterable[int]) -> List[Dict[str, int]]:
+    """memory_report() for several processes, skipping those that are gone."""
+    return [report for report in (memory_report(pid) for pid in pids) if report]
+
+
+def format_memory_report(report: Dict[str, int]) -> str:
+    mb = 1024 * 1024
+    return (f"pid {report['pid']}: rss {report.get('rss', 0) / mb:.1f} MB, "
+            f"unique {report['unique'] / mb:.1f} MB, shared {report['shared'] / mb:.1f} MB, "
+            f"pss {report.get('pss', 0) / mb:.1f} MB")
@@ -0,0 +1,366 @@
+"""
+Dedicated pool of resume parser worker processes.
+
+Parsing is CPU-bound and needs the spaCy model in memory, so running it in
+the WSGI request threads lets a handful of uploads stall every other API
+request. Instead, ``manage.py run_parser_pool`` starts a fixed number of
+worker processes that preload the models once and take parse jobs from a
+local socket. Web workers hand jobs over with ``dispatch_parse``, and batch
+uploads with ``dispatch_parse_batch``, one chunk of files per job. Parses
+that are stored with their text (``services.get_or_parse_resume``) go
+through ``dispatch_parse_document``.
+
+The socket only accepts clients that know RESUME_PARSER_POOL_AUTHKEY, since
+every message on it is unpickled; neither side uses the socket without one.
+
+Workers are recycled after RESUME_PARSER_WORKER_MAX_JOBS jobs or once their
+resident memory passes RESUME_PARSER_WORKER_MAX_RSS_MB, so a leak or a
+pathological document cannot grow a worker forever.
+"""
+import itertools
+import multiprocessing
+import queue
+import threading
+from multiprocessing.connection import Client, Listener
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .conf import get_setting
+from .resume_parser import (
+    _error_result, get_nlp, get_skill_matcher, parse_resume_batch, parse_resume_document, parse_resume_file
+)
+
+# Loading the spaCy model can take far longer than a single parse
+WORKER_STARTUP_TIMEOUT = 300
+
+
+class PoolNotConfigured(RuntimeError):
+    """Raised when the pool socket would be used without RESUME_PARSER_POOL_AUTHKEY."""
+
+
+def _pool_authkey() -> bytes:
+    authkey = get_setting('RESUME_PARSER_POOL_AUTHKEY')
+    if not authkey:
+        raise PoolNotConfigured('RESUME_PARSER_POOL_AUTHKEY is not set')
+    return authkey.encode() if isinstance(authkey, str) else authkey
+
+
+def _worker_main(conn, preload: bool) -> None:
+    """Entry point of a worker process: preload models, then serve jobs until told to stop."""
+    from .model_registry import current_rss, registry
+
+    # Workers exist to keep the models resident, so never evict them for idleness
+    registry.ttl = 0
+    if preload:
+        get_nlp()
+        get_skill_matcher()
+
+    jobs = 0
+    conn.send(('ready', current_rss(), jobs))
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, OSError):
+            break
+        if job is None:
+            break
+        kind, payload = job
+        if kind == 'batch':
+            result = list(parse_resume_batch(payload))
+            jobs += len(payload)
+        elif kind == 'document':
+            try:
+                result = parse_resume_document(*payload)
+            except Exception as e:
+                # Sent back as a plain error, since the original may not pickle
+                result = ValueError(str(e))
+            jobs += 1
+        else:
+            result = parse_resume_file(*payload)
+            jobs += 1
+        conn.send((result, current_rss(), jobs))
+    conn.close()
+
+
+class _Worker:
+    """Parent-side handle for one worker process."""
+
+    def __init__(self, context, preload: bool):
+        parent_conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main, args=(child_conn, preload),
+            name='resume-parser-worker', daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.conn = parent_conn
+        self.jobs = 0
+        self.rss = 0
+        self.ready = False
+
+    def wait_ready(self, timeout: float) -> None:
+        if self.ready:
+            return
+        if not self.conn.poll(timeout):
+            raise TimeoutError('Parser worker did not start in time')
+        _, self.rss, self.jobs = self.conn.recv()
+        self.ready = True
+
+    def run(self, job, timeout: float) -> Dict:
+        self.conn.send(job)
+        if not self.conn.poll(timeout):
+            raise TimeoutError(f'Resume parse did not finish within {timeout:.0f}s')
+        result, self.rss, self.jobs = self.conn.recv()
+        return result
+
+    def stop(self, timeout: float = 5) -> None:
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class ParserPool:
+    """Fixed-size pool of parser processes with job-count and memory recycling."""
+
+    def __init__(self, size: Optional[int] = None, max_jobs: Optional[int] = None,
+                 max_rss_mb: Optional[int] = None, timeout: Optional[float] = None,
+                 preload: bool = True):
+        self.size = size or get_setting('RESUME_PARSER_WORKERS') or multiprocessing.cpu_count()
+        self.max_jobs = max_jobs if max_jobs is not None else get_setting('RESUME_PARSER_WORKER_MAX_JOBS')
+        self.max_rss_bytes = (max_rss_mb if max_rss_mb is not None
+                              else get_setting('RESUME_PARSER_WORKER_MAX_RSS_MB')) * 1024 * 1024
+        self.timeout = timeout or get_setting('RESUME_PARSER_WORKER_TIMEOUT')
+        self.preload = preload
+        self._context = multiprocessing.get_context(get_setting('RESUME_PARSER_WORKER_START_METHOD'))
+        self._idle: 'queue.Queue[_Worker]' = queue.Queue()
+        self._workers = set()
+        self._lock = threading.Lock()
+        self._closed = False
+        self.jobs_completed = 0
+        self.recycled = 0
+        self.failures = 0
+
+    def start(self) -> None:
+        """Start the workers; raises PoolNotConfigured when no authkey is set to serve them with."""
+        _pool_authkey()
+        for _ in range(self.size):
+            self._add_worker()
+
+    def parse(self, job) -> Dict:
+        """Run one parse job on the next idle worker, blocking until one is free."""
+        return self._run(('parse', job), self.timeout, _error_result)
+
+    def parse_batch(self, files: List[Tuple[str, bytes]]) -> List[Dict]:
+        """Parse a chunk of (filename, bytes) pairs on one worker, batching the spaCy work."""
+        def failed(error):
+            return [dict(_error_result(error), filename=filename) for filename, _ in files]
+        return self._run(('batch', files), self.timeout * max(1, len(files)), failed)
+
+    def parse_document(self, job: Tuple[bytes, str]):
+        """Run parse_resume_document on a worker; returns (text, result) or the exception it raised."""
+        return self._run(('document', job), self.timeout, lambda error: error)
+
+    def _run(self, job, timeout: float, on_error: Callable):
+        worker = self._idle.get()
+        try:
+            worker.wait_ready(WORKER_STARTUP_TIMEOUT)
+            result = worker.run(job, timeout)
+        except Exception as e:
+            # A crashed or hung worker is replaced rather than reused
+            if isinstance(e, EOFError):
+                e = RuntimeError('Parser worker exited unexpectedly')
+            print(f"Parser worker failed: {str(e)}")
+            with self._lock:
+                self.failures += 1
+            self._replace(worker)
+            return on_error(e)
+
+        with self._lock:
+            self.jobs_completed += 1
+        if (self.max_jobs and worker.jobs >= self.max_jobs) or \
+                (self.max_rss_bytes and worker.rss > self.max_rss_bytes):
+            with self._lock:
+                self.recycled += 1
+            self._replace(worker)
+        else:
+            self._idle.put(worker)
+        return result
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'size': self.size,
+                'idle': self._idle.qsize(),
+                'jobs_completed': self.jobs_completed,
+                'recycled': self.recycled,
+                'failures': self.failures,
+                'workers': [
+                    {'pid': worker.process.pid, 'jobs': worker.jobs, 'rss_bytes': worker.rss}
+                    for worker in self._workers
+                ],
+            }
+
+    def shutdown(self) -> None:
+        self._closed = True
+        with self._lock:
+            workers = list(self._workers)
+            self._workers.clear()
+        for worker in workers:
+            worker.stop()
+
+    def _add_worker(self) -> None:
+        worker = _Worker(self._context, self.preload)
+        with self._lock:
+            self._workers.add(worker)
+        self._idle.put(worker)
+
+    def _replace(self, worker: _Worker) -> None:
+        """Retire a worker and start its replacement without blocking the caller."""
+        with self._lock:
+            self._workers.discard(worker)
+
+        def recycle():
+            worker.stop()
+            if not self._closed:
+                self._add_worker()
+
+        threading.Thread(target=recycle, name='resume-parser-recycle', daemon=True).start()
+
+
+def serve_pool(pool: ParserPool, address: str) -> None:
+    """Accept jobs from web workers on ``address`` and run them on ``pool``."""
+    with Listener(address, authkey=_pool_authkey()) as listener:
+        while True:
+            try:
+                conn = listener.accept()
+            except Exception as e:
+                print(f"Rejected parser pool connection: {str(e)}")
+                continue
+            threading.Thread(target=_serve_connection, args=(pool, conn), daemon=True).start()
+
+
+def _serve_connection(pool: ParserPool, conn) -> None:
+    with conn:
+        try:
+            command, payload = conn.recv()
+            if command == 'parse':
+                conn.send(pool.parse(payload))
+            elif command == 'parse_batch':
+                conn.send(pool.parse_batch(payload))
+            elif command == 'parse_document':
+                conn.send(pool.parse_document(payload))
+            elif command == 'stats':
+                conn.send(pool.stats())
+        except (EOFError, OSError):
+            pass
+
+
+def _request(command: str, payload=None, timeout: Optional[float] = None):
+    address = get_setting('RESUME_PARSER_POOL_ADDRESS')
+    with Client(address, authkey=_pool_authkey()) as conn:
+        conn.send((command, payload))
+        timeout = timeout or get_setting('RESUME_PARSER_WORKER_TIMEOUT') * 2
+        if not conn.poll(timeout):
+            raise TimeoutError('Parser pool did not respond in time')
+        return conn.recv()
+
+
+def _pool_job(source, filename: Optional[str], collect_timings: bool = False,
+              budget_ms: Optional[float] = None) -> Tuple:
+    """Turn a resume source into a (source, filename, collect_timings, budget_ms) job that can cross the socket."""
+    if hasattr(source, 'temporary_file_path'):
+        # Spooled uploads are already on disk, so only the path is sent
+        return source.temporary_file_path(), filename or source.name, collect_timings, budget_ms
+    if hasattr(source, 'read'):
+        if hasattr(source, 'seek'):
+            source.seek(0)
+        return source.read(), filename or getattr(source, 'name', None), collect_timings, budget_ms
+    if isinstance(source, memoryview):
+        return source.tobytes(), filename, collect_timings, budget_ms
+    return source, filename, collect_timings, budget_ms
+
+
+def dispatch_parse(source, filename: Optional[str] = None, collect_timings: bool = False,
+                   budget_ms: Optional[float] = None) -> Dict:
+    """
+    Parse a resume in the dedicated worker pool.
+
+    Accepts the same arguments as parse_resume_file. Falls back to parsing in
+    the calling thread when no pool address is configured or the pool
+    cannot be reached. The budget starts when a worker picks the job up, so
+    it does not cover time spent waiting for a free worker.
+    """
+    if get_setting('RESUME_PARSER_POOL_ADDRESS'):
+        try:
+            return _request('parse', _pool_job(source, filename, collect_timings, budget_ms))
+        except TimeoutError as e:
+            # The pool is up but overloaded; parsing inline would only add to the load
+            return _error_result(e)
+        except (OSError, EOFError, multiprocessing.AuthenticationError, PoolNotConfigured) as e:
+            print(f"Parser pool unavailable, parsing inline: {str(e)}")
+    return parse_resume_file(source, filename, collect_timings, budget_ms)
+
+
+def dispatch_parse_document(data, filename: str) -> Tuple[str, Dict]:
+    """
+    Return the extracted text and parse result for a resume, like parse_resume_document.
+
+    Runs in the dedicated worker pool when one is configured, falling back
+    to the calling thread when the pool cannot be reached. Raises on failure.
+    """
+    if get_setting('RESUME_PARSER_POOL_ADDRESS'):
+        try:
+            outcome = _request('parse_document', (bytes(data), filename))
+        except TimeoutError:
+            raise
+        except (OSError, EOFError, multiprocessing.AuthenticationError, PoolNotConfigured) as e:
+            print(f"Parser pool unavailable, parsing inline: {str(e)}")
+        else:
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+    return parse_resume_document(data, filename)
+
+
+def dispatch_parse_batch(files: Iterable[Tuple[str, bytes]], batch_size: Optional[int] = None) -> Iterator[Dict]:
+    """
+    Parse many resumes in the dedicated worker pool, one chunk of ``batch_size`` files per job.
+
+    Yields the same results as parse_resume_batch, a chunk at a time. Falls
+    back to parsing in the calling thread when no pool address is configured
+    or the pool cannot be reached.
+    """
+    if not get_setting('RESUME_PARSER_POOL_ADDRESS'):
+        yield from parse_resume_batch(files, batch_size)
+        return
+
+    batch_size = batch_size or get_setting('RESUME_PARSER_BATCH_SIZE')
+    files = iter(files)
+    while True:
+        chunk = list(itertools.islice(files, batch_size))
+        if not chunk:
+            return
+        try:
+            yield from _request('parse_batch', chunk,
+                                timeout=get_setting('RESUME_PARSER_WORKER_TIMEOUT') * 2 * len(chunk))
+        except TimeoutError as e:
+            for filename, _ in chunk:
+                yield dict(_error_result(e), filename=filename)
+        except (OSError, EOFError, multiprocessing.AuthenticationError, PoolNotConfigured) as e:
+            print(f"Parser pool unavailable, parsing inline: {str(e)}")
+            yield from parse_resume_batch(chunk, batch_size)
+
+
+def pool_stats() -> Optional[Dict]:
+    """Return the stats of the running pool, or None if no pool is reachable."""
+    if not get_setting('RESUME_PARSER_POOL_ADDRESS'):
+        return None
+    try:
+        return _request('stats', timeout=5)
+    except (OSError, EOFError, TimeoutError, multiprocessing.AuthenticationError, PoolNotConfigured):
+        return None